@@ -0,0 +1,175 @@
+import json
+import os
+from functools import lru_cache
+from typing import List, Optional
+
+import facefusion.choices
+from facefusion import state_manager
+from facefusion.filesystem import create_directory, get_file_extension, get_file_size, has_audio, is_directory, is_file, link_file, remove_directory, resolve_file_paths
+from facefusion.hash_helper import create_file_digest, create_file_sample_digest, create_hash
+from facefusion.jobs import job_store
+from facefusion.json import read_json, write_json
+from facefusion.temp_helper import get_temp_directory_path, resolve_temp_frame_paths
+from facefusion.types import CacheScope, Fps, Resolution
+
+
+def get_cache_path() -> str:
+	if state_manager.get_item('cache_path'):
+		return state_manager.get_item('cache_path')
+	return os.path.join(state_manager.get_item('temp_path'), 'facefusion-cache')
+
+
+def get_cache_directory_path(cache_scope : CacheScope) -> str:
+	return os.path.join(get_cache_path(), cache_scope)
+
+
+def get_cache_entry_path(cache_scope : CacheScope, cache_key : str) -> str:
+	return os.path.join(get_cache_directory_path(cache_scope), cache_key)
+
+
+def get_cache_manifest_path(cache_entry_path : str) -> str:
+	return os.path.join(cache_entry_path, 'manifest.json')
+
+
+@lru_cache(maxsize = 16)
+def create_static_file_hash(file_path : str, file_size : int, file_time : float) -> Optional[str]:
+	return create_file_sample_digest(file_path, 4 * 1024 * 1024)
+
+
+def create_extract_cache_key(target_path : str, temp_video_resolution : Resolution, temp_video_fps : Fps, trim_frame_start : int, trim_frame_end : int) -> Optional[str]:
+	if is_file(target_path):
+		cache_key_set =\
+		{
+			'target_hash': create_static_file_hash(target_path, get_file_size(target_path), os.path.getmtime(target_path)),
+			'target_size': get_file_size(target_path),
+			'target_time': os.path.getmtime(target_path),
+			'temp_video_resolution': temp_video_resolution,
+			'temp_video_fps': temp_video_fps,
+			'trim_frame_start': trim_frame_start,
+			'trim_frame_end': trim_frame_end,
+			'temp_frame_format': state_manager.get_item('temp_frame_format')
+		}
+		cache_key_content = json.dumps(cache_key_set, sort_keys = True, default = str)
+		return create_hash(cache_key_content.encode())
+	return None
+
+
+def create_output_cache_key(target_path : str) -> str:
+	cache_key_set =\
+	{
+		'processors': state_manager.get_item('processors'),
+		'target_hash': create_static_file_hash(target_path, get_file_size(target_path), os.path.getmtime(target_path)) if is_file(target_path) else None,
+		'source_hashes': [ create_static_file_hash(source_path, get_file_size(source_path), os.path.getmtime(source_path)) for source_path in state_manager.get_item('source_paths') if is_file(source_path) ]
+	}
+
+	for step_key in job_store.get_step_keys():
+		if step_key not in [ 'processors', 'source_paths', 'target_path', 'output_path', 'trim_frame_start', 'trim_frame_end', 'temp_frame_mode', 'video_segment_count', 'keep_temp' ] and not step_key.startswith('output_'):
+			cache_key_set[step_key] = state_manager.get_item(step_key) #type:ignore[arg-type]
+	cache_key_content = json.dumps(cache_key_set, sort_keys = True, default = str)
+	return create_hash(cache_key_content.encode())
+
+
+def init_output_cache(cache_key : str) -> bool:
+	cache_entry_path = get_cache_entry_path('outputs', cache_key)
+	cache_manifest_path = get_cache_manifest_path(cache_entry_path)
+
+	if is_file(cache_manifest_path):
+		touch_cache_entry(cache_entry_path)
+		return True
+	return create_directory(cache_entry_path) and write_json(cache_manifest_path, { 'processors': state_manager.get_item('processors') }) #type:ignore[arg-type]
+
+
+def get_output_cache_frame_path(cache_key : str, temp_frame_path : str, frame_number : int) -> Optional[str]:
+	frame_hash = create_file_digest(temp_frame_path)
+
+	if frame_hash:
+		if has_audio(state_manager.get_item('source_paths')):
+			frame_hash += '-' + str(frame_number)
+		return os.path.join(get_cache_entry_path('outputs', cache_key), frame_hash + get_file_extension(temp_frame_path))
+	return None
+
+
+def restore_extract_cache(target_path : str, cache_key : str) -> bool:
+	cache_entry_path = get_cache_entry_path('frames', cache_key)
+	cache_manifest = read_json(get_cache_manifest_path(cache_entry_path))
+
+	if cache_manifest:
+		cache_frame_paths = resolve_cache_frame_paths(cache_entry_path)
+
+		if cache_frame_paths and len(cache_frame_paths) == cache_manifest.get('frame_total'):
+			temp_directory_path = get_temp_directory_path(target_path)
+
+			for cache_frame_path in cache_frame_paths:
+				if not link_file(cache_frame_path, os.path.join(temp_directory_path, os.path.basename(cache_frame_path))):
+					return False
+
+			touch_cache_entry(cache_entry_path)
+			return True
+	return False
+
+
+def store_extract_cache(target_path : str, cache_key : str) -> bool:
+	cache_entry_path = get_cache_entry_path('frames', cache_key)
+	temp_cache_entry_path = cache_entry_path + '.tmp'
+	temp_frame_paths = resolve_temp_frame_paths(target_path)
+
+	if temp_frame_paths and not is_directory(cache_entry_path):
+		remove_directory(temp_cache_entry_path)
+		create_directory(temp_cache_entry_path)
+
+		for temp_frame_path in temp_frame_paths:
+			if not link_file(temp_frame_path, os.path.join(temp_cache_entry_path, os.path.basename(temp_frame_path))):
+				remove_directory(temp_cache_entry_path)
+				return False
+
+		if write_json(get_cache_manifest_path(temp_cache_entry_path), { 'frame_total': len(temp_frame_paths) }): #type:ignore[arg-type]
+			os.replace(temp_cache_entry_path, cache_entry_path)
+			return is_directory(cache_entry_path)
+	return False
+
+
+def resolve_cache_frame_paths(cache_entry_path : str) -> List[str]:
+	return [ cache_file_path for cache_file_path in resolve_file_paths(cache_entry_path) if cache_file_path != get_cache_manifest_path(cache_entry_path) ]
+
+
+def touch_cache_entry(cache_entry_path : str) -> None:
+	cache_manifest_path = get_cache_manifest_path(cache_entry_path)
+
+	if is_file(cache_manifest_path):
+		os.utime(cache_manifest_path)
+
+
+def resolve_cache_entry_paths() -> List[str]:
+	cache_entry_paths = []
+
+	for cache_scope in facefusion.choices.cache_scopes:
+		cache_directory_path = get_cache_directory_path(cache_scope)
+
+		if is_directory(cache_directory_path):
+			for cache_entry_name in os.listdir(cache_directory_path):
+				cache_entry_path = os.path.join(cache_directory_path, cache_entry_name)
+
+				if is_file(get_cache_manifest_path(cache_entry_path)):
+					cache_entry_paths.append(cache_entry_path)
+
+	return sorted(cache_entry_paths, key = lambda cache_entry_path: os.path.getmtime(get_cache_manifest_path(cache_entry_path)))
+
+
+def calculate_cache_entry_size(cache_entry_path : str) -> int:
+	return sum(get_file_size(cache_file_path) for cache_file_path in resolve_file_paths(cache_entry_path))
+
+
+def evict_cache(cache_limit : int) -> int:
+	cache_entry_paths = resolve_cache_entry_paths()
+	cache_entry_sizes = [ calculate_cache_entry_size(cache_entry_path) for cache_entry_path in cache_entry_paths ]
+	cache_size = sum(cache_entry_sizes)
+	evict_total = 0
+
+	for cache_entry_path, cache_entry_size in zip(cache_entry_paths, cache_entry_sizes):
+		if cache_size <= cache_limit * (1024 ** 3):
+			break
+		if remove_directory(cache_entry_path):
+			cache_size -= cache_entry_size
+			evict_total += 1
+
+	return evict_total
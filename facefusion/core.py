@@ -4,17 +4,20 @@ import shutil
 import signal
 import sys
 from time import time
+from types import ModuleType
+from typing import List
 
 print("DEBUG: Starting imports...")
-from facefusion import benchmarker, cli_helper, content_analyser, face_classifier, face_detector, face_landmarker, face_masker, face_recognizer, hash_helper, logger, state_manager, translator, voice_extractor
+from facefusion import benchmarker, cli_helper, content_analyser, face_classifier, face_detector, face_landmarker, face_masker, face_recognizer, hash_helper, logger, model_preparer, state_manager, translator, voice_extractor
 print("DEBUG: Imported first batch of modules...")
 from facefusion.args import apply_args, collect_job_args, reduce_job_args, reduce_step_args
 from facefusion.download import conditional_download_hashes, conditional_download_sources
 from facefusion.exit_helper import hard_exit, signal_exit
-from facefusion.filesystem import get_file_extension, get_file_name, is_image, is_video, resolve_file_paths, resolve_file_pattern
+from facefusion.filesystem import get_file_extension, get_file_name, is_file, is_image, is_video, resolve_file_paths, resolve_file_pattern
 from facefusion.jobs import job_helper, job_manager, job_runner
 from facefusion.jobs.job_list import compose_job_list
 from facefusion.memory import limit_system_memory
+from facefusion.model_preloader import conditional_start_preload_models, stop_preload_models
 from facefusion.processors.core import get_processors_modules
 from facefusion.program import create_program
 from facefusion.program_helper import validate_args
@@ -68,6 +71,23 @@ def route(args : Args) -> None:
 		error_code = force_download()
 		hard_exit(error_code)
 
+	if state_manager.get_item('command') == 'prepare-models':
+		if model_preparer.prepare_models(collect_model_paths(collect_model_modules())) > 0:
+			hard_exit(0)
+		hard_exit(1)
+
+	if state_manager.get_item('command') == 'quantize-models':
+		if not face_classifier.pre_check() or not face_detector.pre_check() or not face_landmarker.pre_check() or not face_recognizer.pre_check():
+			hard_exit(2)
+		validation_crops = model_preparer.create_validation_crops(state_manager.get_item('source_paths') or [])
+
+		if not validation_crops:
+			logger.error(translator.get('no_source_face_detected'), __name__)
+			hard_exit(1)
+		if model_preparer.quantize_models(collect_model_paths(get_processors_modules([ 'face_enhancer', 'face_swapper', 'frame_enhancer' ])), validation_crops) > 0:
+			hard_exit(0)
+		hard_exit(1)
+
 	if state_manager.get_item('command') == 'benchmark':
 		print("DEBUG: Running benchmark...")
 		if not common_pre_check() or not processors_pre_check() or not benchmarker.pre_check():
@@ -198,7 +218,7 @@ def processors_pre_check() -> bool:
 	return True
 
 
-def force_download() -> ErrorCode:
+def collect_model_modules() -> List[ModuleType]:
 	common_modules =\
 	[
 		content_analyser,
@@ -211,8 +231,11 @@ def force_download() -> ErrorCode:
 	]
 	available_processors = [ get_file_name(file_path) for file_path in resolve_file_paths('facefusion/processors/modules') ]
 	processor_modules = get_processors_modules(available_processors)
+	return common_modules + processor_modules
+
 
-	for module in common_modules + processor_modules:
+def force_download() -> ErrorCode:
+	for module in collect_model_modules():
 		if hasattr(module, 'create_static_model_set'):
 			for model in module.create_static_model_set(state_manager.get_item('download_scope')).values():
 				model_hash_set = model.get('hashes')
@@ -225,6 +248,21 @@ def force_download() -> ErrorCode:
 	return 0
 
 
+def collect_model_paths(modules : List[ModuleType]) -> List[str]:
+	model_paths = []
+
+	for module in modules:
+		if hasattr(module, 'create_static_model_set'):
+			for model in module.create_static_model_set(state_manager.get_item('download_scope')).values():
+				for model_source in model.get('sources', {}).values():
+					model_path = model_source.get('path')
+
+					if is_file(model_path) and get_file_extension(model_path) == '.onnx' and model_path not in model_paths:
+						model_paths.append(model_path)
+
+	return model_paths
+
+
 def route_job_manager(args : Args) -> ErrorCode:
 	if state_manager.get_item('command') == 'job-list':
 		job_headers, job_contents = compose_job_list(state_manager.get_item('job_status'))
@@ -407,10 +445,15 @@ def conditional_process() -> ErrorCode:
 		if not processor_module.pre_process('output'):
 			return 2
 
+	if is_video(state_manager.get_item('target_path')):
+		conditional_start_preload_models()
+
 	if is_image(state_manager.get_item('target_path')):
 		return image_to_image.process(start_time)
 	if is_video(state_manager.get_item('target_path')):
-		return image_to_video.process(start_time)
+		error_code = image_to_video.process(start_time)
+		stop_preload_models()
+		return error_code
 
 	return 0
 
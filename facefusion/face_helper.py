@@ -234,6 +234,19 @@ def apply_nms(bounding_boxes : List[BoundingBox], scores : List[Score], score_th
 	return keep_indices
 
 
+def calculate_bounding_box_iou(first_bounding_box : BoundingBox, second_bounding_box : BoundingBox) -> float:
+	intersection_start = numpy.maximum(first_bounding_box[:2], second_bounding_box[:2])
+	intersection_end = numpy.minimum(first_bounding_box[2:], second_bounding_box[2:])
+	intersection_area = numpy.prod(numpy.clip(intersection_end - intersection_start, 0, None))
+	first_area = numpy.prod(numpy.clip(first_bounding_box[2:] - first_bounding_box[:2], 0, None))
+	second_area = numpy.prod(numpy.clip(second_bounding_box[2:] - second_bounding_box[:2], 0, None))
+	union_area = first_area + second_area - intersection_area
+
+	if union_area > 0:
+		return float(intersection_area / union_area)
+	return 0.0
+
+
 def get_nms_threshold(face_detector_model : FaceDetectorModel, face_detector_angles : List[Angle]) -> float:
 	if face_detector_model == 'many':
 		return 0.1
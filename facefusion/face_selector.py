@@ -1,15 +1,14 @@
-from typing import List
+from typing import List, Optional
 
 import numpy
 
 from facefusion import state_manager
-from facefusion.face_analyser import get_many_faces, get_one_face
-from facefusion.types import Face, FaceSelectorOrder, Gender, Race, Score, VisionFrame
+from facefusion.common_helper import get_first
+from facefusion.face_analyser import get_average_face, get_many_faces, get_one_face
+from facefusion.types import Face, FaceAttribute, FaceDemand, FaceSelectorOrder, Gender, Race, Score, VisionFrame
 
 
-def select_faces(reference_vision_frame : VisionFrame, target_vision_frame : VisionFrame) -> List[Face]:
-	target_faces = get_many_faces([ target_vision_frame ])
-
+def select_faces(reference_faces : List[Face], target_faces : List[Face]) -> List[Face]:
 	if state_manager.get_item('face_selector_mode') == 'many':
 		return sort_and_filter_faces(target_faces)
 
@@ -18,17 +17,52 @@ def select_faces(reference_vision_frame : VisionFrame, target_vision_frame : Vis
 		if target_face:
 			return [ target_face ]
 
+	if state_manager.get_item('face_selector_mode') == 'reference':
+		if reference_faces:
+			match_faces = find_match_faces(reference_faces, target_faces, state_manager.get_item('reference_face_distance'))
+			return match_faces
+
+	return []
+
+
+def resolve_face_attributes(face_demands : List[FaceDemand]) -> List[FaceAttribute]:
+	face_attributes : List[FaceAttribute] = []
+
+	if 'target_embedding' in face_demands or state_manager.get_item('face_selector_mode') == 'reference':
+		face_attributes.append('embedding')
+
+	if state_manager.get_item('face_selector_mode') in [ 'many', 'one' ]:
+		if state_manager.get_item('face_selector_gender') or state_manager.get_item('face_selector_race') or state_manager.get_item('face_selector_age_start') or state_manager.get_item('face_selector_age_end'):
+			face_attributes.append('classification')
+
+	return face_attributes
+
+
+def extract_reference_faces(reference_vision_frame : VisionFrame) -> List[Face]:
 	if state_manager.get_item('face_selector_mode') == 'reference':
 		reference_faces = get_many_faces([ reference_vision_frame ])
 		reference_faces = sort_and_filter_faces(reference_faces)
 		reference_face = get_one_face(reference_faces, state_manager.get_item('reference_face_position'))
 		if reference_face:
-			match_faces = find_match_faces([ reference_face ], target_faces, state_manager.get_item('reference_face_distance'))
-			return match_faces
+			return [ reference_face ]
 
 	return []
 
 
+def extract_source_face(source_vision_frames : List[VisionFrame]) -> Optional[Face]:
+	source_faces = []
+
+	if source_vision_frames:
+		for source_vision_frame in source_vision_frames:
+			temp_faces = get_many_faces([ source_vision_frame ])
+			temp_faces = sort_faces_by_order(temp_faces, 'large-small')
+
+			if temp_faces:
+				source_faces.append(get_first(temp_faces))
+
+	return get_average_face(source_faces)
+
+
 def find_match_faces(reference_faces : List[Face], target_faces : List[Face], face_distance : float) -> List[Face]:
 	match_faces : List[Face] = []
 
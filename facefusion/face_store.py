@@ -1,28 +1,97 @@
+import hashlib
+import threading
+from collections import OrderedDict
 from typing import List, Optional
 
+import numpy
+
+from facefusion import logger, translator
 from facefusion.hash_helper import create_hash
 from facefusion.types import Face, FaceStore, VisionFrame
 
 FACE_STORE : FaceStore =\
 {
-	'static_faces': {}
+	'static_faces': OrderedDict(),
+	'static_face_size': 0,
+	'hit_total': 0,
+	'miss_total': 0,
+	'evict_total': 0
 }
+FACE_STORE_LOCK : threading.Lock = threading.Lock()
+FACE_STORE_LIMIT : int = 64 * 1024 * 1024
 
 
 def get_face_store() -> FaceStore:
 	return FACE_STORE
 
 
+def create_vision_hash(vision_frame : VisionFrame) -> str:
+	vision_frame = numpy.ascontiguousarray(vision_frame)
+	vision_stride = max(int(numpy.sqrt(vision_frame.size / (2 * 1024 * 1024))), 1)
+	vision_sample = numpy.ascontiguousarray(vision_frame[::vision_stride, ::vision_stride])
+	vision_digest = hashlib.blake2b(str(vision_frame.shape).encode() + str(vision_frame.dtype).encode(), digest_size = 16)
+	vision_digest.update(vision_sample.data)
+	return vision_digest.hexdigest() + '-' + create_hash(vision_frame.data) #type:ignore[arg-type]
+
+
+def calculate_faces_size(faces : List[Face]) -> int:
+	faces_size = 0
+
+	for face in faces:
+		for face_value in list(face) + list(face.landmark_set.values()):
+			if isinstance(face_value, numpy.ndarray):
+				faces_size += face_value.nbytes
+	return faces_size
+
+
 def get_static_faces(vision_frame : VisionFrame) -> Optional[List[Face]]:
-	vision_hash = create_hash(vision_frame.tobytes())
-	return FACE_STORE.get('static_faces').get(vision_hash)
+	vision_hash = create_vision_hash(vision_frame)
+
+	with FACE_STORE_LOCK:
+		static_faces = FACE_STORE.get('static_faces')
+
+		if vision_hash in static_faces:
+			static_faces.move_to_end(vision_hash)
+			FACE_STORE['hit_total'] += 1
+			return static_faces.get(vision_hash)
+
+		FACE_STORE['miss_total'] += 1
+	return None
 
 
 def set_static_faces(vision_frame : VisionFrame, faces : List[Face]) -> None:
-	vision_hash = create_hash(vision_frame.tobytes())
+	vision_hash = create_vision_hash(vision_frame)
+
 	if vision_hash:
-		FACE_STORE['static_faces'][vision_hash] = faces
+		with FACE_STORE_LOCK:
+			static_faces = FACE_STORE.get('static_faces')
+
+			if vision_hash in static_faces:
+				FACE_STORE['static_face_size'] -= calculate_faces_size(static_faces.pop(vision_hash))
+
+			static_faces[vision_hash] = faces
+			FACE_STORE['static_face_size'] += calculate_faces_size(faces)
+
+			while len(static_faces) > 1 and FACE_STORE.get('static_face_size') > FACE_STORE_LIMIT:
+				_, evict_faces = static_faces.popitem(last = False)
+				FACE_STORE['static_face_size'] -= calculate_faces_size(evict_faces)
+				FACE_STORE['evict_total'] += 1
+
+
+def report_face_store() -> None:
+	with FACE_STORE_LOCK:
+		hit_total = FACE_STORE.get('hit_total')
+		miss_total = FACE_STORE.get('miss_total')
+		evict_total = FACE_STORE.get('evict_total')
+
+	if hit_total or miss_total:
+		logger.debug(translator.get('face_store_utilization').format(hit_total = hit_total, miss_total = miss_total, evict_total = evict_total), __name__)
 
 
 def clear_static_faces() -> None:
-	FACE_STORE['static_faces'].clear()
+	with FACE_STORE_LOCK:
+		FACE_STORE['static_faces'].clear()
+		FACE_STORE['static_face_size'] = 0
+		FACE_STORE['hit_total'] = 0
+		FACE_STORE['miss_total'] = 0
+		FACE_STORE['evict_total'] = 0
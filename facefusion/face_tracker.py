@@ -0,0 +1,207 @@
+import threading
+from typing import List, Optional
+
+import cv2
+import numpy
+
+from facefusion import state_manager
+from facefusion.face_analyser import analyse_face, detect_many_faces, locate_many_faces
+from facefusion.face_helper import calculate_bounding_box_iou, convert_to_face_landmark_5
+from facefusion.face_landmarker import detect_face_landmark
+from facefusion.types import Face, FaceAttribute, FaceIdentity, FaceTrackSet, FaceTrackerStore, Points, VisionFrame
+from facefusion.vision import calculate_histogram_difference
+
+FACE_TRACKER_LOCK : threading.Lock = threading.Lock()
+
+
+def create_face_tracker_store() -> FaceTrackerStore:
+	return\
+	{
+		'face_track_sets': {},
+		'face_identities': {},
+		'track_total': 0
+	}
+
+
+def track_many_faces(face_tracker_store : Optional[FaceTrackerStore], vision_frame : VisionFrame, frame_number : int, face_attributes : List[FaceAttribute]) -> List[Face]:
+	face_detector_interval = state_manager.get_item('face_detector_interval')
+
+	if face_tracker_store is None or not face_detector_interval or face_detector_interval < 2:
+		return detect_many_faces(vision_frame, face_attributes)
+
+	thumbnail_frame = create_thumbnail_frame(vision_frame)
+	face_track_set = find_face_track_set(face_tracker_store, frame_number)
+
+	if face_track_set and frame_number - face_track_set.get('key_frame_number') < face_detector_interval and not detect_scene_change(face_track_set.get('thumbnail_frame'), thumbnail_frame):
+		faces = propagate_faces(vision_frame, face_track_set.get('faces'))
+
+		if faces is not None:
+			store_face_track_set(face_tracker_store, frame_number,
+			{
+				'key_frame_number': face_track_set.get('key_frame_number'),
+				'thumbnail_frame': thumbnail_frame,
+				'faces': faces,
+				'track_ids': face_track_set.get('track_ids')
+			})
+			return faces
+
+	faces = locate_many_faces(vision_frame)
+	track_ids = associate_track_ids(face_tracker_store, faces, face_track_set)
+	faces = [ resolve_face_identity(face_tracker_store, vision_frame, frame_number, face, track_id, face_attributes) for face, track_id in zip(faces, track_ids) ]
+	clear_stale_face_identities(face_tracker_store, track_ids)
+	store_face_track_set(face_tracker_store, frame_number,
+	{
+		'key_frame_number': frame_number,
+		'thumbnail_frame': thumbnail_frame,
+		'faces': faces,
+		'track_ids': track_ids
+	})
+	return faces
+
+
+def find_face_track_set(face_tracker_store : FaceTrackerStore, frame_number : int) -> Optional[FaceTrackSet]:
+	with FACE_TRACKER_LOCK:
+		face_track_sets = face_tracker_store.get('face_track_sets')
+		previous_frame_numbers = [ track_frame_number for track_frame_number in face_track_sets if track_frame_number < frame_number ]
+
+		if previous_frame_numbers:
+			return face_track_sets.get(max(previous_frame_numbers))
+	return None
+
+
+def store_face_track_set(face_tracker_store : FaceTrackerStore, frame_number : int, face_track_set : FaceTrackSet) -> None:
+	with FACE_TRACKER_LOCK:
+		face_track_sets = face_tracker_store.get('face_track_sets')
+		face_track_sets[frame_number] = face_track_set
+
+		for track_frame_number in list(face_track_sets):
+			if track_frame_number < frame_number - state_manager.get_item('face_detector_interval'):
+				del face_track_sets[track_frame_number]
+
+
+def associate_track_ids(face_tracker_store : FaceTrackerStore, faces : List[Face], face_track_set : Optional[FaceTrackSet]) -> List[int]:
+	track_ids = []
+	previous_tracks = []
+
+	if face_track_set:
+		previous_tracks = list(zip(face_track_set.get('track_ids'), face_track_set.get('faces')))
+
+	for face in faces:
+		track_ious = [ calculate_bounding_box_iou(face.bounding_box, previous_face.bounding_box) for _, previous_face in previous_tracks ]
+
+		if track_ious and max(track_ious) >= 0.3:
+			track_id, _ = previous_tracks.pop(int(numpy.argmax(track_ious)))
+			track_ids.append(track_id)
+		else:
+			track_ids.append(create_track_id(face_tracker_store))
+	return track_ids
+
+
+def create_track_id(face_tracker_store : FaceTrackerStore) -> int:
+	with FACE_TRACKER_LOCK:
+		face_tracker_store['track_total'] += 1
+		return face_tracker_store.get('track_total')
+
+
+def resolve_face_identity(face_tracker_store : FaceTrackerStore, vision_frame : VisionFrame, frame_number : int, face : Face, track_id : int, face_attributes : List[FaceAttribute]) -> Face:
+	if not face_attributes:
+		return face
+
+	with FACE_TRACKER_LOCK:
+		face_identity = face_tracker_store.get('face_identities').get(track_id)
+
+	if face_identity and not detect_identity_drift(face_identity, frame_number, face):
+		identity_face = face_identity.get('face')
+		return face._replace(
+			embedding = identity_face.embedding,
+			embedding_norm = identity_face.embedding_norm,
+			gender = identity_face.gender,
+			age = identity_face.age,
+			race = identity_face.race
+		)
+
+	face = analyse_face(vision_frame, face, face_attributes)
+
+	with FACE_TRACKER_LOCK:
+		face_tracker_store['face_identities'][track_id] =\
+		{
+			'frame_number': frame_number,
+			'face': face
+		}
+	return face
+
+
+def detect_identity_drift(face_identity : FaceIdentity, frame_number : int, face : Face) -> bool:
+	identity_face = face_identity.get('face')
+	identity_face_size = numpy.subtract(identity_face.bounding_box[2:], identity_face.bounding_box[:2]).mean()
+	face_size = numpy.subtract(face.bounding_box[2:], face.bounding_box[:2]).mean()
+
+	if frame_number - face_identity.get('frame_number') >= state_manager.get_item('face_detector_interval') * 5:
+		return True
+	if face.angle != identity_face.angle:
+		return True
+	return not 0.8 <= face_size / max(identity_face_size, 1) <= 1.25
+
+
+def clear_stale_face_identities(face_tracker_store : FaceTrackerStore, track_ids : List[int]) -> None:
+	with FACE_TRACKER_LOCK:
+		face_identities = face_tracker_store.get('face_identities')
+
+		for track_id in list(face_identities):
+			if track_id not in track_ids:
+				del face_identities[track_id]
+
+
+def propagate_faces(vision_frame : VisionFrame, faces : List[Face]) -> Optional[List[Face]]:
+	tracked_faces = []
+
+	for face in faces:
+		tracked_face = propagate_face(vision_frame, face)
+
+		if not tracked_face:
+			return None
+		tracked_faces.append(tracked_face)
+	return tracked_faces
+
+
+def propagate_face(vision_frame : VisionFrame, face : Face) -> Optional[Face]:
+	face_landmark_68, face_landmark_score_68 = detect_face_landmark(vision_frame, face.bounding_box, face.angle)
+
+	if face_landmark_68 is None or face_landmark_score_68 < state_manager.get_item('face_landmarker_score'):
+		return None
+
+	previous_center = numpy.mean(face.landmark_set.get('68'), axis = 0)
+	current_center = numpy.mean(face_landmark_68, axis = 0)
+	face_scale = numpy.ptp(face_landmark_68, axis = 0).mean() / max(numpy.ptp(face.landmark_set.get('68'), axis = 0).mean(), 1)
+	bounding_box = shift_points(face.bounding_box.reshape(-1, 2), previous_center, current_center, face_scale).ravel()
+
+	if calculate_bounding_box_iou(bounding_box, face.bounding_box) < 0.5:
+		return None
+
+	return face._replace(
+		bounding_box = bounding_box,
+		score_set =
+		{
+			'detector': face.score_set.get('detector'),
+			'landmarker': face_landmark_score_68
+		},
+		landmark_set =
+		{
+			'5': shift_points(face.landmark_set.get('5'), previous_center, current_center, face_scale),
+			'5/68': convert_to_face_landmark_5(face_landmark_68),
+			'68': face_landmark_68,
+			'68/5': shift_points(face.landmark_set.get('68/5'), previous_center, current_center, face_scale)
+		}
+	)
+
+
+def shift_points(points : Points, previous_center : Points, current_center : Points, face_scale : float) -> Points:
+	return (points - previous_center) * face_scale + current_center
+
+
+def create_thumbnail_frame(vision_frame : VisionFrame) -> VisionFrame:
+	return cv2.resize(vision_frame[:, :, :3], (64, 64), interpolation = cv2.INTER_AREA)
+
+
+def detect_scene_change(previous_thumbnail_frame : VisionFrame, thumbnail_frame : VisionFrame) -> bool:
+	return calculate_histogram_difference(previous_thumbnail_frame, thumbnail_frame) < 0.8
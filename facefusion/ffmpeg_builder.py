@@ -5,7 +5,7 @@ from typing import List, Optional
 import numpy
 
 from facefusion.filesystem import get_file_format
-from facefusion.types import AudioEncoder, Command, CommandSet, Duration, Fps, StreamMode, VideoEncoder, VideoPreset
+from facefusion.types import AudioEncoder, Command, CommandSet, Duration, Fps, RawPixelFormat, StreamMode, VideoEncoder, VideoPreset
 
 
 def run(commands : List[Command]) -> List[Command]:
@@ -235,6 +235,10 @@ def capture_video() -> List[Command]:
 	return [ '-f', 'rawvideo', '-pix_fmt', 'rgb24' ]
 
 
+def set_raw_video_format(raw_pixel_format : RawPixelFormat) -> List[Command]:
+	return [ '-f', 'rawvideo', '-pix_fmt', raw_pixel_format ]
+
+
 def ignore_video_stream() -> List[Command]:
 	return [ '-vn' ]
 
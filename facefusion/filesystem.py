@@ -1,6 +1,7 @@
 import glob
 import os
 import shutil
+import tempfile
 from typing import List, Optional
 
 import facefusion.choices
@@ -124,6 +125,31 @@ def copy_file(file_path : str, move_path : str) -> bool:
 	return False
 
 
+def link_file(file_path : str, link_path : str) -> bool:
+	if is_file(file_path):
+		if is_file(link_path):
+			if os.path.samefile(file_path, link_path):
+				return True
+			os.remove(link_path)
+
+		try:
+			os.link(file_path, link_path)
+		except FileExistsError:
+			return is_file(link_path)
+		except OSError:
+			return replace_file(file_path, link_path)
+		return is_file(link_path)
+	return False
+
+
+def replace_file(file_path : str, replace_path : str) -> bool:
+	file_descriptor, temp_replace_path = tempfile.mkstemp(dir = os.path.dirname(replace_path))
+	os.close(file_descriptor)
+	shutil.copy(file_path, temp_replace_path)
+	os.replace(temp_replace_path, replace_path)
+	return is_file(replace_path)
+
+
 def move_file(file_path : str, move_path : str) -> bool:
 	if is_file(file_path):
 		shutil.move(file_path, move_path)
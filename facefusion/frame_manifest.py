@@ -0,0 +1,55 @@
+import json
+import os
+from typing import Optional
+
+from facefusion import state_manager
+from facefusion.cache_manager import create_static_file_hash
+from facefusion.filesystem import get_file_size, is_file, move_file
+from facefusion.hash_helper import create_hash
+from facefusion.jobs import job_store
+from facefusion.json import read_json, write_json
+from facefusion.temp_helper import get_temp_directory_path
+from facefusion.types import FrameManifest
+
+
+def get_frame_manifest_path(target_path : str) -> str:
+	temp_directory_path = get_temp_directory_path(target_path)
+	return os.path.join(temp_directory_path, 'manifest.json')
+
+
+def create_frame_manifest_signature(target_path : str) -> str:
+	signature_set =\
+	{
+		'target_size': get_file_size(target_path),
+		'target_time': os.path.getmtime(target_path) if is_file(target_path) else None,
+		'source_hashes': [ create_static_file_hash(source_path, get_file_size(source_path), os.path.getmtime(source_path)) for source_path in state_manager.get_item('source_paths') or [] if is_file(source_path) ]
+	}
+
+	for step_key in job_store.get_step_keys():
+		signature_set[step_key] = state_manager.get_item(step_key) #type:ignore[arg-type]
+	signature_content = json.dumps(signature_set, sort_keys = True, default = str)
+	return create_hash(signature_content.encode())
+
+
+def init_frame_manifest(target_path : str) -> bool:
+	frame_manifest : FrameManifest =\
+	{
+		'signature': create_frame_manifest_signature(target_path),
+		'extract_frame_total': 0,
+		'process_frame_total': 0
+	}
+	return write_frame_manifest(target_path, frame_manifest)
+
+
+def read_frame_manifest(target_path : str) -> Optional[FrameManifest]:
+	frame_manifest = read_json(get_frame_manifest_path(target_path))
+
+	if frame_manifest and frame_manifest.get('signature') == create_frame_manifest_signature(target_path):
+		return frame_manifest #type:ignore[return-value]
+	return None
+
+
+def write_frame_manifest(target_path : str, frame_manifest : FrameManifest) -> bool:
+	frame_manifest_path = get_frame_manifest_path(target_path)
+	temp_frame_manifest_path = frame_manifest_path + '.tmp'
+	return write_json(temp_frame_manifest_path, frame_manifest) and move_file(temp_frame_manifest_path, frame_manifest_path) #type:ignore[arg-type]
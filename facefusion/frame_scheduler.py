@@ -0,0 +1,95 @@
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from queue import Empty, Full, Queue
+from typing import Deque, Generator, Iterator, Optional
+
+from facefusion.types import FramePacket, FrameQueueDepths, ProcessFramePacket
+
+
+def create_frame_queue_depths() -> FrameQueueDepths:
+	return\
+	{
+		'decode': 0,
+		'process': 0,
+		'encode': 0
+	}
+
+
+def calculate_frame_queue_size(execution_thread_count : int) -> int:
+	return max(execution_thread_count, 1) * 2
+
+
+def schedule_frames(frame_packets : Iterator[FramePacket], process_frame_packet : ProcessFramePacket, execution_thread_count : int, frame_queue_depths : Optional[FrameQueueDepths] = None) -> Generator[FramePacket, None, None]:
+	if frame_queue_depths is None:
+		frame_queue_depths = create_frame_queue_depths()
+
+	frame_queue_size = calculate_frame_queue_size(execution_thread_count)
+	decode_queue : Queue[Optional[FramePacket]] = Queue(maxsize = frame_queue_size)
+	decode_event = threading.Event()
+	decode_thread = threading.Thread(target = decode_frames, args = (frame_packets, decode_queue, decode_event), daemon = True)
+	futures : Deque[Future[FramePacket]] = deque()
+	executor = ThreadPoolExecutor(max_workers = execution_thread_count)
+	decode_thread.start()
+
+	try:
+		frame_packet = decode_queue.get()
+
+		while frame_packet or futures:
+			if futures and (futures[0].done() or len(futures) >= frame_queue_size or not frame_packet):
+				update_frame_queue_depths(frame_queue_depths, decode_queue, futures)
+				yield futures.popleft().result()
+			else:
+				futures.append(executor.submit(process_frame_packet, frame_packet))
+				frame_packet = decode_queue.get()
+	finally:
+		decode_event.set()
+		executor.shutdown(wait = True, cancel_futures = True)
+		clear_decode_queue(decode_queue)
+		reset_frame_queue_depths(frame_queue_depths)
+
+
+def decode_frames(frame_packets : Iterator[FramePacket], decode_queue : Queue[Optional[FramePacket]], decode_event : threading.Event) -> None:
+	try:
+		for frame_packet in frame_packets:
+			if not put_frame_packet(decode_queue, frame_packet, decode_event):
+				return
+	finally:
+		put_frame_packet(decode_queue, None, decode_event)
+
+
+def put_frame_packet(decode_queue : Queue[Optional[FramePacket]], frame_packet : Optional[FramePacket], decode_event : threading.Event) -> bool:
+	while not decode_event.is_set():
+		try:
+			decode_queue.put(frame_packet, timeout = 0.1)
+			return True
+		except Full:
+			continue
+	return False
+
+
+def clear_decode_queue(decode_queue : Queue[Optional[FramePacket]]) -> None:
+	while not decode_queue.empty():
+		try:
+			decode_queue.get_nowait()
+		except Empty:
+			break
+
+
+def update_frame_queue_depths(frame_queue_depths : FrameQueueDepths, decode_queue : Queue[Optional[FramePacket]], futures : Deque[Future[FramePacket]]) -> None:
+	encode_depth = 0
+
+	for future in futures:
+		if not future.done():
+			break
+		encode_depth += 1
+
+	frame_queue_depths['decode'] = decode_queue.qsize()
+	frame_queue_depths['process'] = len(futures) - encode_depth
+	frame_queue_depths['encode'] = encode_depth
+
+
+def reset_frame_queue_depths(frame_queue_depths : FrameQueueDepths) -> None:
+	frame_queue_depths['decode'] = 0
+	frame_queue_depths['process'] = 0
+	frame_queue_depths['encode'] = 0
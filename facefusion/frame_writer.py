@@ -0,0 +1,26 @@
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Deque, Iterator
+
+from facefusion.frame_scheduler import calculate_frame_queue_size
+from facefusion.types import FramePacket, ProcessFramePacket
+
+
+def write_frames(frame_packets : Iterator[FramePacket], write_frame_packet : ProcessFramePacket, frame_writer_count : int) -> Iterator[FramePacket]:
+	frame_queue_size = calculate_frame_queue_size(frame_writer_count)
+	futures : Deque[Future[FramePacket]] = deque()
+	executor = ThreadPoolExecutor(max_workers = max(frame_writer_count, 1))
+
+	try:
+		for frame_packet in frame_packets:
+			if len(futures) >= frame_queue_size:
+				yield futures.popleft().result()
+			futures.append(executor.submit(write_frame_packet, frame_packet))
+
+			while futures and futures[0].done():
+				yield futures.popleft().result()
+
+		while futures:
+			yield futures.popleft().result()
+	finally:
+		executor.shutdown(wait = True, cancel_futures = True)
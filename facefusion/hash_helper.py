@@ -1,5 +1,7 @@
+import hashlib
 import os
 import zlib
+from functools import lru_cache
 from typing import Optional
 
 from facefusion.filesystem import get_file_name, is_file
@@ -9,6 +11,61 @@ def create_hash(content : bytes) -> str:
 	return format(zlib.crc32(content), '08x')
 
 
+def create_file_hash(file_path : str) -> Optional[str]:
+	if is_file(file_path):
+		file_hash = 0
+
+		with open(file_path, 'rb') as file:
+			while file_chunk := file.read(1024 * 1024):
+				file_hash = zlib.crc32(file_chunk, file_hash)
+
+		return format(file_hash, '08x')
+	return None
+
+
+def create_file_digest(file_path : str) -> Optional[str]:
+	if is_file(file_path):
+		file_digest = hashlib.blake2b(digest_size = 16)
+
+		with open(file_path, 'rb') as file:
+			while file_chunk := file.read(1024 * 1024):
+				file_digest.update(file_chunk)
+
+		return file_digest.hexdigest()
+	return None
+
+
+def create_file_sample_digest(file_path : str, sample_size : int) -> Optional[str]:
+	if is_file(file_path):
+		file_size = os.path.getsize(file_path)
+		file_digest = hashlib.blake2b(str(file_size).encode(), digest_size = 16)
+		sample_offsets = sorted({ 0, max(0, (file_size - sample_size) // 2), max(0, file_size - sample_size) })
+
+		with open(file_path, 'rb') as file:
+			for sample_offset in sample_offsets:
+				file.seek(sample_offset)
+				file_digest.update(file.read(sample_size))
+
+		return file_digest.hexdigest()
+	return None
+
+
+def resolve_file_hash(file_path : str) -> Optional[str]:
+	hash_path = get_hash_path(file_path)
+
+	if is_file(hash_path):
+		with open(hash_path) as hash_file:
+			return hash_file.read().strip()
+	if is_file(file_path):
+		return create_cached_file_hash(file_path, os.path.getsize(file_path), os.path.getmtime(file_path))
+	return None
+
+
+@lru_cache(maxsize = 64)
+def create_cached_file_hash(file_path : str, file_size : int, file_time : float) -> Optional[str]:
+	return create_file_hash(file_path)
+
+
 def validate_hash(validate_path : str) -> bool:
 	hash_path = get_hash_path(validate_path)
 
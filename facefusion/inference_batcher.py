@@ -0,0 +1,98 @@
+import threading
+from time import time
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy
+from onnxruntime import InferenceSession
+
+from facefusion import state_manager
+from facefusion.types import InferenceBatch, InferenceRequest, Tensor
+
+
+def create_inference_batch(inference_session : InferenceSession) -> Optional[InferenceBatch]:
+	if has_dynamic_batch(inference_session):
+		return\
+		{
+			'condition': threading.Condition(),
+			'inference_requests': []
+		}
+	return None
+
+
+def has_dynamic_batch(inference_session : InferenceSession) -> bool:
+	session_nodes = inference_session.get_inputs() + inference_session.get_outputs()
+	return all(session_node.shape and not isinstance(session_node.shape[0], int) for session_node in session_nodes)
+
+
+def create_batch_signature(output_names : Optional[List[str]], input_feed : Dict[str, Tensor]) -> str:
+	batch_signature = [ str(output_names) ]
+
+	for input_name in sorted(input_feed):
+		input_tensor = input_feed.get(input_name)
+		batch_signature.append(input_name + str(input_tensor.shape[1:]) + str(input_tensor.dtype))
+	return '|'.join(batch_signature)
+
+
+def run_batched_inference(inference_batch : InferenceBatch, session_run : Callable[..., Any], output_names : Optional[List[str]], input_feed : Dict[str, Tensor]) -> List[Tensor]:
+	execution_batch_size = state_manager.get_item('execution_batch_size')
+	execution_batch_wait = state_manager.get_item('execution_batch_wait') / 1000
+	condition = inference_batch.get('condition')
+	inference_requests = inference_batch.get('inference_requests')
+	inference_request : InferenceRequest =\
+	{
+		'batch_signature': create_batch_signature(output_names, input_feed),
+		'input_feed': input_feed,
+		'output_feed': None,
+		'exception': None,
+		'deadline': time() + execution_batch_wait,
+		'done': False
+	}
+
+	with condition:
+		inference_requests.append(inference_request)
+		condition.notify_all()
+
+		while not inference_request.get('done'):
+			if inference_requests and inference_requests[0] is inference_request:
+				batch_requests = [ current_request for current_request in inference_requests if current_request.get('batch_signature') == inference_request.get('batch_signature') ][:execution_batch_size]
+
+				if len(batch_requests) >= execution_batch_size or time() >= inference_request.get('deadline'):
+					for batch_request in batch_requests:
+						inference_requests.remove(batch_request)
+					condition.notify_all()
+					break
+				condition.wait(inference_request.get('deadline') - time())
+			else:
+				condition.wait()
+
+	if not inference_request.get('done'):
+		forward_batch_requests(batch_requests, session_run, output_names)
+
+		with condition:
+			condition.notify_all()
+
+	if inference_request.get('exception'):
+		raise inference_request.get('exception')
+	return inference_request.get('output_feed')
+
+
+def forward_batch_requests(batch_requests : List[InferenceRequest], session_run : Callable[..., Any], output_names : Optional[List[str]]) -> None:
+	batch_sizes = [ len(next(iter(batch_request.get('input_feed').values()))) for batch_request in batch_requests ]
+	batch_indices = numpy.cumsum(batch_sizes)[:-1]
+	input_feed = {}
+
+	for input_name in batch_requests[0].get('input_feed'):
+		input_feed[input_name] = numpy.concatenate([ batch_request.get('input_feed').get(input_name) for batch_request in batch_requests ])
+
+	try:
+		output_feed = session_run(output_names, input_feed, None)
+		output_tensors = [ numpy.split(output_tensor, batch_indices) for output_tensor in output_feed ]
+
+		for batch_index, batch_request in enumerate(batch_requests):
+			batch_request['output_feed'] = [ output_tensor[batch_index] for output_tensor in output_tensors ]
+	except Exception as exception:
+		for batch_request in batch_requests:
+			batch_request['exception'] = exception
+
+	for batch_request in batch_requests:
+		batch_request['done'] = True
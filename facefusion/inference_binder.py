@@ -0,0 +1,86 @@
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy
+from onnxruntime import InferenceSession, OrtValue
+
+from facefusion.types import InferenceBinding, Tensor
+
+TENSOR_DTYPE_SET : Dict[str, Any] =\
+{
+	'tensor(float)': numpy.float32,
+	'tensor(float16)': numpy.float16,
+	'tensor(double)': numpy.float64,
+	'tensor(int64)': numpy.int64,
+	'tensor(int32)': numpy.int32,
+	'tensor(uint8)': numpy.uint8,
+	'tensor(bool)': numpy.bool_
+}
+
+
+def create_inference_binding(inference_session : InferenceSession) -> Optional[InferenceBinding]:
+	if has_static_shape(inference_session):
+		inference_device, inference_device_id = resolve_inference_device(inference_session)
+		return\
+		{
+			'inference_session': inference_session,
+			'inference_device': inference_device,
+			'inference_device_id': inference_device_id,
+			'thread_state': threading.local()
+		}
+	return None
+
+
+def has_static_shape(inference_session : InferenceSession) -> bool:
+	session_nodes = inference_session.get_inputs() + inference_session.get_outputs()
+	return all(session_node.type in TENSOR_DTYPE_SET and all(isinstance(session_dimension, int) and session_dimension > 0 for session_dimension in session_node.shape) for session_node in session_nodes)
+
+
+def resolve_inference_device(inference_session : InferenceSession) -> Tuple[str, int]:
+	if 'CUDAExecutionProvider' in inference_session.get_providers():
+		provider_options = inference_session.get_provider_options().get('CUDAExecutionProvider')
+		return 'cuda', int(provider_options.get('device_id', 0))
+	return 'cpu', 0
+
+
+def init_thread_binding(inference_binding : InferenceBinding) -> None:
+	inference_session = inference_binding.get('inference_session')
+	thread_state = inference_binding.get('thread_state')
+	thread_state.io_binding = inference_session.io_binding()
+	thread_state.input_values = {}
+	thread_state.output_values = {}
+
+	for session_input in inference_session.get_inputs():
+		input_value = OrtValue.ortvalue_from_shape_and_type(session_input.shape, TENSOR_DTYPE_SET.get(session_input.type), inference_binding.get('inference_device'), inference_binding.get('inference_device_id'))
+		thread_state.io_binding.bind_ortvalue_input(session_input.name, input_value)
+		thread_state.input_values[session_input.name] = input_value
+
+	for session_output in inference_session.get_outputs():
+		output_value = OrtValue.ortvalue_from_shape_and_type(session_output.shape, TENSOR_DTYPE_SET.get(session_output.type), inference_binding.get('inference_device'), inference_binding.get('inference_device_id'))
+		thread_state.io_binding.bind_ortvalue_output(session_output.name, output_value)
+		thread_state.output_values[session_output.name] = output_value
+
+
+def run_bound_inference(inference_binding : InferenceBinding, session_run : Callable[..., Any], output_names : Optional[List[str]], input_feed : Dict[str, Tensor]) -> List[Tensor]:
+	inference_session = inference_binding.get('inference_session')
+	thread_state = inference_binding.get('thread_state')
+
+	if not hasattr(thread_state, 'io_binding'):
+		init_thread_binding(inference_binding)
+
+	if set(input_feed) != set(thread_state.input_values) or any(tuple(input_feed.get(input_name).shape) != tuple(input_value.shape()) for input_name, input_value in thread_state.input_values.items()):
+		return session_run(output_names, input_feed, None)
+
+	for input_name, input_value in thread_state.input_values.items():
+		input_value.update_inplace(numpy.ascontiguousarray(input_feed.get(input_name), dtype = TENSOR_DTYPE_SET.get(input_value.data_type())))
+
+	inference_session.run_with_iobinding(thread_state.io_binding)
+
+	if output_names is None:
+		output_names = [ session_output.name for session_output in inference_session.get_outputs() ]
+
+	output_feed = [ thread_state.output_values.get(output_name).numpy() for output_name in output_names ]
+
+	if inference_binding.get('inference_device') == 'cpu':
+		output_feed = [ output_tensor.copy() for output_tensor in output_feed ]
+	return output_feed
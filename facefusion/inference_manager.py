@@ -1,58 +1,175 @@
 import importlib
-import random
+import os
+import threading
+from functools import partial
 from time import sleep, time
-from typing import List
+from typing import Any, Callable, Dict, List, Optional
 
-from onnxruntime import InferenceSession
+import onnxruntime
+from onnxruntime import GraphOptimizationLevel, InferenceSession, SessionOptions
 
 from facefusion import logger, process_manager, state_manager, translator
 from facefusion.app_context import detect_app_context
 from facefusion.common_helper import is_windows
 from facefusion.execution import create_inference_session_providers, has_execution_provider
 from facefusion.exit_helper import fatal_exit
-from facefusion.filesystem import get_file_name, is_file
+from facefusion.filesystem import create_directory, get_file_name, is_file, remove_file
+from facefusion.hash_helper import resolve_file_hash
+from facefusion.inference_batcher import create_inference_batch, run_batched_inference
+from facefusion.inference_binder import create_inference_binding, run_bound_inference
+from facefusion.json import read_json
+from facefusion.thread_helper import NULL_CONTEXT, conditional_thread_semaphore
 from facefusion.time_helper import calculate_end_time
-from facefusion.types import DownloadSet, ExecutionProvider, InferencePool, InferencePoolSet
+from facefusion.types import DownloadSet, ExecutionOptimizationLevel, ExecutionProvider, InferenceBatch, InferenceBinding, InferencePool, InferencePoolSet, InferenceReplica, InferenceReplicaSet, InferenceSessionProvider
 
 INFERENCE_POOL_SET : InferencePoolSet =\
 {
 	'cli': {},
 	'ui': {}
 }
+GRAPH_OPTIMIZATION_LEVEL_SET : Dict[ExecutionOptimizationLevel, GraphOptimizationLevel] =\
+{
+	'disable': GraphOptimizationLevel.ORT_DISABLE_ALL,
+	'basic': GraphOptimizationLevel.ORT_ENABLE_BASIC,
+	'extended': GraphOptimizationLevel.ORT_ENABLE_EXTENDED,
+	'all': GraphOptimizationLevel.ORT_ENABLE_ALL
+}
+INFERENCE_REPLICA_SET : InferenceReplicaSet = {}
+INFERENCE_CONTEXT_LOCKS : Dict[str, threading.Lock] = {}
+INFERENCE_POOL_LOCK : threading.Lock = threading.Lock()
 
 
 def get_inference_pool(module_name : str, model_names : List[str], model_source_set : DownloadSet) -> InferencePool:
 	while process_manager.is_checking():
 		sleep(0.5)
 	execution_device_ids = state_manager.get_item('execution_device_ids')
+	execution_replica_count = state_manager.get_item('execution_replica_count') or 1
 	execution_providers = resolve_execution_providers(module_name)
 	app_context = detect_app_context()
+	inference_contexts = []
 
 	for execution_device_id in execution_device_ids:
-		inference_context = get_inference_context(module_name, model_names, execution_device_id, execution_providers)
+		for execution_replica_index in range(execution_replica_count):
+			inference_context = get_inference_replica_context(get_inference_context(module_name, model_names, execution_device_id, execution_providers), execution_replica_index)
 
-		if app_context == 'cli' and INFERENCE_POOL_SET.get('ui').get(inference_context):
-			INFERENCE_POOL_SET['cli'][inference_context] = INFERENCE_POOL_SET.get('ui').get(inference_context)
-		if app_context == 'ui' and INFERENCE_POOL_SET.get('cli').get(inference_context):
-			INFERENCE_POOL_SET['ui'][inference_context] = INFERENCE_POOL_SET.get('cli').get(inference_context)
-		if not INFERENCE_POOL_SET.get(app_context).get(inference_context):
-			INFERENCE_POOL_SET[app_context][inference_context] = create_inference_pool(model_source_set, execution_device_id, execution_providers)
+			with get_inference_context_lock(inference_context):
+				if app_context == 'cli' and INFERENCE_POOL_SET.get('ui').get(inference_context):
+					INFERENCE_POOL_SET['cli'][inference_context] = INFERENCE_POOL_SET.get('ui').get(inference_context)
+				if app_context == 'ui' and INFERENCE_POOL_SET.get('cli').get(inference_context):
+					INFERENCE_POOL_SET['ui'][inference_context] = INFERENCE_POOL_SET.get('cli').get(inference_context)
+				if not INFERENCE_POOL_SET.get(app_context).get(inference_context):
+					INFERENCE_POOL_SET[app_context][inference_context] = track_inference_pool(inference_context, create_inference_pool(model_source_set, execution_device_id, execution_providers))
+			inference_contexts.append(inference_context)
 
-	current_inference_context = get_inference_context(module_name, model_names, random.choice(execution_device_ids), execution_providers)
+	current_inference_context = select_inference_context(inference_contexts)
 	return INFERENCE_POOL_SET.get(app_context).get(current_inference_context)
 
 
+def select_inference_context(inference_contexts : List[str]) -> str:
+	with INFERENCE_POOL_LOCK:
+		return min(inference_contexts, key = lambda inference_context: (INFERENCE_REPLICA_SET.get(inference_context).get('in_flight_total'), INFERENCE_REPLICA_SET.get(inference_context).get('run_total')))
+
+
+def track_inference_pool(inference_context : str, inference_pool : InferencePool) -> InferencePool:
+	inference_replica : InferenceReplica =\
+	{
+		'in_flight_total': 0,
+		'run_total': 0,
+		'run_time': 0.0,
+		'start_time': time()
+	}
+
+	with INFERENCE_POOL_LOCK:
+		INFERENCE_REPLICA_SET[inference_context] = inference_replica
+
+	for inference_session in inference_pool.values():
+		inference_session.run = partial(run_inference_session, inference_replica, create_inference_batch(inference_session), create_inference_binding(inference_session), inference_session.run) #type:ignore[method-assign]
+	return inference_pool
+
+
+def run_inference_session(inference_replica : InferenceReplica, inference_batch : Optional[InferenceBatch], inference_binding : Optional[InferenceBinding], session_run : Callable[..., Any], output_names : Optional[List[str]], input_feed : Dict[str, Any], run_options : Any = None) -> Any:
+	start_time = time()
+
+	with INFERENCE_POOL_LOCK:
+		inference_replica['in_flight_total'] += 1
+
+	try:
+		if inference_batch and run_options is None and state_manager.get_item('execution_batch_size') and state_manager.get_item('execution_batch_size') > 1 and conditional_thread_semaphore() is NULL_CONTEXT:
+			return run_batched_inference(inference_batch, session_run, output_names, input_feed)
+		if inference_binding and run_options is None and state_manager.get_item('execution_io_binding'):
+			return run_bound_inference(inference_binding, session_run, output_names, input_feed)
+		return session_run(output_names, input_feed, run_options)
+	finally:
+		with INFERENCE_POOL_LOCK:
+			inference_replica['in_flight_total'] -= 1
+			inference_replica['run_total'] += 1
+			inference_replica['run_time'] += time() - start_time
+
+
+def report_inference_replicas() -> None:
+	with INFERENCE_POOL_LOCK:
+		inference_replica_items = list(INFERENCE_REPLICA_SET.items())
+
+	for inference_context, inference_replica in inference_replica_items:
+		if inference_replica.get('run_total'):
+			utilization = inference_replica.get('run_time') / max(time() - inference_replica.get('start_time'), 1e-6) * 100
+			logger.debug(translator.get('inference_replica_utilization').format(inference_context = inference_context, run_total = inference_replica.get('run_total'), utilization = round(min(utilization, 100), 2)), __name__)
+
+
+def get_inference_context_lock(inference_context : str) -> threading.Lock:
+	with INFERENCE_POOL_LOCK:
+		if inference_context not in INFERENCE_CONTEXT_LOCKS:
+			INFERENCE_CONTEXT_LOCKS[inference_context] = threading.Lock()
+		return INFERENCE_CONTEXT_LOCKS.get(inference_context)
+
+
 def create_inference_pool(model_source_set : DownloadSet, execution_device_id : int, execution_providers : List[ExecutionProvider]) -> InferencePool:
 	inference_pool : InferencePool = {}
 
 	for model_name in model_source_set.keys():
 		model_path = model_source_set.get(model_name).get('path')
 		if is_file(model_path):
-			inference_pool[model_name] = create_inference_session(model_path, execution_device_id, execution_providers)
+			inference_pool[model_name] = create_inference_session(resolve_model_path(model_path, execution_providers), execution_device_id, execution_providers)
 
 	return inference_pool
 
 
+def resolve_model_path(model_path : str, execution_providers : List[ExecutionProvider]) -> str:
+	quantize_manifest = read_json(get_quantize_manifest_path(model_path))
+
+	if state_manager.get_item('execution_int8') and execution_providers == [ 'cpu' ] and quantize_manifest and quantize_manifest.get('quantized') and quantize_manifest.get('model_hash') == resolve_file_hash(model_path) and is_file(get_quantize_model_path(model_path)):
+		return get_quantize_model_path(model_path)
+	return resolve_batch_model_path(model_path)
+
+
+def resolve_batch_model_path(model_path : str) -> str:
+	batch_manifest = read_json(get_batch_manifest_path(model_path))
+
+	if batch_manifest and batch_manifest.get('dynamic_batch') and batch_manifest.get('model_hash') == resolve_file_hash(model_path) and is_file(get_batch_model_path(model_path)):
+		return get_batch_model_path(model_path)
+	return model_path
+
+
+def get_batch_model_path(model_path : str) -> str:
+	model_directory_path, file_name_and_extension = os.path.split(model_path)
+	return os.path.join(model_directory_path, get_file_name(file_name_and_extension) + '.batch.onnx')
+
+
+def get_batch_manifest_path(model_path : str) -> str:
+	model_directory_path, file_name_and_extension = os.path.split(model_path)
+	return os.path.join(model_directory_path, get_file_name(file_name_and_extension) + '.batch.json')
+
+
+def get_quantize_model_path(model_path : str) -> str:
+	model_directory_path, file_name_and_extension = os.path.split(model_path)
+	return os.path.join(model_directory_path, get_file_name(file_name_and_extension) + '.int8.onnx')
+
+
+def get_quantize_manifest_path(model_path : str) -> str:
+	model_directory_path, file_name_and_extension = os.path.split(model_path)
+	return os.path.join(model_directory_path, get_file_name(file_name_and_extension) + '.int8.json')
+
+
 def clear_inference_pool(module_name : str, model_names : List[str]) -> None:
 	execution_device_ids = state_manager.get_item('execution_device_ids')
 	execution_providers = resolve_execution_providers(module_name)
@@ -63,23 +180,95 @@ def clear_inference_pool(module_name : str, model_names : List[str]) -> None:
 
 	for execution_device_id in execution_device_ids:
 		inference_context = get_inference_context(module_name, model_names, execution_device_id, execution_providers)
-		if INFERENCE_POOL_SET.get(app_context).get(inference_context):
-			del INFERENCE_POOL_SET[app_context][inference_context]
+
+		for current_inference_context in list(INFERENCE_POOL_SET.get(app_context).keys()):
+			if current_inference_context == inference_context or current_inference_context.startswith(inference_context + '.replica'):
+				del INFERENCE_POOL_SET[app_context][current_inference_context]
+
+	clear_inference_replicas()
+
+
+def clear_inference_replicas() -> None:
+	with INFERENCE_POOL_LOCK:
+		inference_contexts = set(INFERENCE_POOL_SET.get('cli')) | set(INFERENCE_POOL_SET.get('ui'))
+
+		for inference_context in list(INFERENCE_REPLICA_SET):
+			if inference_context not in inference_contexts:
+				del INFERENCE_REPLICA_SET[inference_context]
+
+		for inference_context in list(INFERENCE_CONTEXT_LOCKS):
+			if inference_context not in inference_contexts:
+				del INFERENCE_CONTEXT_LOCKS[inference_context]
 
 
 def create_inference_session(model_path : str, execution_device_id : int, execution_providers : List[ExecutionProvider]) -> InferenceSession:
 	model_file_name = get_file_name(model_path)
+	execution_optimization_level : ExecutionOptimizationLevel = state_manager.get_item('execution_optimization_level') or 'all'
+	optimized_model_path = get_optimized_model_path(model_path, execution_providers)
+	inference_session_providers = create_inference_session_providers(execution_device_id, execution_providers)
+	inference_session = None
 	start_time = time()
 
-	try:
-		inference_session_providers = create_inference_session_providers(execution_device_id, execution_providers)
-		inference_session = InferenceSession(model_path, providers = inference_session_providers)
+	if is_file(optimized_model_path):
+		inference_session = load_inference_session(optimized_model_path, create_inference_session_options('all' if execution_optimization_level == 'all' else 'disable'), inference_session_providers)
+
+		if not inference_session:
+			remove_file(optimized_model_path)
+
+	if not inference_session and optimized_model_path and create_directory(os.path.dirname(optimized_model_path)):
+		temp_optimized_model_path = optimized_model_path + '.' + str(os.getpid()) + '.tmp'
+		inference_session_options = create_inference_session_options(resolve_cache_optimization_level(execution_optimization_level))
+		inference_session_options.optimized_model_filepath = temp_optimized_model_path
+		inference_session = load_inference_session(model_path, inference_session_options, inference_session_providers)
+
+		if inference_session and is_file(temp_optimized_model_path):
+			os.replace(temp_optimized_model_path, optimized_model_path)
+		else:
+			remove_file(temp_optimized_model_path)
+
+	if not inference_session:
+		inference_session = load_inference_session(model_path, create_inference_session_options(execution_optimization_level), inference_session_providers)
+
+	if inference_session:
 		logger.debug(translator.get('loading_model_succeeded').format(model_name = model_file_name, seconds = calculate_end_time(start_time)), __name__)
 		return inference_session
 
+	logger.error(translator.get('loading_model_failed').format(model_name = model_file_name), __name__)
+	fatal_exit(1)
+
+
+def load_inference_session(model_path : str, inference_session_options : SessionOptions, inference_session_providers : List[InferenceSessionProvider]) -> Optional[InferenceSession]:
+	try:
+		return InferenceSession(model_path, sess_options = inference_session_options, providers = inference_session_providers)
 	except Exception:
-		logger.error(translator.get('loading_model_failed').format(model_name = model_file_name), __name__)
-		fatal_exit(1)
+		return None
+
+
+def create_inference_session_options(execution_optimization_level : ExecutionOptimizationLevel) -> SessionOptions:
+	inference_session_options = SessionOptions()
+	inference_session_options.graph_optimization_level = GRAPH_OPTIMIZATION_LEVEL_SET.get(execution_optimization_level)
+
+	if state_manager.get_item('execution_intra_op_thread_count'):
+		inference_session_options.intra_op_num_threads = state_manager.get_item('execution_intra_op_thread_count')
+	return inference_session_options
+
+
+def get_optimized_model_path(model_path : str, execution_providers : List[ExecutionProvider]) -> Optional[str]:
+	execution_optimization_level : ExecutionOptimizationLevel = state_manager.get_item('execution_optimization_level') or 'all'
+
+	if execution_optimization_level != 'disable' and all(execution_provider in [ 'cpu', 'cuda', 'rocm' ] for execution_provider in execution_providers):
+		model_hash = resolve_file_hash(model_path)
+
+		if model_hash:
+			optimized_model_name = '.'.join([ get_file_name(model_path), model_hash, '-'.join(execution_providers), onnxruntime.__version__, resolve_cache_optimization_level(execution_optimization_level) ])
+			return os.path.join('.caches', optimized_model_name + '.onnx')
+	return None
+
+
+def resolve_cache_optimization_level(execution_optimization_level : ExecutionOptimizationLevel) -> ExecutionOptimizationLevel:
+	if execution_optimization_level == 'all':
+		return 'extended'
+	return execution_optimization_level
 
 
 def get_inference_context(module_name : str, model_names : List[str], execution_device_id : int, execution_providers : List[ExecutionProvider]) -> str:
@@ -87,6 +276,12 @@ def get_inference_context(module_name : str, model_names : List[str], execution_
 	return inference_context
 
 
+def get_inference_replica_context(inference_context : str, execution_replica_index : int) -> str:
+	if execution_replica_index > 0:
+		return inference_context + '.replica' + str(execution_replica_index)
+	return inference_context
+
+
 def resolve_execution_providers(module_name : str) -> List[ExecutionProvider]:
 	module = importlib.import_module(module_name)
 
@@ -12,6 +12,12 @@ LOCALS : Locals =\
 		'extracting_frames': 'extracting frames with a resolution of {resolution} and {fps} frames per second',
 		'extracting_frames_succeeded': 'extracting frames succeeded',
 		'extracting_frames_failed': 'extracting frames failed',
+		'extracting_frames_skipped': 'extracting frames skipped',
+		'extracting_frames_cached': 'extracting frames reused from cache',
+		'resuming_frames': 'resuming after {frame_total} processed frames',
+		'streaming_frames': 'streaming frames with a resolution of {resolution} and {fps} frames per second',
+		'streaming_frames_succeeded': 'streaming frames succeeded',
+		'streaming_frames_failed': 'streaming frames failed',
 		'analysing': 'analysing',
 		'extracting': 'extracting',
 		'streaming': 'streaming',
@@ -28,6 +34,10 @@ LOCALS : Locals =\
 		'merging_video': 'merging video with a resolution of {resolution} and {fps} frames per second',
 		'merging_video_succeeded': 'merging video succeeded',
 		'merging_video_failed': 'merging video failed',
+		'processing_segments': 'processing {segment_total} segments in separate worker processes',
+		'processing_segment_failed': 'processing segment {segment_index} failed',
+		'concatenating_segments_succeeded': 'concatenating segments succeeded',
+		'concatenating_segments_failed': 'concatenating segments failed',
 		'skipping_audio': 'skipping audio',
 		'replacing_audio_succeeded': 'replacing audio succeeded',
 		'replacing_audio_skipped': 'replacing audio skipped',
@@ -86,6 +96,14 @@ LOCALS : Locals =\
 		'deleting_corrupt_source': 'deleting corrupt source for {source_file_name}',
 		'loading_model_succeeded': 'loading model {model_name} succeeded in {seconds} seconds',
 		'loading_model_failed': 'loading model {model_name} failed',
+		'preloading_models_succeeded': 'preloading models succeeded in {seconds} seconds',
+		'preparing_model_succeeded': 'model {model_name} prepared with a dynamic batch dimension',
+		'preparing_model_skipped': 'model {model_name} keeps its fixed batch dimension',
+		'quantizing_model_succeeded': 'model {model_name} quantized to int8 with {accuracy_delta}% output deviation',
+		'quantizing_model_rejected': 'model {model_name} stays unquantized with {accuracy_delta}% output deviation',
+		'quantizing_model_failed': 'model {model_name} could not be quantized',
+		'inference_replica_utilization': 'inference replica {inference_context} ran {run_total} times at {utilization}% utilization',
+		'face_store_utilization': 'face store hit {hit_total} times, missed {miss_total} times and evicted {evict_total} times',
 		'time_ago_now': 'just now',
 		'time_ago_minutes': '{minutes} minutes ago',
 		'time_ago_hours': '{hours} hours and {minutes} minutes ago',
@@ -113,6 +131,7 @@ LOCALS : Locals =\
 			'face_detector_margin': 'apply top, right, bottom and left margin to the frame',
 			'face_detector_angles': 'specify the angles to rotate the frame before detecting faces',
 			'face_detector_score': 'filter the detected faces based on the confidence score',
+			'face_detector_interval': 'run the face detector every n video frames and track the faces in between',
 			'face_landmarker_model': 'choose the model responsible for detecting the face landmarks',
 			'face_landmarker_score': 'filter the detected face landmarks based on the confidence score',
 			'face_selector_mode': 'use reference based tracking or simple matching',
@@ -135,6 +154,9 @@ LOCALS : Locals =\
 			'trim_frame_start': 'specify the starting frame of the target video',
 			'trim_frame_end': 'specify the ending frame of the target video',
 			'temp_frame_format': 'specify the temporary resources format',
+			'temp_frame_mode': 'specify whether the frames pass through the disk or stay in memory while processing',
+			'video_segment_count': 'split the trim range into segments that are processed by separate worker processes',
+			'frame_cache_limit': 'limit the disk space in gigabytes used to cache extracted and processed frames across runs',
 			'keep_temp': 'keep the temporary resources after processing',
 			'output_image_quality': 'specify the image quality which translates to the image compression',
 			'output_image_scale': 'specify the image scale based on the target image',
@@ -160,6 +182,14 @@ LOCALS : Locals =\
 			'execution_device_ids': 'specify the devices used for processing',
 			'execution_providers': 'inference using different providers (choices: {choices}, ...)',
 			'execution_thread_count': 'specify the amount of parallel threads while processing',
+			'execution_pool_type': 'choose whether frames are processed by threads or by worker processes that exchange frames through shared memory',
+			'execution_optimization_level': 'choose the graph optimization level applied to the models, optimized models are cached for the cpu, cuda and rocm execution providers',
+			'execution_intra_op_thread_count': 'specify the amount of threads used inside each inference session (0 = runtime default)',
+			'execution_replica_count': 'specify the amount of inference session replicas per model and device, requests go to the least loaded replica and run concurrently unless the execution provider requires serialized inference',
+			'execution_batch_size': 'specify the maximum amount of concurrent requests merged into one inference for models with a dynamic batch dimension (1 = off)',
+			'execution_batch_wait': 'specify the maximum milliseconds a request waits for others to join its batch',
+			'execution_io_binding': 'bind preallocated input and output buffers for fixed shape models',
+			'execution_int8': 'load the int8 models validated by quantize-models when running on the cpu execution provider',
 			'video_memory_strategy': 'balance fast processing and low VRAM usage',
 			'system_memory_limit': 'limit the available RAM that can be used while processing',
 			'log_level': 'adjust the message severity displayed in the terminal',
@@ -169,6 +199,8 @@ LOCALS : Locals =\
 			'headless_run': 'run the program in headless mode',
 			'batch_run': 'run the program in batch mode',
 			'force_download': 'force automate downloads and exit',
+			'prepare_models': 'rewrite the downloaded models to a dynamic batch dimension where possible and exit',
+			'quantize_models': 'quantize the downloaded enhancer and swapper models to int8, validate them on the faces of the source images and exit',
 			'benchmark': 'benchmark the program',
 			'job_id': 'specify the job id',
 			'job_status': 'specify the job status',
@@ -205,6 +237,7 @@ LOCALS : Locals =\
 			'download_providers_checkbox_group': 'DOWNLOAD PROVIDERS',
 			'execution_providers_checkbox_group': 'EXECUTION PROVIDERS',
 			'execution_thread_count_slider': 'EXECUTION THREAD COUNT',
+			'execution_pool_type_dropdown': 'EXECUTION POOL TYPE',
 			'face_detector_angles_checkbox_group': 'FACE DETECTOR ANGLES',
 			'face_detector_model_dropdown': 'FACE DETECTOR MODEL',
 			'face_detector_margin_slider': 'FACE DETECTOR MARGIN',
@@ -261,6 +294,7 @@ LOCALS : Locals =\
 			'system_memory_limit_slider': 'SYSTEM MEMORY LIMIT',
 			'target_file': 'TARGET',
 			'temp_frame_format_dropdown': 'TEMP FRAME FORMAT',
+			'temp_frame_mode_dropdown': 'TEMP FRAME MODE',
 			'terminal_textbox': 'TERMINAL',
 			'trim_frame_slider': 'TRIM FRAME',
 			'ui_workflow': 'UI WORKFLOW',
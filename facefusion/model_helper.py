@@ -1,11 +1,57 @@
+import os
+import tempfile
 from functools import lru_cache
+from typing import Optional
 
+import numpy
 import onnx
 
+from facefusion.filesystem import get_file_name, is_file
+from facefusion.hash_helper import resolve_file_hash
 from facefusion.types import ModelInitializer
 
 
 @lru_cache()
 def get_static_model_initializer(model_path : str) -> ModelInitializer:
+	model_initializer_path = get_model_initializer_path(model_path)
+
+	if is_file(model_initializer_path):
+		model_initializer = read_model_initializer(model_initializer_path)
+
+		if model_initializer is not None:
+			return model_initializer
+
 	model = onnx.load(model_path)
-	return onnx.numpy_helper.to_array(model.graph.initializer[-1])
+	model_initializer = onnx.numpy_helper.to_array(model.graph.initializer[-1])
+
+	if model_initializer_path:
+		write_model_initializer(model_initializer_path, model_initializer)
+	return model_initializer
+
+
+def get_model_initializer_path(model_path : str) -> Optional[str]:
+	model_hash = resolve_file_hash(model_path)
+
+	if model_hash:
+		model_directory_path, file_name_and_extension = os.path.split(model_path)
+		return os.path.join(model_directory_path, get_file_name(file_name_and_extension) + '.' + model_hash + '.npy')
+	return None
+
+
+def read_model_initializer(model_initializer_path : str) -> Optional[ModelInitializer]:
+	try:
+		return numpy.load(model_initializer_path, mmap_mode = 'r')
+	except (OSError, EOFError, ValueError):
+		return None
+
+
+def write_model_initializer(model_initializer_path : str, model_initializer : ModelInitializer) -> bool:
+	try:
+		model_initializer_descriptor, temp_model_initializer_path = tempfile.mkstemp(suffix = '.tmp', dir = os.path.dirname(model_initializer_path))
+
+		with os.fdopen(model_initializer_descriptor, 'wb') as model_initializer_file:
+			numpy.save(model_initializer_file, model_initializer)
+		os.replace(temp_model_initializer_path, model_initializer_path)
+	except OSError:
+		return False
+	return is_file(model_initializer_path)
@@ -0,0 +1,109 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from time import time
+from types import ModuleType
+from typing import List, Optional
+
+import numpy
+from onnxruntime import InferenceSession, NodeArg
+
+from facefusion import face_classifier, face_detector, face_landmarker, face_masker, face_recognizer, logger, state_manager, translator
+from facefusion.face_selector import resolve_face_attributes
+from facefusion.inference_binder import TENSOR_DTYPE_SET
+from facefusion.processors.core import collect_face_demands, get_processors_modules
+from facefusion.thread_helper import conditional_thread_semaphore
+from facefusion.time_helper import calculate_end_time
+from facefusion.types import Tensor
+
+PRELOAD_THREADS : List[threading.Thread] = []
+PRELOAD_EVENT : threading.Event = threading.Event()
+
+
+def collect_preload_modules() -> List[ModuleType]:
+	processor_modules = get_processors_modules(state_manager.get_item('processors'))
+	face_demands = collect_face_demands(processor_modules)
+	face_attributes = resolve_face_attributes(face_demands)
+	preload_modules = list(processor_modules)
+
+	if face_demands:
+		preload_modules.extend([ face_detector, face_landmarker ])
+
+		if 'source_face' in face_demands or 'embedding' in face_attributes:
+			preload_modules.append(face_recognizer)
+		if 'source_face' in face_demands or 'classification' in face_attributes:
+			preload_modules.append(face_classifier)
+		if 'occlusion' in state_manager.get_item('face_mask_types') or 'region' in state_manager.get_item('face_mask_types'):
+			preload_modules.append(face_masker)
+
+	return preload_modules
+
+
+def conditional_start_preload_models() -> None:
+	if state_manager.get_item('execution_pool_type') != 'process' and not (state_manager.get_item('video_segment_count') and state_manager.get_item('video_segment_count') > 1):
+		start_preload_models()
+
+
+def start_preload_models() -> threading.Thread:
+	preload_thread = threading.Thread(target = preload_models, args = (collect_preload_modules(),), daemon = True)
+	PRELOAD_EVENT.clear()
+	PRELOAD_THREADS.append(preload_thread)
+	preload_thread.start()
+	return preload_thread
+
+
+def stop_preload_models() -> None:
+	PRELOAD_EVENT.set()
+
+	while PRELOAD_THREADS:
+		PRELOAD_THREADS.pop().join()
+
+
+def preload_models(preload_modules : List[ModuleType]) -> None:
+	start_time = time()
+
+	with ThreadPoolExecutor(max_workers = max(len(preload_modules), 1)) as executor:
+		for preload_module in preload_modules:
+			executor.submit(preload_model, preload_module)
+
+	logger.debug(translator.get('preloading_models_succeeded').format(seconds = calculate_end_time(start_time)), __name__)
+
+
+def preload_model(preload_module : ModuleType) -> None:
+	execution_replica_total = len(state_manager.get_item('execution_device_ids')) * (state_manager.get_item('execution_replica_count') or 1)
+
+	for _ in range(execution_replica_total):
+		if PRELOAD_EVENT.is_set():
+			return
+
+		inference_pool = preload_module.get_inference_pool()
+
+		if inference_pool:
+			for inference_session in inference_pool.values():
+				warm_up_inference_session(inference_session)
+
+
+def warm_up_inference_session(inference_session : InferenceSession) -> bool:
+	inference_inputs = {}
+
+	for session_input in inference_session.get_inputs():
+		input_tensor = create_input_tensor(session_input)
+
+		if input_tensor is None:
+			return False
+		inference_inputs[session_input.name] = input_tensor
+
+	try:
+		with conditional_thread_semaphore():
+			inference_session.run(None, inference_inputs)
+	except Exception:
+		return False
+	return True
+
+
+def create_input_tensor(session_input : NodeArg) -> Optional[Tensor]:
+	input_dtype = TENSOR_DTYPE_SET.get(session_input.type)
+
+	if input_dtype:
+		input_shape = [ input_dimension if isinstance(input_dimension, int) and input_dimension > 0 else 1 for input_dimension in session_input.shape ]
+		return numpy.zeros(input_shape, dtype = input_dtype)
+	return None
@@ -0,0 +1,218 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+import cv2
+import numpy
+import onnx
+from onnxruntime import InferenceSession
+from onnxruntime.quantization import QuantType, quantize_dynamic
+
+from facefusion import logger, translator
+from facefusion.face_analyser import get_many_faces
+from facefusion.face_helper import warp_face_by_face_landmark_5
+from facefusion.filesystem import filter_image_paths, get_file_name, is_file, remove_file
+from facefusion.hash_helper import create_file_hash, get_hash_path, resolve_file_hash
+from facefusion.inference_manager import get_batch_manifest_path, get_batch_model_path, get_quantize_manifest_path, get_quantize_model_path, resolve_batch_model_path
+from facefusion.json import write_json
+from facefusion.model_preloader import create_input_tensor
+from facefusion.types import Tensor, ValidationCrop, VisionFrame
+from facefusion.vision import read_static_images
+
+QUANTIZE_ACCURACY_LIMIT : float = 1.0
+QUANTIZE_INPUT_RANGES : List[Tuple[float, float]] = [ (0, 1), (-1, 1) ]
+
+
+def prepare_models(model_paths : List[str]) -> int:
+	prepare_total = 0
+
+	for model_path in model_paths:
+		if prepare_model(model_path):
+			logger.info(translator.get('preparing_model_succeeded').format(model_name = get_file_name(model_path)), __name__)
+			prepare_total += 1
+		else:
+			logger.info(translator.get('preparing_model_skipped').format(model_name = get_file_name(model_path)), __name__)
+	return prepare_total
+
+
+def prepare_model(model_path : str) -> bool:
+	batch_model_path = get_batch_model_path(model_path)
+	model = onnx.load(model_path)
+	dynamic_batch = False
+
+	if rewrite_batch_dimension(model.graph):
+		onnx.save(model, batch_model_path)
+		dynamic_batch = verify_batch_model(model_path, batch_model_path)
+
+	if dynamic_batch:
+		write_model_hash(batch_model_path)
+	else:
+		remove_file(get_hash_path(batch_model_path))
+		remove_file(batch_model_path)
+
+	return write_json(get_batch_manifest_path(model_path),
+	{
+		'model_hash': resolve_file_hash(model_path),
+		'dynamic_batch': dynamic_batch
+	}) and dynamic_batch
+
+
+def rewrite_batch_dimension(model_graph : onnx.GraphProto) -> bool:
+	initializer_names = [ initializer.name for initializer in model_graph.initializer ]
+	model_nodes = [ model_input for model_input in model_graph.input if model_input.name not in initializer_names ] + list(model_graph.output)
+
+	for model_node in model_nodes:
+		model_dimensions = model_node.type.tensor_type.shape.dim
+
+		if not model_dimensions:
+			return False
+		if model_dimensions[0].HasField('dim_value') and model_dimensions[0].dim_value != 1:
+			return False
+
+	for model_node in model_nodes:
+		model_node.type.tensor_type.shape.dim[0].dim_param = 'batch'
+
+	del model_graph.value_info[:]
+	return True
+
+
+def verify_batch_model(model_path : str, batch_model_path : str) -> bool:
+	try:
+		inference_session = InferenceSession(model_path, providers = [ 'CPUExecutionProvider' ])
+		batch_inference_session = InferenceSession(batch_model_path, providers = [ 'CPUExecutionProvider' ])
+		input_feeds = [ create_random_input_feed(inference_session), create_random_input_feed(inference_session) ]
+		output_feeds = [ inference_session.run(None, input_feed) for input_feed in input_feeds ]
+		batch_input_feed = { input_name: numpy.concatenate([ input_feed.get(input_name) for input_feed in input_feeds ]) for input_name in input_feeds[0] }
+		batch_output_feed = batch_inference_session.run(None, batch_input_feed)
+
+		for batch_index, output_feed in enumerate(output_feeds):
+			for output_tensor, batch_output_tensor in zip(output_feed, batch_output_feed):
+				if not numpy.allclose(output_tensor, batch_output_tensor[batch_index:batch_index + 1], rtol = 1e-3, atol = 1e-4):
+					return False
+	except Exception:
+		return False
+	return True
+
+
+def create_random_input_feed(inference_session : InferenceSession) -> Dict[str, Tensor]:
+	input_feed = {}
+
+	for session_input in inference_session.get_inputs():
+		input_tensor = create_input_tensor(session_input)
+
+		if input_tensor is not None:
+			input_feed[session_input.name] = numpy.random.rand(*input_tensor.shape).astype(input_tensor.dtype)
+	return input_feed
+
+
+def create_validation_crops(image_paths : List[str]) -> List[ValidationCrop]:
+	validation_crops : List[ValidationCrop] = []
+
+	for vision_frame in read_static_images(filter_image_paths(image_paths)):
+		for face in get_many_faces([ vision_frame ]):
+			crop_vision_frame, _ = warp_face_by_face_landmark_5(vision_frame, face.landmark_set.get('5/68'), 'ffhq_512', (512, 512))
+			validation_crops.append(
+			{
+				'crop_vision_frame': crop_vision_frame,
+				'face_embedding': face.embedding_norm
+			})
+	return validation_crops
+
+
+def quantize_models(model_paths : List[str], validation_crops : List[ValidationCrop]) -> int:
+	quantize_total = 0
+
+	for model_path in model_paths:
+		accuracy_delta = quantize_model(model_path, validation_crops)
+
+		if accuracy_delta is None:
+			logger.warn(translator.get('quantizing_model_failed').format(model_name = get_file_name(model_path)), __name__)
+		elif accuracy_delta > QUANTIZE_ACCURACY_LIMIT:
+			logger.warn(translator.get('quantizing_model_rejected').format(model_name = get_file_name(model_path), accuracy_delta = round(accuracy_delta, 2)), __name__)
+		else:
+			logger.info(translator.get('quantizing_model_succeeded').format(model_name = get_file_name(model_path), accuracy_delta = round(accuracy_delta, 2)), __name__)
+			quantize_total += 1
+	return quantize_total
+
+
+def quantize_model(model_path : str, validation_crops : List[ValidationCrop]) -> Optional[float]:
+	quantize_model_path = get_quantize_model_path(model_path)
+	accuracy_delta = None
+
+	try:
+		quantize_dynamic(resolve_batch_model_path(model_path), quantize_model_path, weight_type = QuantType.QUInt8)
+		accuracy_delta = calculate_accuracy_delta(resolve_batch_model_path(model_path), quantize_model_path, validation_crops)
+	except Exception:
+		pass
+
+	quantized = accuracy_delta is not None and accuracy_delta <= QUANTIZE_ACCURACY_LIMIT
+
+	if quantized:
+		write_model_hash(quantize_model_path)
+	else:
+		remove_file(get_hash_path(quantize_model_path))
+		remove_file(quantize_model_path)
+
+	write_json(get_quantize_manifest_path(model_path),
+	{
+		'model_hash': resolve_file_hash(model_path),
+		'accuracy_delta': accuracy_delta,
+		'quantized': quantized
+	})
+	return accuracy_delta
+
+
+def calculate_accuracy_delta(model_path : str, quantize_model_path : str, validation_crops : List[ValidationCrop]) -> Optional[float]:
+	inference_session = InferenceSession(model_path, providers = [ 'CPUExecutionProvider' ])
+	quantize_inference_session = InferenceSession(quantize_model_path, providers = [ 'CPUExecutionProvider' ])
+	accuracy_deltas = []
+
+	for validation_crop in validation_crops:
+		for input_feed in create_validation_input_feeds(inference_session, validation_crop):
+			output_feed = inference_session.run(None, input_feed)
+			quantize_output_feed = quantize_inference_session.run(None, input_feed)
+
+			for output_tensor, quantize_output_tensor in zip(output_feed, quantize_output_feed):
+				output_tensor = output_tensor.astype(numpy.float64)
+				accuracy_deltas.append(numpy.abs(output_tensor - quantize_output_tensor).mean() / max(numpy.abs(output_tensor).mean(), 1e-6) * 100)
+
+	if accuracy_deltas:
+		return float(max(accuracy_deltas))
+	return None
+
+
+def create_validation_input_feeds(inference_session : InferenceSession, validation_crop : ValidationCrop) -> List[Dict[str, Tensor]]:
+	input_feeds = []
+
+	for input_range in QUANTIZE_INPUT_RANGES:
+		input_feed = {}
+
+		for session_input in inference_session.get_inputs():
+			input_tensor = create_input_tensor(session_input)
+
+			if input_tensor is not None:
+				if input_tensor.ndim == 4 and input_tensor.shape[1] == 3:
+					input_feed[session_input.name] = prepare_validation_frame(validation_crop.get('crop_vision_frame'), session_input.shape, input_range).astype(input_tensor.dtype)
+				elif input_tensor.ndim == 2 and input_tensor.shape[1] == validation_crop.get('face_embedding').shape[0]:
+					input_feed[session_input.name] = validation_crop.get('face_embedding').reshape(input_tensor.shape).astype(input_tensor.dtype)
+				else:
+					input_feed[session_input.name] = numpy.random.rand(*input_tensor.shape).astype(input_tensor.dtype)
+		input_feeds.append(input_feed)
+	return input_feeds
+
+
+def prepare_validation_frame(crop_vision_frame : VisionFrame, input_shape : List[Any], input_range : Tuple[float, float]) -> VisionFrame:
+	crop_height, crop_width = crop_vision_frame.shape[:2]
+	input_height = input_shape[2] if isinstance(input_shape[2], int) and input_shape[2] > 0 else crop_height
+	input_width = input_shape[3] if isinstance(input_shape[3], int) and input_shape[3] > 0 else crop_width
+	crop_vision_frame = cv2.resize(crop_vision_frame, (input_width, input_height))
+	crop_vision_frame = crop_vision_frame[:, :, ::-1] / 255.0
+	crop_vision_frame = crop_vision_frame * (input_range[1] - input_range[0]) + input_range[0]
+	crop_vision_frame = numpy.expand_dims(crop_vision_frame.transpose(2, 0, 1), axis = 0)
+	return crop_vision_frame
+
+
+def write_model_hash(model_path : str) -> bool:
+	hash_path = get_hash_path(model_path)
+
+	with open(hash_path, 'w') as hash_file:
+		hash_file.write(create_file_hash(model_path))
+	return is_file(hash_path)
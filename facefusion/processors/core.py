@@ -4,6 +4,7 @@ from typing import Any, List
 
 from facefusion import logger, translator
 from facefusion.exit_helper import hard_exit
+from facefusion.types import FaceDemand
 
 
 PROCESSORS_METHODS =\
@@ -12,6 +13,7 @@ PROCESSORS_METHODS =\
 	'clear_inference_pool',
 	'register_args',
 	'apply_args',
+	'resolve_face_demands',
 	'pre_check',
 	'pre_process',
 	'post_process',
@@ -42,3 +44,13 @@ def get_processors_modules(processors : List[str]) -> List[ModuleType]:
 		processor_module = load_processor_module(processor)
 		processor_modules.append(processor_module)
 	return processor_modules
+
+
+def collect_face_demands(processor_modules : List[ModuleType]) -> List[FaceDemand]:
+	face_demands : List[FaceDemand] = []
+
+	for processor_module in processor_modules:
+		for face_demand in processor_module.resolve_face_demands():
+			if face_demand not in face_demands:
+				face_demands.append(face_demand)
+	return face_demands
@@ -2,11 +2,11 @@ from typing import Any, Literal, TypeAlias, TypedDict
 
 from numpy.typing import NDArray
 
-from facefusion.types import Mask, VisionFrame
+from facefusion.types import FaceContext, Mask, VisionFrame
 
 AgeModifierInputs = TypedDict('AgeModifierInputs',
 {
-	'reference_vision_frame' : VisionFrame,
+	'face_context' : FaceContext,
 	'target_vision_frame' : VisionFrame,
 	'temp_vision_frame' : VisionFrame,
 	'temp_vision_mask' : Mask
@@ -18,8 +18,8 @@ from facefusion.processors.modules.background_remover.types import BackgroundRem
 from facefusion.processors.types import ProcessorOutputs
 from facefusion.program_helper import find_argument_group
 from facefusion.sanitizer import sanitize_int_range
-from facefusion.thread_helper import thread_semaphore
-from facefusion.types import ApplyStateItem, Args, DownloadScope, ExecutionProvider, InferencePool, Mask, ModelOptions, ModelSet, ProcessMode, VisionFrame
+from facefusion.thread_helper import conditional_inference_semaphore
+from facefusion.types import ApplyStateItem, Args, DownloadScope, ExecutionProvider, FaceDemand, InferencePool, Mask, ModelOptions, ModelSet, ProcessMode, VisionFrame
 from facefusion.vision import read_static_image, read_static_video_frame
 
 
@@ -430,6 +430,10 @@ def apply_args(args : Args, apply_state_item : ApplyStateItem) -> None:
 	apply_state_item('background_remover_color', normalize_color(args.get('background_remover_color')))
 
 
+def resolve_face_demands() -> List[FaceDemand]:
+	return []
+
+
 def pre_check() -> bool:
 	model_hash_set = get_model_options().get('hashes')
 	model_source_set = get_model_options().get('sources')
@@ -472,7 +476,7 @@ def forward(temp_vision_frame : VisionFrame) -> VisionFrame:
 	background_remover = get_inference_pool().get('background_remover')
 	model_name = state_manager.get_item('background_remover_model')
 
-	with thread_semaphore():
+	with conditional_inference_semaphore():
 		remove_vision_frame = background_remover.run(None,
 		{
 			'input': temp_vision_frame
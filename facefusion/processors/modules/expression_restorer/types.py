@@ -1,10 +1,10 @@
 from typing import List, Literal, TypedDict
 
-from facefusion.types import Mask, VisionFrame
+from facefusion.types import FaceContext, Mask, VisionFrame
 
 ExpressionRestorerInputs = TypedDict('ExpressionRestorerInputs',
 {
-	'reference_vision_frame' : VisionFrame,
+	'face_context' : FaceContext,
 	'source_vision_frames' : List[VisionFrame],
 	'target_vision_frame' : VisionFrame,
 	'temp_vision_frame' : VisionFrame,
@@ -1,4 +1,5 @@
 from argparse import ArgumentParser
+from typing import List
 
 import cv2
 import numpy
@@ -9,13 +10,12 @@ from facefusion import config, content_analyser, face_classifier, face_detector,
 from facefusion.face_analyser import scale_face
 from facefusion.face_helper import warp_face_by_face_landmark_5
 from facefusion.face_masker import create_area_mask, create_box_mask, create_occlusion_mask, create_region_mask
-from facefusion.face_selector import select_faces
 from facefusion.filesystem import in_directory, is_image, is_video, same_file_extension
 from facefusion.processors.modules.face_debugger import choices as face_debugger_choices
 from facefusion.processors.modules.face_debugger.types import FaceDebuggerInputs
 from facefusion.processors.types import ProcessorOutputs
 from facefusion.program_helper import find_argument_group
-from facefusion.types import ApplyStateItem, Args, Face, InferencePool, ProcessMode, VisionFrame
+from facefusion.types import ApplyStateItem, Args, Face, FaceDemand, InferencePool, ProcessMode, VisionFrame
 from facefusion.vision import read_static_image, read_static_video_frame
 
 
@@ -38,6 +38,10 @@ def apply_args(args : Args, apply_state_item : ApplyStateItem) -> None:
 	apply_state_item('face_debugger_items', args.get('face_debugger_items'))
 
 
+def resolve_face_demands() -> List[FaceDemand]:
+	return [ 'target_faces' ]
+
+
 def pre_check() -> bool:
 	return True
 
@@ -219,11 +223,11 @@ def draw_face_landmark_68_5(target_face : Face, temp_vision_frame : VisionFrame)
 
 
 def process_frame(inputs : FaceDebuggerInputs) -> ProcessorOutputs:
-	reference_vision_frame = inputs.get('reference_vision_frame')
+	face_context = inputs.get('face_context')
 	target_vision_frame = inputs.get('target_vision_frame')
 	temp_vision_frame = inputs.get('temp_vision_frame')
 	temp_vision_mask = inputs.get('temp_vision_mask')
-	target_faces = select_faces(reference_vision_frame, target_vision_frame)
+	target_faces = face_context.target_faces
 
 	if target_faces:
 		for target_face in target_faces:
@@ -1,10 +1,10 @@
 from typing import Literal, TypedDict
 
-from facefusion.types import Mask, VisionFrame
+from facefusion.types import FaceContext, Mask, VisionFrame
 
 FaceEditorInputs = TypedDict('FaceEditorInputs',
 {
-	'reference_vision_frame' : VisionFrame,
+	'face_context' : FaceContext,
 	'target_vision_frame' : VisionFrame,
 	'temp_vision_frame' : VisionFrame,
 	'temp_vision_mask' : Mask
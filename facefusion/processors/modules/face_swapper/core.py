@@ -1,6 +1,6 @@
 from argparse import ArgumentParser
 from functools import lru_cache
-from typing import List, Optional, Tuple
+from typing import Dict, List, Tuple
 
 import cv2
 import numpy
@@ -12,11 +12,12 @@ from facefusion import config, content_analyser, face_classifier, face_detector,
 from facefusion.common_helper import get_first, is_macos
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url
 from facefusion.execution import has_execution_provider
-from facefusion.face_analyser import get_average_face, get_many_faces, get_one_face, scale_face
+from facefusion.face_analyser import get_many_faces, get_one_face, scale_face
 from facefusion.face_helper import paste_back, warp_face_by_face_landmark_5
 from facefusion.face_masker import create_area_mask, create_box_mask, create_occlusion_mask, create_region_mask
-from facefusion.face_selector import select_faces, sort_faces_by_order
 from facefusion.filesystem import filter_image_paths, has_image, in_directory, is_image, is_video, resolve_relative_path, same_file_extension
+from facefusion.hash_helper import create_hash
+from facefusion.inference_batcher import has_dynamic_batch
 from facefusion.model_helper import get_static_model_initializer
 from facefusion.processors.modules.face_swapper import choices as face_swapper_choices
 from facefusion.processors.modules.face_swapper.types import FaceSwapperInputs
@@ -24,9 +25,11 @@ from facefusion.processors.pixel_boost import explode_pixel_boost, implode_pixel
 from facefusion.processors.types import ProcessorOutputs
 from facefusion.program_helper import find_argument_group
 from facefusion.thread_helper import conditional_thread_semaphore
-from facefusion.types import ApplyStateItem, Args, DownloadScope, Embedding, Face, InferencePool, ModelOptions, ModelSet, ProcessMode, VisionFrame
+from facefusion.types import ApplyStateItem, Args, DownloadScope, Embedding, Face, FaceDemand, InferencePool, ModelOptions, ModelSet, ProcessMode, VisionFrame
 from facefusion.vision import read_static_image, read_static_images, read_static_video_frame, unpack_resolution
 
+SOURCE_EMBEDDING_SET : Dict[str, Embedding] = {}
+
 
 @lru_cache()
 def create_static_model_set(download_scope : DownloadScope) -> ModelSet:
@@ -527,6 +530,10 @@ def apply_args(args : Args, apply_state_item : ApplyStateItem) -> None:
 	apply_state_item('face_swapper_weight', args.get('face_swapper_weight'))
 
 
+def resolve_face_demands() -> List[FaceDemand]:
+	return [ 'source_face', 'target_faces', 'target_embedding' ]
+
+
 def pre_check() -> bool:
 	model_hash_set = get_model_options().get('hashes')
 	model_source_set = get_model_options().get('sources')
@@ -563,6 +570,7 @@ def pre_process(mode : ProcessMode) -> bool:
 
 
 def post_process() -> None:
+	SOURCE_EMBEDDING_SET.clear()
 	read_static_image.cache_clear()
 	read_static_video_frame.cache_clear()
 	video_manager.clear_video_pool()
@@ -578,46 +586,65 @@ def post_process() -> None:
 		face_recognizer.clear_inference_pool()
 
 
-def swap_face(source_face : Face, target_face : Face, temp_vision_frame : VisionFrame) -> VisionFrame:
+def swap_faces(source_face : Face, target_faces : List[Face], temp_vision_frame : VisionFrame) -> VisionFrame:
 	model_template = get_model_options().get('template')
 	model_size = get_model_options().get('size')
 	pixel_boost_size = unpack_resolution(state_manager.get_item('face_swapper_pixel_boost'))
 	pixel_boost_total = pixel_boost_size[0] // model_size[0]
-	crop_vision_frame, affine_matrix = warp_face_by_face_landmark_5(temp_vision_frame, target_face.landmark_set.get('5/68'), model_template, pixel_boost_size)
-	temp_vision_frames = []
-	crop_masks = []
+	crop_vision_frames = []
+	affine_matrices = []
+	crop_masks_set = []
+
+	for target_face in target_faces:
+		crop_vision_frame, affine_matrix = warp_face_by_face_landmark_5(temp_vision_frame, target_face.landmark_set.get('5/68'), model_template, pixel_boost_size)
+		crop_masks = []
+
+		if 'box' in state_manager.get_item('face_mask_types'):
+			box_mask = create_box_mask(crop_vision_frame, state_manager.get_item('face_mask_blur'), state_manager.get_item('face_mask_padding'))
+			crop_masks.append(box_mask)
+
+		if 'occlusion' in state_manager.get_item('face_mask_types'):
+			occlusion_mask = create_occlusion_mask(crop_vision_frame)
+			crop_masks.append(occlusion_mask)
+
+		crop_vision_frames.append(crop_vision_frame)
+		affine_matrices.append(affine_matrix)
+		crop_masks_set.append(crop_masks)
+
+	pixel_boost_vision_frames = [ pixel_boost_vision_frame for crop_vision_frame in crop_vision_frames for pixel_boost_vision_frame in implode_pixel_boost(crop_vision_frame, pixel_boost_total, model_size) ]
+	pixel_boost_target_faces = [ target_face for target_face in target_faces for _ in range(pixel_boost_total ** 2) ]
+	pixel_boost_vision_frames = forward_swap_faces(source_face, pixel_boost_target_faces, pixel_boost_vision_frames)
+
+	for index, (target_face, affine_matrix, crop_masks) in enumerate(zip(target_faces, affine_matrices, crop_masks_set)):
+		temp_vision_frames = pixel_boost_vision_frames[index * pixel_boost_total ** 2:(index + 1) * pixel_boost_total ** 2]
+		crop_vision_frame = explode_pixel_boost(temp_vision_frames, pixel_boost_total, model_size, pixel_boost_size)
 
-	if 'box' in state_manager.get_item('face_mask_types'):
-		box_mask = create_box_mask(crop_vision_frame, state_manager.get_item('face_mask_blur'), state_manager.get_item('face_mask_padding'))
-		crop_masks.append(box_mask)
+		if 'area' in state_manager.get_item('face_mask_types'):
+			face_landmark_68 = cv2.transform(target_face.landmark_set.get('68').reshape(1, -1, 2), affine_matrix).reshape(-1, 2)
+			area_mask = create_area_mask(crop_vision_frame, face_landmark_68, state_manager.get_item('face_mask_areas'))
+			crop_masks.append(area_mask)
 
-	if 'occlusion' in state_manager.get_item('face_mask_types'):
-		occlusion_mask = create_occlusion_mask(crop_vision_frame)
-		crop_masks.append(occlusion_mask)
+		if 'region' in state_manager.get_item('face_mask_types'):
+			region_mask = create_region_mask(crop_vision_frame, state_manager.get_item('face_mask_regions'))
+			crop_masks.append(region_mask)
 
-	pixel_boost_vision_frames = implode_pixel_boost(crop_vision_frame, pixel_boost_total, model_size)
-	for pixel_boost_vision_frame in pixel_boost_vision_frames:
-		pixel_boost_vision_frame = prepare_crop_frame(pixel_boost_vision_frame)
-		pixel_boost_vision_frame = forward_swap_face(source_face, target_face, pixel_boost_vision_frame)
-		pixel_boost_vision_frame = normalize_crop_frame(pixel_boost_vision_frame)
-		temp_vision_frames.append(pixel_boost_vision_frame)
-	crop_vision_frame = explode_pixel_boost(temp_vision_frames, pixel_boost_total, model_size, pixel_boost_size)
+		crop_mask = numpy.minimum.reduce(crop_masks).clip(0, 1)
+		temp_vision_frame = paste_back(temp_vision_frame, crop_vision_frame, crop_mask, affine_matrix)
+	return temp_vision_frame
 
-	if 'area' in state_manager.get_item('face_mask_types'):
-		face_landmark_68 = cv2.transform(target_face.landmark_set.get('68').reshape(1, -1, 2), affine_matrix).reshape(-1, 2)
-		area_mask = create_area_mask(crop_vision_frame, face_landmark_68, state_manager.get_item('face_mask_areas'))
-		crop_masks.append(area_mask)
 
-	if 'region' in state_manager.get_item('face_mask_types'):
-		region_mask = create_region_mask(crop_vision_frame, state_manager.get_item('face_mask_regions'))
-		crop_masks.append(region_mask)
+def forward_swap_faces(source_face : Face, target_faces : List[Face], crop_vision_frames : List[VisionFrame]) -> List[VisionFrame]:
+	crop_vision_frames = [ prepare_crop_frame(crop_vision_frame) for crop_vision_frame in crop_vision_frames ]
 
-	crop_mask = numpy.minimum.reduce(crop_masks).clip(0, 1)
-	paste_vision_frame = paste_back(temp_vision_frame, crop_vision_frame, crop_mask, affine_matrix)
-	return paste_vision_frame
+	if has_dynamic_batch(get_inference_pool().get('face_swapper')):
+		crop_vision_frames = list(forward_swap_face(source_face, target_faces, numpy.concatenate(crop_vision_frames)))
+	else:
+		crop_vision_frames = [ forward_swap_face(source_face, [ target_face ], crop_vision_frame)[0] for target_face, crop_vision_frame in zip(target_faces, crop_vision_frames) ]
 
+	return [ normalize_crop_frame(crop_vision_frame) for crop_vision_frame in crop_vision_frames ]
 
-def forward_swap_face(source_face : Face, target_face : Face, crop_vision_frame : VisionFrame) -> VisionFrame:
+
+def forward_swap_face(source_face : Face, target_faces : List[Face], crop_vision_frame : VisionFrame) -> VisionFrame:
 	face_swapper = get_inference_pool().get('face_swapper')
 	model_type = get_model_options().get('type')
 	face_swapper_inputs = {}
@@ -628,16 +655,16 @@ def forward_swap_face(source_face : Face, target_face : Face, crop_vision_frame
 	for face_swapper_input in face_swapper.get_inputs():
 		if face_swapper_input.name == 'source':
 			if model_type in [ 'blendswap', 'uniface' ]:
-				face_swapper_inputs[face_swapper_input.name] = prepare_source_frame(source_face)
+				source_vision_frame = prepare_source_frame(source_face)
+				face_swapper_inputs[face_swapper_input.name] = numpy.repeat(source_vision_frame, len(target_faces), axis = 0)
 			else:
 				source_embedding = prepare_source_embedding(source_face)
-				source_embedding = balance_source_embedding(source_embedding, target_face.embedding)
-				face_swapper_inputs[face_swapper_input.name] = source_embedding
+				face_swapper_inputs[face_swapper_input.name] = numpy.concatenate([ balance_source_embedding(source_embedding, target_face.embedding) for target_face in target_faces ])
 		if face_swapper_input.name == 'target':
 			face_swapper_inputs[face_swapper_input.name] = crop_vision_frame
 
 	with conditional_thread_semaphore():
-		crop_vision_frame = face_swapper.run(None, face_swapper_inputs)[0][0]
+		crop_vision_frame = face_swapper.run(None, face_swapper_inputs)[0]
 
 	return crop_vision_frame
 
@@ -671,6 +698,14 @@ def prepare_source_frame(source_face : Face) -> VisionFrame:
 
 
 def prepare_source_embedding(source_face : Face) -> Embedding:
+	source_embedding_key = get_model_name() + '.' + create_hash(source_face.embedding.tobytes())
+
+	if source_embedding_key not in SOURCE_EMBEDDING_SET:
+		SOURCE_EMBEDDING_SET[source_embedding_key] = calculate_source_embedding(source_face)
+	return SOURCE_EMBEDDING_SET.get(source_embedding_key)
+
+
+def calculate_source_embedding(source_face : Face) -> Embedding:
 	model_type = get_model_options().get('type')
 
 	if model_type == 'ghost':
@@ -743,32 +778,16 @@ def normalize_crop_frame(crop_vision_frame : VisionFrame) -> VisionFrame:
 	return crop_vision_frame
 
 
-def extract_source_face(source_vision_frames : List[VisionFrame]) -> Optional[Face]:
-	source_faces = []
-
-	if source_vision_frames:
-		for source_vision_frame in source_vision_frames:
-			temp_faces = get_many_faces([source_vision_frame])
-			temp_faces = sort_faces_by_order(temp_faces, 'large-small')
-
-			if temp_faces:
-				source_faces.append(get_first(temp_faces))
-
-	return get_average_face(source_faces)
-
-
 def process_frame(inputs : FaceSwapperInputs) -> ProcessorOutputs:
-	reference_vision_frame = inputs.get('reference_vision_frame')
-	source_vision_frames = inputs.get('source_vision_frames')
+	face_context = inputs.get('face_context')
 	target_vision_frame = inputs.get('target_vision_frame')
 	temp_vision_frame = inputs.get('temp_vision_frame')
 	temp_vision_mask = inputs.get('temp_vision_mask')
-	source_face = extract_source_face(source_vision_frames)
-	target_faces = select_faces(reference_vision_frame, target_vision_frame)
+	source_face = face_context.source_face
+	target_faces = face_context.target_faces
 
 	if source_face and target_faces:
-		for target_face in target_faces:
-			target_face = scale_face(target_face, target_vision_frame, temp_vision_frame)
-			temp_vision_frame = swap_face(source_face, target_face, temp_vision_frame)
+		target_faces = [ scale_face(target_face, target_vision_frame, temp_vision_frame) for target_face in target_faces ]
+		temp_vision_frame = swap_faces(source_face, target_faces, temp_vision_frame)
 
 	return temp_vision_frame, temp_vision_mask
@@ -1,11 +1,10 @@
 from typing import Dict, List, Literal, TypeAlias, TypedDict
 
-from facefusion.types import Mask, VisionFrame
+from facefusion.types import FaceContext, Mask, VisionFrame
 
 FaceSwapperInputs = TypedDict('FaceSwapperInputs',
 {
-	'reference_vision_frame' : VisionFrame,
-	'source_vision_frames' : List[VisionFrame],
+	'face_context' : FaceContext,
 	'target_vision_frame' : VisionFrame,
 	'temp_vision_frame' : VisionFrame,
 	'temp_vision_mask' : Mask
@@ -2,11 +2,11 @@ from typing import Any, Literal, TypeAlias, TypedDict
 
 from numpy.typing import NDArray
 
-from facefusion.types import AudioFrame, Mask, VisionFrame
+from facefusion.types import AudioFrame, FaceContext, Mask, VisionFrame
 
 LipSyncerInputs = TypedDict('LipSyncerInputs',
 {
-	'reference_vision_frame' : VisionFrame,
+	'face_context' : FaceContext,
 	'source_voice_frame' : AudioFrame,
 	'target_vision_frame' : VisionFrame,
 	'temp_vision_frame' : VisionFrame,
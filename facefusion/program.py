@@ -104,7 +104,8 @@ def create_face_detector_program() -> ArgumentParser:
 	group_face_detector.add_argument('--face-detector-margin', help = translator.get('help.face_detector_margin'), type = partial(sanitize_int_range, int_range = facefusion.choices.face_detector_margin_range), default = config.get_int_list('face_detector', 'face_detector_margin', '0 0 0 0'), nargs = '+')
 	group_face_detector.add_argument('--face-detector-angles', help = translator.get('help.face_detector_angles'), type = int, default = config.get_int_list('face_detector', 'face_detector_angles', '0'), choices = facefusion.choices.face_detector_angles, nargs = '+', metavar = 'FACE_DETECTOR_ANGLES')
 	group_face_detector.add_argument('--face-detector-score', help = translator.get('help.face_detector_score'), type = float, default = config.get_float_value('face_detector', 'face_detector_score', '0.5'), choices = facefusion.choices.face_detector_score_range, metavar = create_float_metavar(facefusion.choices.face_detector_score_range))
-	job_store.register_step_keys([ 'face_detector_model', 'face_detector_size', 'face_detector_margin', 'face_detector_angles', 'face_detector_score' ])
+	group_face_detector.add_argument('--face-detector-interval', help = translator.get('help.face_detector_interval'), type = int, default = config.get_int_value('face_detector', 'face_detector_interval', '1'), choices = facefusion.choices.face_detector_interval_range, metavar = create_int_metavar(facefusion.choices.face_detector_interval_range))
+	job_store.register_step_keys([ 'face_detector_model', 'face_detector_size', 'face_detector_margin', 'face_detector_angles', 'face_detector_score', 'face_detector_interval' ])
 	return program
 
 
@@ -161,8 +162,12 @@ def create_frame_extraction_program() -> ArgumentParser:
 	group_frame_extraction.add_argument('--trim-frame-start', help = translator.get('help.trim_frame_start'), type = int, default = facefusion.config.get_int_value('frame_extraction', 'trim_frame_start'))
 	group_frame_extraction.add_argument('--trim-frame-end', help = translator.get('help.trim_frame_end'), type = int, default = facefusion.config.get_int_value('frame_extraction', 'trim_frame_end'))
 	group_frame_extraction.add_argument('--temp-frame-format', help = translator.get('help.temp_frame_format'), default = config.get_str_value('frame_extraction', 'temp_frame_format', 'png'), choices = facefusion.choices.temp_frame_formats)
+	group_frame_extraction.add_argument('--temp-frame-mode', help = translator.get('help.temp_frame_mode'), default = config.get_str_value('frame_extraction', 'temp_frame_mode', 'disk'), choices = facefusion.choices.temp_frame_modes)
+	group_frame_extraction.add_argument('--video-segment-count', help = translator.get('help.video_segment_count'), type = int, default = config.get_int_value('frame_extraction', 'video_segment_count', '1'), choices = facefusion.choices.video_segment_count_range, metavar = create_int_metavar(facefusion.choices.video_segment_count_range))
+	group_frame_extraction.add_argument('--frame-cache-limit', help = translator.get('help.frame_cache_limit'), type = int, default = config.get_int_value('frame_extraction', 'frame_cache_limit', '0'), choices = facefusion.choices.frame_cache_limit_range, metavar = create_int_metavar(facefusion.choices.frame_cache_limit_range))
 	group_frame_extraction.add_argument('--keep-temp', help = translator.get('help.keep_temp'), action = 'store_true', default = config.get_bool_value('frame_extraction', 'keep_temp'))
-	job_store.register_step_keys([ 'trim_frame_start', 'trim_frame_end', 'temp_frame_format', 'keep_temp' ])
+	job_store.register_step_keys([ 'trim_frame_start', 'trim_frame_end', 'temp_frame_format', 'temp_frame_mode', 'video_segment_count', 'keep_temp' ])
+	job_store.register_job_keys([ 'frame_cache_limit' ])
 	return program
 
 
@@ -237,7 +242,15 @@ def create_execution_program() -> ArgumentParser:
 	group_execution.add_argument('--execution-device-ids', help = translator.get('help.execution_device_ids'), type = int, default = config.get_int_list('execution', 'execution_device_ids', '0'), nargs = '+', metavar = 'EXECUTION_DEVICE_IDS')
 	group_execution.add_argument('--execution-providers', help = translator.get('help.execution_providers').format(choices = ', '.join(available_execution_providers)), default = config.get_str_list('execution', 'execution_providers', get_first(available_execution_providers)), choices = available_execution_providers, nargs = '+', metavar = 'EXECUTION_PROVIDERS')
 	group_execution.add_argument('--execution-thread-count', help = translator.get('help.execution_thread_count'), type = int, default = config.get_int_value('execution', 'execution_thread_count', '8'), choices = facefusion.choices.execution_thread_count_range, metavar = create_int_metavar(facefusion.choices.execution_thread_count_range))
-	job_store.register_job_keys([ 'execution_device_ids', 'execution_providers', 'execution_thread_count' ])
+	group_execution.add_argument('--execution-pool-type', help = translator.get('help.execution_pool_type'), default = config.get_str_value('execution', 'execution_pool_type', 'thread'), choices = facefusion.choices.execution_pool_types)
+	group_execution.add_argument('--execution-optimization-level', help = translator.get('help.execution_optimization_level'), default = config.get_str_value('execution', 'execution_optimization_level', 'all'), choices = facefusion.choices.execution_optimization_levels)
+	group_execution.add_argument('--execution-intra-op-thread-count', help = translator.get('help.execution_intra_op_thread_count'), type = int, default = config.get_int_value('execution', 'execution_intra_op_thread_count', '0'), choices = facefusion.choices.execution_intra_op_thread_count_range, metavar = create_int_metavar(facefusion.choices.execution_intra_op_thread_count_range))
+	group_execution.add_argument('--execution-replica-count', help = translator.get('help.execution_replica_count'), type = int, default = config.get_int_value('execution', 'execution_replica_count', '1'), choices = facefusion.choices.execution_replica_count_range, metavar = create_int_metavar(facefusion.choices.execution_replica_count_range))
+	group_execution.add_argument('--execution-batch-size', help = translator.get('help.execution_batch_size'), type = int, default = config.get_int_value('execution', 'execution_batch_size', '1'), choices = facefusion.choices.execution_batch_size_range, metavar = create_int_metavar(facefusion.choices.execution_batch_size_range))
+	group_execution.add_argument('--execution-batch-wait', help = translator.get('help.execution_batch_wait'), type = int, default = config.get_int_value('execution', 'execution_batch_wait', '2'), choices = facefusion.choices.execution_batch_wait_range, metavar = create_int_metavar(facefusion.choices.execution_batch_wait_range))
+	group_execution.add_argument('--execution-io-binding', help = translator.get('help.execution_io_binding'), action = 'store_true', default = config.get_bool_value('execution', 'execution_io_binding'))
+	group_execution.add_argument('--execution-int8', help = translator.get('help.execution_int8'), action = 'store_true', default = config.get_bool_value('execution', 'execution_int8'))
+	job_store.register_job_keys([ 'execution_device_ids', 'execution_providers', 'execution_thread_count', 'execution_pool_type', 'execution_optimization_level', 'execution_intra_op_thread_count', 'execution_replica_count', 'execution_batch_size', 'execution_batch_wait', 'execution_io_binding', 'execution_int8' ])
 	return program
 
 
@@ -304,6 +317,8 @@ def create_program() -> ArgumentParser:
 	sub_program.add_parser('headless-run', help = translator.get('help.headless_run'), parents = [ create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), create_source_paths_program(), create_target_path_program(), create_output_path_program(), collect_step_program(), collect_job_program() ], formatter_class = create_help_formatter_large)
 	sub_program.add_parser('batch-run', help = translator.get('help.batch_run'), parents = [ create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), create_source_pattern_program(), create_target_pattern_program(), create_output_pattern_program(), collect_step_program(), collect_job_program() ], formatter_class = create_help_formatter_large)
 	sub_program.add_parser('force-download', help = translator.get('help.force_download'), parents = [ create_download_providers_program(), create_download_scope_program(), create_log_level_program() ], formatter_class = create_help_formatter_large)
+	sub_program.add_parser('prepare-models', help = translator.get('help.prepare_models'), parents = [ create_download_providers_program(), create_download_scope_program(), create_log_level_program() ], formatter_class = create_help_formatter_large)
+	sub_program.add_parser('quantize-models', help = translator.get('help.quantize_models'), parents = [ create_source_paths_program(), create_face_detector_program(), create_face_landmarker_program(), create_execution_program(), create_download_providers_program(), create_download_scope_program(), create_log_level_program() ], formatter_class = create_help_formatter_large)
 	sub_program.add_parser('benchmark', help = translator.get('help.benchmark'), parents = [ create_temp_path_program(), collect_step_program(), create_benchmark_program(), collect_job_program() ], formatter_class = create_help_formatter_large)
 	# job manager
 	sub_program.add_parser('job-list', help = translator.get('help.job_list'), parents = [ create_job_status_program(), create_jobs_path_program(), create_log_level_program() ], formatter_class = create_help_formatter_large)
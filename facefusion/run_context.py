@@ -0,0 +1,88 @@
+from typing import List, Optional
+
+import numpy
+
+from facefusion import state_manager
+from facefusion.audio import create_empty_audio_frame, read_static_audio, read_static_voice
+from facefusion.common_helper import get_first
+from facefusion.face_analyser import detect_many_faces
+from facefusion.face_selector import extract_reference_faces, extract_source_face, resolve_face_attributes, select_faces
+from facefusion.face_tracker import create_face_tracker_store, track_many_faces
+from facefusion.filesystem import filter_audio_paths
+from facefusion.processors.core import collect_face_demands, get_processors_modules
+from facefusion.types import AudioFrame, FaceContext, Fps, RunContext, VisionFrame
+from facefusion.vision import read_static_images
+
+
+def create_run_context(reference_vision_frame : Optional[VisionFrame], temp_video_fps : Optional[Fps]) -> RunContext:
+	face_demands = collect_face_demands(get_processors_modules(state_manager.get_item('processors')))
+	face_attributes = resolve_face_attributes(face_demands)
+	source_vision_frames = read_static_images(state_manager.get_item('source_paths'))
+	source_audio_path = get_first(filter_audio_paths(state_manager.get_item('source_paths')))
+	source_face = None
+	source_audio_frames = None
+	source_voice_frames = None
+	reference_faces = []
+
+	if 'source_face' in face_demands:
+		source_face = extract_source_face(source_vision_frames)
+
+	if 'target_faces' in face_demands and numpy.any(reference_vision_frame):
+		reference_faces = extract_reference_faces(reference_vision_frame[:, :, :3])
+
+	if source_audio_path and temp_video_fps:
+		source_audio_frames = read_static_audio(source_audio_path, temp_video_fps)
+		source_voice_frames = read_static_voice(source_audio_path, temp_video_fps)
+
+	return RunContext(
+		face_demands = face_demands,
+		face_attributes = face_attributes,
+		source_vision_frames = source_vision_frames,
+		source_face = source_face,
+		source_audio_frames = source_audio_frames,
+		source_voice_frames = source_voice_frames,
+		reference_faces = reference_faces,
+		face_tracker_store = create_face_tracker_store(),
+		temp_video_fps = temp_video_fps
+	)
+
+
+def create_face_context(run_context : RunContext, target_vision_frame : VisionFrame) -> FaceContext:
+	target_faces = []
+
+	if 'target_faces' in run_context.face_demands and numpy.any(target_vision_frame):
+		target_faces = select_faces(run_context.reference_faces, detect_many_faces(target_vision_frame[:, :, :3], run_context.face_attributes))
+
+	return FaceContext(
+		source_face = run_context.source_face,
+		target_faces = target_faces
+	)
+
+
+def create_tracked_face_context(run_context : RunContext, target_vision_frame : VisionFrame, frame_number : int) -> FaceContext:
+	target_faces = []
+
+	if 'target_faces' in run_context.face_demands and numpy.any(target_vision_frame):
+		target_faces = select_faces(run_context.reference_faces, track_many_faces(run_context.face_tracker_store, target_vision_frame[:, :, :3], frame_number, run_context.face_attributes))
+
+	return FaceContext(
+		source_face = run_context.source_face,
+		target_faces = target_faces
+	)
+
+
+def get_source_audio_frame(run_context : RunContext, frame_number : int) -> AudioFrame:
+	return select_audio_frame(run_context.source_audio_frames, frame_number)
+
+
+def get_source_voice_frame(run_context : RunContext, frame_number : int) -> AudioFrame:
+	return select_audio_frame(run_context.source_voice_frames, frame_number)
+
+
+def select_audio_frame(audio_frames : Optional[List[AudioFrame]], frame_number : int) -> AudioFrame:
+	if audio_frames and frame_number in range(len(audio_frames)):
+		audio_frame = audio_frames[frame_number]
+
+		if numpy.any(audio_frame):
+			return audio_frame
+	return create_empty_audio_frame()
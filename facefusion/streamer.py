@@ -1,8 +1,6 @@
 import os
 import subprocess
-from collections import deque
-from concurrent.futures import ThreadPoolExecutor
-from typing import Deque, Iterator
+from typing import Iterator
 
 import cv2
 import numpy
@@ -13,43 +11,63 @@ from facefusion.audio import create_empty_audio_frame
 from facefusion.content_analyser import analyse_stream
 from facefusion.ffmpeg import open_ffmpeg
 from facefusion.filesystem import is_directory
+from facefusion.frame_scheduler import schedule_frames
 from facefusion.processors.core import get_processors_modules
-from facefusion.types import Fps, StreamMode, VisionFrame
-from facefusion.vision import extract_vision_mask, read_static_images
+from facefusion.run_context import create_run_context, create_tracked_face_context
+from facefusion.types import Fps, FramePacket, RunContext, StreamMode, VisionFrame
+from facefusion.vision import extract_vision_mask
+from facefusion.worker_pool import conditional_create_worker_pool, resolve_process_frame_packet
 
 
 def multi_process_capture(camera_capture : cv2.VideoCapture, camera_fps : Fps) -> Iterator[VisionFrame]:
-	capture_deque : Deque[VisionFrame] = deque()
+	run_context = create_run_context(None, None)
+	worker_pool = conditional_create_worker_pool(run_context, state_manager.get_item('execution_thread_count'))
 
-	with tqdm(desc = translator.get('streaming'), unit = 'frame', disable = state_manager.get_item('log_level') in [ 'warn', 'error' ]) as progress:
-		with ThreadPoolExecutor(max_workers = state_manager.get_item('execution_thread_count')) as executor:
-			futures = []
+	try:
+		with tqdm(desc = translator.get('streaming'), unit = 'frame', disable = state_manager.get_item('log_level') in [ 'warn', 'error' ]) as progress:
+			for frame_packet in schedule_frames(create_capture_frame_packets(camera_capture, camera_fps), resolve_process_frame_packet(worker_pool, run_context, process_capture_frame), state_manager.get_item('execution_thread_count')):
+				progress.update()
+				yield frame_packet.get('vision_frame')
+	finally:
+		if worker_pool:
+			worker_pool.shutdown(cancel_futures = True)
 
-			while camera_capture and camera_capture.isOpened():
-				_, capture_frame = camera_capture.read()
-				if analyse_stream(capture_frame, camera_fps):
-					camera_capture.release()
 
-				if numpy.any(capture_frame):
-					future = executor.submit(process_stream_frame, capture_frame)
-					futures.append(future)
+def create_capture_frame_packets(camera_capture : cv2.VideoCapture, camera_fps : Fps) -> Iterator[FramePacket]:
+	frame_number = 0
 
-				for future_done in [ future for future in futures if future.done() ]:
-					capture_frame = future_done.result()
-					capture_deque.append(capture_frame)
-					futures.remove(future_done)
+	while camera_capture and camera_capture.isOpened():
+		_, capture_frame = camera_capture.read()
+		if analyse_stream(capture_frame, camera_fps):
+			camera_capture.release()
 
-				while capture_deque:
-					progress.update()
-					yield capture_deque.popleft()
+		if numpy.any(capture_frame):
+			yield\
+			{
+				'frame_number': frame_number,
+				'frame_path': None,
+				'cache_frame_path': None,
+				'vision_frame': capture_frame
+			}
+			frame_number += 1
+
+
+def process_capture_frame(run_context : RunContext, frame_packet : FramePacket) -> FramePacket:
+	return\
+	{
+		'frame_number': frame_packet.get('frame_number'),
+		'frame_path': None,
+		'cache_frame_path': None,
+		'vision_frame': process_stream_frame(run_context, frame_packet.get('vision_frame'), frame_packet.get('frame_number'))
+	}
 
 
-def process_stream_frame(target_vision_frame : VisionFrame) -> VisionFrame:
-	source_vision_frames = read_static_images(state_manager.get_item('source_paths'))
+def process_stream_frame(run_context : RunContext, target_vision_frame : VisionFrame, frame_number : int) -> VisionFrame:
 	source_audio_frame = create_empty_audio_frame()
 	source_voice_frame = create_empty_audio_frame()
 	temp_vision_frame = target_vision_frame.copy()
 	temp_vision_mask = extract_vision_mask(temp_vision_frame)
+	face_context = create_tracked_face_context(run_context, target_vision_frame, frame_number)
 
 	for processor_module in get_processors_modules(state_manager.get_item('processors')):
 		logger.disable()
@@ -57,7 +75,8 @@ def process_stream_frame(target_vision_frame : VisionFrame) -> VisionFrame:
 			logger.enable()
 			temp_vision_frame, temp_vision_mask = processor_module.process_frame(
 			{
-				'source_vision_frames': source_vision_frames,
+				'face_context': face_context,
+				'source_vision_frames': run_context.source_vision_frames,
 				'source_audio_frame': source_audio_frame,
 				'source_voice_frame': source_voice_frame,
 				'target_vision_frame': target_vision_frame,
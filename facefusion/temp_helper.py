@@ -16,6 +16,22 @@ def move_temp_file(file_path : str, move_path : str) -> bool:
 	return move_file(temp_file_path, move_path)
 
 
+def get_temp_segment_file_path(file_path : str, segment_index : int) -> str:
+	temp_directory_path = get_temp_directory_path(file_path)
+	temp_file_extension = get_file_extension(file_path)
+	return os.path.join(temp_directory_path, 'segment-' + str(segment_index) + temp_file_extension)
+
+
+def get_temp_segment_path(file_path : str, segment_index : int) -> str:
+	temp_directory_path = get_temp_directory_path(file_path)
+	return os.path.join(temp_directory_path, 'segment-' + str(segment_index))
+
+
+def get_temp_pending_frame_path(temp_frame_path : str) -> str:
+	temp_directory_path, temp_frame_name = os.path.split(temp_frame_path)
+	return os.path.join(temp_directory_path, 'pending', temp_frame_name)
+
+
 def resolve_temp_frame_paths(target_path : str) -> List[str]:
 	temp_frames_pattern = get_temp_frames_pattern(target_path, '*')
 	return resolve_file_pattern(temp_frames_pattern)
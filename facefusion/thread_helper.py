@@ -2,6 +2,7 @@ import threading
 from contextlib import nullcontext
 from typing import ContextManager, Union
 
+from facefusion import state_manager
 from facefusion.common_helper import is_linux, is_windows
 from facefusion.execution import has_execution_provider
 
@@ -22,3 +23,12 @@ def conditional_thread_semaphore() -> Union[threading.Semaphore, ContextManager[
 	if is_windows() and has_execution_provider('directml') or is_linux() and has_execution_provider('migraphx') or is_linux() and has_execution_provider('rocm'):
 		return THREAD_SEMAPHORE
 	return NULL_CONTEXT
+
+
+def conditional_inference_semaphore() -> Union[threading.Semaphore, ContextManager[None]]:
+	execution_batch_size = state_manager.get_item('execution_batch_size')
+	execution_replica_count = state_manager.get_item('execution_replica_count')
+
+	if execution_batch_size and execution_batch_size > 1 or execution_replica_count and execution_replica_count > 1:
+		return conditional_thread_semaphore()
+	return THREAD_SEMAPHORE
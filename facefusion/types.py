@@ -1,5 +1,6 @@
+import threading
 from collections import namedtuple
-from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, TypeAlias, TypedDict
+from typing import Any, Callable, Dict, List, Literal, Optional, OrderedDict, Tuple, TypeAlias, TypedDict
 
 import cv2
 import numpy
@@ -44,11 +45,52 @@ Face = namedtuple('Face',
 	'age',
 	'race'
 ])
-FaceSet : TypeAlias = Dict[str, List[Face]]
+FaceSet : TypeAlias = OrderedDict[str, List[Face]]
 FaceStore = TypedDict('FaceStore',
 {
-	'static_faces' : FaceSet
+	'static_faces' : FaceSet,
+	'static_face_size' : int,
+	'hit_total' : int,
+	'miss_total' : int,
+	'evict_total' : int
 })
+FaceTrackSet = TypedDict('FaceTrackSet',
+{
+	'key_frame_number' : int,
+	'thumbnail_frame' : NDArray[Any],
+	'faces' : List[Face],
+	'track_ids' : List[int]
+})
+FaceIdentity = TypedDict('FaceIdentity',
+{
+	'frame_number' : int,
+	'face' : Face
+})
+FaceTrackerStore = TypedDict('FaceTrackerStore',
+{
+	'face_track_sets' : Dict[int, FaceTrackSet],
+	'face_identities' : Dict[int, FaceIdentity],
+	'track_total' : int
+})
+FaceDemand = Literal['source_face', 'target_faces', 'target_embedding']
+FaceAttribute = Literal['embedding', 'classification']
+RunContext = namedtuple('RunContext',
+[
+	'face_demands',
+	'face_attributes',
+	'source_vision_frames',
+	'source_face',
+	'source_audio_frames',
+	'source_voice_frames',
+	'reference_faces',
+	'face_tracker_store',
+	'temp_video_fps'
+])
+FaceContext = namedtuple('FaceContext',
+[
+	'source_face',
+	'target_faces'
+])
 
 Language = Literal['en']
 Locals : TypeAlias = Dict[Language, Dict[str, Any]]
@@ -75,6 +117,7 @@ Distance : TypeAlias = NDArray[Any]
 Matrix : TypeAlias = NDArray[Any]
 Anchors : TypeAlias = NDArray[Any]
 Translation : TypeAlias = NDArray[Any]
+Tensor : TypeAlias = NDArray[Any]
 
 AudioBuffer : TypeAlias = bytes
 Audio : TypeAlias = NDArray[Any]
@@ -97,7 +140,28 @@ Resolution : TypeAlias = Tuple[int, int]
 ProcessState = Literal['checking', 'processing', 'stopping', 'pending']
 Args : TypeAlias = Dict[str, Any]
 UpdateProgress : TypeAlias = Callable[[int], None]
+FramePacket = TypedDict('FramePacket',
+{
+	'frame_number' : int,
+	'frame_path' : Optional[str],
+	'cache_frame_path' : Optional[str],
+	'vision_frame' : Optional[VisionFrame]
+})
+ProcessFramePacket : TypeAlias = Callable[[FramePacket], FramePacket]
+ProcessRunFramePacket : TypeAlias = Callable[[RunContext, FramePacket], FramePacket]
+FrameQueueDepths = TypedDict('FrameQueueDepths',
+{
+	'decode' : int,
+	'process' : int,
+	'encode' : int
+})
 ProcessStep : TypeAlias = Callable[[str, int, Args], bool]
+FrameManifest = TypedDict('FrameManifest',
+{
+	'signature' : str,
+	'extract_frame_total' : int,
+	'process_frame_total' : int
+})
 
 Content : TypeAlias = Dict[str, Any]
 
@@ -133,7 +197,9 @@ VoiceExtractorModel = Literal['kim_vocal_1', 'kim_vocal_2', 'uvr_mdxnet']
 AudioFormat = Literal['flac', 'm4a', 'mp3', 'ogg', 'opus', 'wav']
 ImageFormat = Literal['bmp', 'jpeg', 'png', 'tiff', 'webp']
 VideoFormat = Literal['avi', 'm4v', 'mkv', 'mov', 'mp4', 'mpeg', 'mxf', 'webm', 'wmv']
-TempFrameFormat = Literal['bmp', 'jpeg', 'png', 'tiff']
+TempFrameFormat = Literal['bmp', 'jpeg', 'npy', 'png', 'tiff']
+TempFrameMode = Literal['disk', 'memory']
+CacheScope = Literal['frames', 'outputs']
 AudioTypeSet : TypeAlias = Dict[AudioFormat, str]
 ImageTypeSet : TypeAlias = Dict[ImageFormat, str]
 VideoTypeSet : TypeAlias = Dict[VideoFormat, str]
@@ -146,6 +212,7 @@ EncoderSet = TypedDict('EncoderSet',
 	'video' : List[VideoEncoder]
 })
 VideoPreset = Literal['ultrafast', 'superfast', 'veryfast', 'faster', 'fast', 'medium', 'slow', 'slower', 'veryslow']
+RawPixelFormat = Literal['bgr24', 'bgra']
 
 BenchmarkMode = Literal['warm', 'cold']
 BenchmarkResolution = Literal['240p', '360p', '540p', '720p', '1080p', '1440p', '2160p']
@@ -170,6 +237,25 @@ ModelInitializer : TypeAlias = NDArray[Any]
 ExecutionProvider = Literal['cpu', 'coreml', 'cuda', 'directml', 'openvino', 'migraphx', 'rocm', 'tensorrt']
 ExecutionProviderValue = Literal['CPUExecutionProvider', 'CoreMLExecutionProvider', 'CUDAExecutionProvider', 'DmlExecutionProvider', 'OpenVINOExecutionProvider', 'MIGraphXExecutionProvider', 'ROCMExecutionProvider', 'TensorrtExecutionProvider']
 ExecutionProviderSet : TypeAlias = Dict[ExecutionProvider, ExecutionProviderValue]
+ExecutionPoolType = Literal['thread', 'process']
+ExecutionOptimizationLevel = Literal['disable', 'basic', 'extended', 'all']
+SharedFrame = TypedDict('SharedFrame',
+{
+	'name' : str,
+	'shape' : Tuple[int, ...],
+	'dtype' : str
+})
+SharedFramePacket = TypedDict('SharedFramePacket',
+{
+	'frame_number' : int,
+	'frame_path' : Optional[str],
+	'cache_frame_path' : Optional[str],
+	'shared_frame' : Optional[SharedFrame]
+})
+WorkerStore = TypedDict('WorkerStore',
+{
+	'run_context' : Optional[RunContext]
+})
 InferenceSessionProvider : TypeAlias = Any
 ValueAndUnit = TypedDict('ValueAndUnit',
 {
@@ -231,6 +317,40 @@ AppContext = Literal['cli', 'ui']
 
 InferencePool : TypeAlias = Dict[str, InferenceSession]
 InferencePoolSet : TypeAlias = Dict[AppContext, Dict[str, InferencePool]]
+InferenceReplica = TypedDict('InferenceReplica',
+{
+	'in_flight_total' : int,
+	'run_total' : int,
+	'run_time' : float,
+	'start_time' : float
+})
+InferenceReplicaSet : TypeAlias = Dict[str, InferenceReplica]
+InferenceRequest = TypedDict('InferenceRequest',
+{
+	'batch_signature' : str,
+	'input_feed' : Dict[str, Tensor],
+	'output_feed' : Optional[List[Tensor]],
+	'exception' : Optional[Exception],
+	'deadline' : float,
+	'done' : bool
+})
+InferenceBatch = TypedDict('InferenceBatch',
+{
+	'condition' : threading.Condition,
+	'inference_requests' : List[InferenceRequest]
+})
+InferenceBinding = TypedDict('InferenceBinding',
+{
+	'inference_session' : InferenceSession,
+	'inference_device' : str,
+	'inference_device_id' : int,
+	'thread_state' : threading.local
+})
+ValidationCrop = TypedDict('ValidationCrop',
+{
+	'crop_vision_frame' : VisionFrame,
+	'face_embedding' : Embedding
+})
 
 UiWorkflow = Literal['instant_runner', 'job_runner', 'job_manager']
 
@@ -278,6 +398,7 @@ StateKey = Literal\
 	'face_detector_margin',
 	'face_detector_angles',
 	'face_detector_score',
+	'face_detector_interval',
 	'face_landmarker_model',
 	'face_landmarker_score',
 	'face_selector_mode',
@@ -300,6 +421,11 @@ StateKey = Literal\
 	'trim_frame_start',
 	'trim_frame_end',
 	'temp_frame_format',
+	'temp_frame_mode',
+	'video_segment_count',
+	'frame_cache_limit',
+	'video_segment_offset',
+	'cache_path',
 	'keep_temp',
 	'output_image_quality',
 	'output_image_scale',
@@ -318,6 +444,14 @@ StateKey = Literal\
 	'execution_device_ids',
 	'execution_providers',
 	'execution_thread_count',
+	'execution_pool_type',
+	'execution_optimization_level',
+	'execution_intra_op_thread_count',
+	'execution_replica_count',
+	'execution_batch_size',
+	'execution_batch_wait',
+	'execution_io_binding',
+	'execution_int8',
 	'video_memory_strategy',
 	'system_memory_limit',
 	'log_level',
@@ -348,6 +482,7 @@ State = TypedDict('State',
 	'face_detector_margin': Margin,
 	'face_detector_angles' : List[Angle],
 	'face_detector_score' : Score,
+	'face_detector_interval' : int,
 	'face_landmarker_model' : FaceLandmarkerModel,
 	'face_landmarker_score' : Score,
 	'face_selector_mode' : FaceSelectorMode,
@@ -370,6 +505,11 @@ State = TypedDict('State',
 	'trim_frame_start' : int,
 	'trim_frame_end' : int,
 	'temp_frame_format' : TempFrameFormat,
+	'temp_frame_mode' : TempFrameMode,
+	'video_segment_count' : int,
+	'frame_cache_limit' : int,
+	'video_segment_offset' : int,
+	'cache_path' : str,
 	'keep_temp' : bool,
 	'output_image_quality' : int,
 	'output_image_scale' : Scale,
@@ -388,6 +528,14 @@ State = TypedDict('State',
 	'execution_device_ids' : List[int],
 	'execution_providers' : List[ExecutionProvider],
 	'execution_thread_count' : int,
+	'execution_pool_type' : ExecutionPoolType,
+	'execution_optimization_level' : ExecutionOptimizationLevel,
+	'execution_intra_op_thread_count' : int,
+	'execution_replica_count' : int,
+	'execution_batch_size' : int,
+	'execution_batch_wait' : int,
+	'execution_io_binding' : bool,
+	'execution_int8' : bool,
 	'video_memory_strategy' : VideoMemoryStrategy,
 	'system_memory_limit' : int,
 	'log_level' : LogLevel,
@@ -5,12 +5,15 @@ import gradio
 import facefusion.choices
 from facefusion import state_manager, translator
 from facefusion.common_helper import calculate_int_step
+from facefusion.types import ExecutionPoolType
 
 EXECUTION_THREAD_COUNT_SLIDER : Optional[gradio.Slider] = None
+EXECUTION_POOL_TYPE_DROPDOWN : Optional[gradio.Dropdown] = None
 
 
 def render() -> None:
 	global EXECUTION_THREAD_COUNT_SLIDER
+	global EXECUTION_POOL_TYPE_DROPDOWN
 
 	EXECUTION_THREAD_COUNT_SLIDER = gradio.Slider(
 		label = translator.get('uis.execution_thread_count_slider'),
@@ -19,11 +22,21 @@ def render() -> None:
 		minimum = facefusion.choices.execution_thread_count_range[0],
 		maximum = facefusion.choices.execution_thread_count_range[-1]
 	)
+	EXECUTION_POOL_TYPE_DROPDOWN = gradio.Dropdown(
+		label = translator.get('uis.execution_pool_type_dropdown'),
+		choices = facefusion.choices.execution_pool_types,
+		value = state_manager.get_item('execution_pool_type')
+	)
 
 
 def listen() -> None:
 	EXECUTION_THREAD_COUNT_SLIDER.release(update_execution_thread_count, inputs = EXECUTION_THREAD_COUNT_SLIDER)
+	EXECUTION_POOL_TYPE_DROPDOWN.change(update_execution_pool_type, inputs = EXECUTION_POOL_TYPE_DROPDOWN)
 
 
 def update_execution_thread_count(execution_thread_count : float) -> None:
 	state_manager.set_item('execution_thread_count', int(execution_thread_count))
+
+
+def update_execution_pool_type(execution_pool_type : ExecutionPoolType) -> None:
+	state_manager.set_item('execution_pool_type', execution_pool_type)
@@ -6,19 +6,19 @@ import gradio
 import numpy
 
 from facefusion import logger, process_manager, state_manager, translator
-from facefusion.audio import create_empty_audio_frame, get_voice_frame
-from facefusion.common_helper import get_first
+from facefusion.audio import create_empty_audio_frame
 from facefusion.content_analyser import analyse_frame
 from facefusion.face_analyser import get_one_face
-from facefusion.face_selector import select_faces
+from facefusion.face_selector import extract_reference_faces
 from facefusion.face_store import clear_static_faces
-from facefusion.filesystem import filter_audio_paths, is_image, is_video
+from facefusion.filesystem import is_image, is_video
 from facefusion.processors.core import get_processors_modules
-from facefusion.types import AudioFrame, Face, Mask, VisionFrame
+from facefusion.run_context import create_face_context, create_run_context, get_source_voice_frame
+from facefusion.types import AudioFrame, Face, Mask, RunContext, VisionFrame
 from facefusion.uis import choices as uis_choices
 from facefusion.uis.core import get_ui_component, get_ui_components, register_ui_component
 from facefusion.uis.types import ComponentOptions, PreviewMode
-from facefusion.vision import detect_frame_orientation, extract_vision_mask, fit_cover_frame, merge_vision_mask, obscure_frame, read_static_image, read_static_images, read_video_frame, restrict_frame, unpack_resolution
+from facefusion.vision import detect_frame_orientation, extract_vision_mask, fit_cover_frame, merge_vision_mask, obscure_frame, read_static_image, read_video_frame, restrict_frame, unpack_resolution
 
 PREVIEW_IMAGE : Optional[gradio.Image] = None
 
@@ -31,27 +31,23 @@ def render() -> None:
 		'label': translator.get('uis.preview_image')
 	}
 
-	source_vision_frames = read_static_images(state_manager.get_item('source_paths'))
-	source_audio_path = get_first(filter_audio_paths(state_manager.get_item('source_paths')))
 	source_audio_frame = create_empty_audio_frame()
-	source_voice_frame = create_empty_audio_frame()
-
-	if source_audio_path and state_manager.get_item('output_video_fps') and state_manager.get_item('reference_frame_number'):
-		temp_voice_frame = get_voice_frame(source_audio_path, state_manager.get_item('output_video_fps'), state_manager.get_item('reference_frame_number'))
-		if numpy.any(temp_voice_frame):
-			source_voice_frame = temp_voice_frame
 
 	if is_image(state_manager.get_item('target_path')):
 		target_vision_frame = read_static_image(state_manager.get_item('target_path'))
 		reference_vision_frame = read_static_image(state_manager.get_item('target_path'))
-		preview_vision_frame = process_preview_frame(reference_vision_frame, source_vision_frames, source_audio_frame, source_voice_frame, target_vision_frame, uis_choices.preview_modes[0], uis_choices.preview_resolutions[-1])
+		run_context = create_preview_run_context(reference_vision_frame, uis_choices.preview_modes[0])
+		source_voice_frame = get_source_voice_frame(run_context, state_manager.get_item('reference_frame_number'))
+		preview_vision_frame = process_preview_frame(run_context, source_audio_frame, source_voice_frame, target_vision_frame, uis_choices.preview_modes[0], uis_choices.preview_resolutions[-1])
 		preview_image_options['value'] = cv2.cvtColor(preview_vision_frame, cv2.COLOR_BGR2RGB)
 		preview_image_options['elem_classes'] = [ 'image-preview', 'is-' + detect_frame_orientation(preview_vision_frame) ]
 
 	if is_video(state_manager.get_item('target_path')):
 		temp_vision_frame = read_video_frame(state_manager.get_item('target_path'), state_manager.get_item('reference_frame_number'))
 		reference_vision_frame = read_video_frame(state_manager.get_item('target_path'), state_manager.get_item('reference_frame_number'))
-		preview_vision_frame = process_preview_frame(reference_vision_frame, source_vision_frames, source_audio_frame, source_voice_frame, temp_vision_frame, uis_choices.preview_modes[0], uis_choices.preview_resolutions[-1])
+		run_context = create_preview_run_context(reference_vision_frame, uis_choices.preview_modes[0])
+		source_voice_frame = get_source_voice_frame(run_context, state_manager.get_item('reference_frame_number'))
+		preview_vision_frame = process_preview_frame(run_context, source_audio_frame, source_voice_frame, temp_vision_frame, uis_choices.preview_modes[0], uis_choices.preview_resolutions[-1])
 		preview_image_options['value'] = cv2.cvtColor(preview_vision_frame, cv2.COLOR_BGR2RGB)
 		preview_image_options['elem_classes'] = [ 'image-preview', 'is-' + detect_frame_orientation(preview_vision_frame) ]
 		preview_image_options['visible'] = True
@@ -180,34 +176,31 @@ def update_preview_image(preview_mode : PreviewMode, preview_resolution : str, f
 	while process_manager.is_checking():
 		sleep(0.5)
 
-	source_vision_frames = read_static_images(state_manager.get_item('source_paths'))
-	source_audio_path = get_first(filter_audio_paths(state_manager.get_item('source_paths')))
 	source_audio_frame = create_empty_audio_frame()
-	source_voice_frame = create_empty_audio_frame()
+	reference_audio_frame_number = state_manager.get_item('reference_frame_number')
 
-	if source_audio_path and state_manager.get_item('output_video_fps') and state_manager.get_item('reference_frame_number'):
-		reference_audio_frame_number = state_manager.get_item('reference_frame_number')
-		if state_manager.get_item('trim_frame_start'):
-			reference_audio_frame_number -= state_manager.get_item('trim_frame_start')
-		temp_voice_frame = get_voice_frame(source_audio_path, state_manager.get_item('output_video_fps'), reference_audio_frame_number)
-		if numpy.any(temp_voice_frame):
-			source_voice_frame = temp_voice_frame
+	if reference_audio_frame_number and state_manager.get_item('trim_frame_start'):
+		reference_audio_frame_number -= state_manager.get_item('trim_frame_start')
 
 	if is_image(state_manager.get_item('target_path')):
 		reference_vision_frame = read_static_image(state_manager.get_item('target_path'))
+		run_context = create_preview_run_context(reference_vision_frame, preview_mode)
+		source_voice_frame = get_source_voice_frame(run_context, reference_audio_frame_number)
 		target_vision_frame = read_static_image(state_manager.get_item('target_path'), 'rgba')
 		target_vision_mask = extract_vision_mask(target_vision_frame)
 		target_vision_frame = merge_vision_mask(target_vision_frame, target_vision_mask)
-		preview_vision_frame = process_preview_frame(reference_vision_frame, source_vision_frames, source_audio_frame, source_voice_frame, target_vision_frame, preview_mode, preview_resolution)
+		preview_vision_frame = process_preview_frame(run_context, source_audio_frame, source_voice_frame, target_vision_frame, preview_mode, preview_resolution)
 		preview_vision_frame = cv2.cvtColor(preview_vision_frame, cv2.COLOR_BGRA2RGBA)
 		return gradio.Image(value = preview_vision_frame, elem_classes = [ 'image-preview', 'is-' + detect_frame_orientation(preview_vision_frame) ])
 
 	if is_video(state_manager.get_item('target_path')):
 		reference_vision_frame = read_video_frame(state_manager.get_item('target_path'), state_manager.get_item('reference_frame_number'))
+		run_context = create_preview_run_context(reference_vision_frame, preview_mode)
+		source_voice_frame = get_source_voice_frame(run_context, reference_audio_frame_number)
 		temp_vision_frame = read_video_frame(state_manager.get_item('target_path'), frame_number)
 		temp_vision_mask = extract_vision_mask(temp_vision_frame)
 		temp_vision_frame = merge_vision_mask(temp_vision_frame, temp_vision_mask)
-		preview_vision_frame = process_preview_frame(reference_vision_frame, source_vision_frames, source_audio_frame, source_voice_frame, temp_vision_frame, preview_mode, preview_resolution)
+		preview_vision_frame = process_preview_frame(run_context, source_audio_frame, source_voice_frame, temp_vision_frame, preview_mode, preview_resolution)
 		preview_vision_frame = cv2.cvtColor(preview_vision_frame, cv2.COLOR_BGRA2RGBA)
 		return gradio.Image(value = preview_vision_frame, elem_classes = [ 'image-preview', 'is-' + detect_frame_orientation(preview_vision_frame) ])
 	return gradio.Image(value = None, elem_classes = None)
@@ -218,10 +211,19 @@ def clear_and_update_preview_image(preview_mode : PreviewMode, preview_resolutio
 	return update_preview_image(preview_mode, preview_resolution, frame_number)
 
 
-def process_preview_frame(reference_vision_frame : VisionFrame, source_vision_frames : List[VisionFrame], source_audio_frame : AudioFrame, source_voice_frame : AudioFrame, target_vision_frame : VisionFrame, preview_mode : PreviewMode, preview_resolution : str) -> VisionFrame:
+def create_preview_run_context(reference_vision_frame : VisionFrame, preview_mode : PreviewMode) -> RunContext:
+	run_context = create_run_context(reference_vision_frame, state_manager.get_item('output_video_fps'))
+
+	if preview_mode == 'face-by-face' and 'target_faces' not in run_context.face_demands:
+		return run_context._replace(face_demands = run_context.face_demands + [ 'target_faces' ], reference_faces = extract_reference_faces(reference_vision_frame[:, :, :3]))
+	return run_context
+
+
+def process_preview_frame(run_context : RunContext, source_audio_frame : AudioFrame, source_voice_frame : AudioFrame, target_vision_frame : VisionFrame, preview_mode : PreviewMode, preview_resolution : str) -> VisionFrame:
 	target_vision_frame = restrict_frame(target_vision_frame, unpack_resolution(preview_resolution))
 	temp_vision_frame = target_vision_frame.copy()
 	temp_vision_mask = extract_vision_mask(temp_vision_frame)
+	face_context = create_face_context(run_context, target_vision_frame)
 
 	if analyse_frame(target_vision_frame[:, :, :3]):
 		if preview_mode == 'frame-by-frame':
@@ -229,7 +231,7 @@ def process_preview_frame(reference_vision_frame : VisionFrame, source_vision_fr
 			return numpy.hstack((temp_vision_frame, temp_vision_frame))
 
 		if preview_mode == 'face-by-face':
-			target_crop_vision_frame, output_crop_vision_frame = create_face_by_face(reference_vision_frame, target_vision_frame[:, :, :3], temp_vision_frame[:, :, :3])
+			target_crop_vision_frame, output_crop_vision_frame = create_face_by_face(face_context.target_faces, target_vision_frame[:, :, :3], temp_vision_frame[:, :, :3])
 			target_crop_vision_frame = obscure_frame(target_crop_vision_frame)
 			output_crop_vision_frame = obscure_frame(output_crop_vision_frame)
 			return numpy.hstack((target_crop_vision_frame, output_crop_vision_frame))
@@ -243,10 +245,10 @@ def process_preview_frame(reference_vision_frame : VisionFrame, source_vision_fr
 			logger.enable()
 			temp_vision_frame, temp_vision_mask = processor_module.process_frame(
 			{
-				'reference_vision_frame': reference_vision_frame,
+				'face_context': face_context,
 				'source_audio_frame': source_audio_frame,
 				'source_voice_frame': source_voice_frame,
-				'source_vision_frames': source_vision_frames,
+				'source_vision_frames': run_context.source_vision_frames,
 				'target_vision_frame': target_vision_frame[:, :, :3],
 				'temp_vision_frame': temp_vision_frame[:, :, :3],
 				'temp_vision_mask': temp_vision_mask
@@ -259,14 +261,13 @@ def process_preview_frame(reference_vision_frame : VisionFrame, source_vision_fr
 		return numpy.hstack((target_vision_frame, temp_vision_frame))
 
 	if preview_mode == 'face-by-face':
-		target_crop_vision_frame, output_crop_vision_frame = create_face_by_face(reference_vision_frame, target_vision_frame, temp_vision_frame)
+		target_crop_vision_frame, output_crop_vision_frame = create_face_by_face(face_context.target_faces, target_vision_frame, temp_vision_frame)
 		return numpy.hstack((target_crop_vision_frame, output_crop_vision_frame))
 
 	return temp_vision_frame
 
 
-def create_face_by_face(reference_vision_frame : VisionFrame, target_vision_frame : VisionFrame, temp_vision_frame : VisionFrame) -> Tuple[VisionFrame, VisionFrame]:
-	target_faces = select_faces(reference_vision_frame[:, :, :3], target_vision_frame[:, :, :3])
+def create_face_by_face(target_faces : List[Face], target_vision_frame : VisionFrame, temp_vision_frame : VisionFrame) -> Tuple[VisionFrame, VisionFrame]:
 	target_face = get_one_face(target_faces)
 
 	if target_face:
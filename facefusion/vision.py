@@ -7,7 +7,7 @@ import numpy
 from cv2.typing import Size
 
 from facefusion.common_helper import is_windows
-from facefusion.filesystem import get_file_extension, is_image, is_video
+from facefusion.filesystem import get_file_extension, is_file, is_image, is_video
 from facefusion.thread_helper import thread_semaphore
 from facefusion.types import ColorMode, Duration, Fps, Mask, Orientation, Resolution, Scale, VisionFrame
 from facefusion.video_manager import get_video_capture
@@ -52,6 +52,22 @@ def write_image(image_path : str, vision_frame : VisionFrame) -> bool:
 	return False
 
 
+def read_temp_frame(temp_frame_path : str) -> Optional[VisionFrame]:
+	if get_file_extension(temp_frame_path) == '.npy':
+		if is_file(temp_frame_path):
+			return numpy.load(temp_frame_path, mmap_mode = 'r')
+		return None
+	return read_image(temp_frame_path, 'rgba')
+
+
+def write_temp_frame(temp_frame_path : str, vision_frame : VisionFrame) -> bool:
+	if get_file_extension(temp_frame_path) == '.npy':
+		with open(temp_frame_path, 'wb') as temp_frame_file:
+			numpy.save(temp_frame_file, numpy.ascontiguousarray(vision_frame))
+		return is_file(temp_frame_path)
+	return write_image(temp_frame_path, vision_frame)
+
+
 def detect_image_resolution(image_path : str) -> Optional[Resolution]:
 	if is_image(image_path):
 		image = read_image(image_path)
@@ -147,6 +163,19 @@ def count_trim_frame_total(video_path : str, trim_frame_start : Optional[int], t
 	return trim_frame_end - trim_frame_start
 
 
+def split_trim_frame(trim_frame_start : int, trim_frame_end : int, segment_count : int) -> List[Tuple[int, int]]:
+	trim_frame_total = trim_frame_end - trim_frame_start
+	trim_frame_ranges = []
+
+	for segment_index in range(segment_count):
+		segment_frame_start = trim_frame_start + segment_index * trim_frame_total // segment_count
+		segment_frame_end = trim_frame_start + (segment_index + 1) * trim_frame_total // segment_count
+
+		if segment_frame_end > segment_frame_start:
+			trim_frame_ranges.append((segment_frame_start, segment_frame_end))
+	return trim_frame_ranges
+
+
 def restrict_trim_frame(video_path : str, trim_frame_start : Optional[int], trim_frame_end : Optional[int]) -> Tuple[int, int]:
 	video_frame_total = count_video_frame_total(video_path)
 
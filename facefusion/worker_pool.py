@@ -0,0 +1,143 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional
+
+import numpy
+
+from facefusion import logger, state_manager
+from facefusion.model_preloader import start_preload_models
+from facefusion.types import FramePacket, ProcessFramePacket, ProcessRunFramePacket, RunContext, SharedFrame, SharedFramePacket, State, VisionFrame, WorkerStore
+
+WORKER_STORE : WorkerStore =\
+{
+	'run_context': None
+}
+
+
+def conditional_create_worker_pool(run_context : RunContext, execution_thread_count : int) -> Optional[ProcessPoolExecutor]:
+	if state_manager.get_item('execution_pool_type') == 'process':
+		return create_worker_pool(run_context, execution_thread_count)
+	return None
+
+
+def create_worker_pool(run_context : RunContext, execution_thread_count : int) -> ProcessPoolExecutor:
+	state = state_manager.get_state().copy()
+	return ProcessPoolExecutor(max_workers = max(execution_thread_count, 1), mp_context = multiprocessing.get_context('spawn'), initializer = init_worker, initargs = (state, run_context)) #type:ignore[arg-type]
+
+
+def init_worker(state : State, run_context : RunContext) -> None:
+	for key, value in state.items():
+		state_manager.init_item(key, value) #type:ignore[arg-type]
+	logger.init(state_manager.get_item('log_level'))
+	WORKER_STORE['run_context'] = run_context._replace(face_tracker_store = None)
+	start_preload_models()
+
+
+def resolve_process_frame_packet(worker_pool : Optional[ProcessPoolExecutor], run_context : RunContext, process_frame_packet : ProcessRunFramePacket) -> ProcessFramePacket:
+	if worker_pool:
+		return partial(dispatch_frame_packet, worker_pool, process_frame_packet)
+	return partial(process_frame_packet, run_context)
+
+
+def dispatch_frame_packet(worker_pool : ProcessPoolExecutor, process_frame_packet : ProcessRunFramePacket, frame_packet : FramePacket) -> FramePacket:
+	vision_frame = frame_packet.get('vision_frame')
+	input_shared_memory = None
+	input_shared_frame = None
+
+	if vision_frame is not None:
+		input_shared_memory = create_shared_memory(vision_frame)
+		input_shared_frame = describe_shared_frame(input_shared_memory, vision_frame)
+
+	try:
+		output_shared_frame_packet = worker_pool.submit(run_shared_frame_packet, process_frame_packet,
+		{
+			'frame_number': frame_packet.get('frame_number'),
+			'frame_path': frame_packet.get('frame_path'),
+			'cache_frame_path': frame_packet.get('cache_frame_path'),
+			'shared_frame': input_shared_frame
+		}).result()
+	finally:
+		if input_shared_memory:
+			input_shared_memory.close()
+			input_shared_memory.unlink()
+
+	return unpack_shared_frame_packet(output_shared_frame_packet)
+
+
+def run_shared_frame_packet(process_frame_packet : ProcessRunFramePacket, shared_frame_packet : SharedFramePacket) -> SharedFramePacket:
+	vision_frame = None
+
+	if shared_frame_packet.get('shared_frame'):
+		vision_frame = read_shared_frame(shared_frame_packet.get('shared_frame'), False)
+
+	frame_packet = process_frame_packet(WORKER_STORE.get('run_context'),
+	{
+		'frame_number': shared_frame_packet.get('frame_number'),
+		'frame_path': shared_frame_packet.get('frame_path'),
+		'cache_frame_path': shared_frame_packet.get('cache_frame_path'),
+		'vision_frame': vision_frame
+	})
+	return pack_shared_frame_packet(frame_packet)
+
+
+def pack_shared_frame_packet(frame_packet : FramePacket) -> SharedFramePacket:
+	vision_frame = frame_packet.get('vision_frame')
+	shared_frame = None
+
+	if vision_frame is not None:
+		vision_frame = numpy.ascontiguousarray(vision_frame)
+		shared_memory = create_shared_memory(vision_frame)
+		shared_frame = describe_shared_frame(shared_memory, vision_frame)
+		shared_memory.close()
+
+	return\
+	{
+		'frame_number': frame_packet.get('frame_number'),
+		'frame_path': frame_packet.get('frame_path'),
+		'cache_frame_path': frame_packet.get('cache_frame_path'),
+		'shared_frame': shared_frame
+	}
+
+
+def unpack_shared_frame_packet(shared_frame_packet : SharedFramePacket) -> FramePacket:
+	vision_frame = None
+
+	if shared_frame_packet.get('shared_frame'):
+		vision_frame = read_shared_frame(shared_frame_packet.get('shared_frame'), True)
+
+	return\
+	{
+		'frame_number': shared_frame_packet.get('frame_number'),
+		'frame_path': shared_frame_packet.get('frame_path'),
+		'cache_frame_path': shared_frame_packet.get('cache_frame_path'),
+		'vision_frame': vision_frame
+	}
+
+
+def create_shared_memory(vision_frame : VisionFrame) -> SharedMemory:
+	shared_memory = SharedMemory(create = True, size = max(vision_frame.nbytes, 1))
+	shared_vision_frame : VisionFrame = numpy.ndarray(vision_frame.shape, dtype = vision_frame.dtype, buffer = shared_memory.buf)
+	shared_vision_frame[:] = vision_frame
+	del shared_vision_frame
+	return shared_memory
+
+
+def describe_shared_frame(shared_memory : SharedMemory, vision_frame : VisionFrame) -> SharedFrame:
+	return\
+	{
+		'name': shared_memory.name,
+		'shape': vision_frame.shape,
+		'dtype': vision_frame.dtype.str
+	}
+
+
+def read_shared_frame(shared_frame : SharedFrame, unlink : bool) -> VisionFrame:
+	shared_memory = SharedMemory(name = shared_frame.get('name'))
+	vision_frame : VisionFrame = numpy.ndarray(shared_frame.get('shape'), dtype = numpy.dtype(shared_frame.get('dtype')), buffer = shared_memory.buf).copy()
+	shared_memory.close()
+
+	if unlink:
+		shared_memory.unlink()
+	return vision_frame
@@ -6,10 +6,11 @@ from facefusion.audio import create_empty_audio_frame
 from facefusion.content_analyser import analyse_image
 from facefusion.filesystem import is_image
 from facefusion.processors.core import get_processors_modules
+from facefusion.run_context import create_face_context, create_run_context
 from facefusion.temp_helper import clear_temp_directory, create_temp_directory, get_temp_file_path
 from facefusion.time_helper import calculate_end_time
 from facefusion.types import ErrorCode
-from facefusion.vision import conditional_merge_vision_mask, detect_image_resolution, extract_vision_mask, pack_resolution, read_static_image, read_static_images, restrict_image_resolution, scale_resolution, write_image
+from facefusion.vision import conditional_merge_vision_mask, detect_image_resolution, extract_vision_mask, pack_resolution, read_static_image, restrict_image_resolution, scale_resolution, write_image
 from facefusion.workflows.core import is_process_stopping
 
 
@@ -64,20 +65,21 @@ def prepare_image() -> ErrorCode:
 def process_image() -> ErrorCode:
 	temp_image_path = get_temp_file_path(state_manager.get_item('target_path'))
 	reference_vision_frame = read_static_image(temp_image_path)
-	source_vision_frames = read_static_images(state_manager.get_item('source_paths'))
+	run_context = create_run_context(reference_vision_frame, None)
 	source_audio_frame = create_empty_audio_frame()
 	source_voice_frame = create_empty_audio_frame()
 	target_vision_frame = read_static_image(temp_image_path, 'rgba')
 	temp_vision_frame = target_vision_frame.copy()
 	temp_vision_mask = extract_vision_mask(temp_vision_frame)
+	face_context = create_face_context(run_context, target_vision_frame)
 
 	for processor_module in get_processors_modules(state_manager.get_item('processors')):
 		logger.info(translator.get('processing'), processor_module.__name__)
 
 		temp_vision_frame, temp_vision_mask = processor_module.process_frame(
 		{
-			'reference_vision_frame': reference_vision_frame,
-			'source_vision_frames': source_vision_frames,
+			'face_context': face_context,
+			'source_vision_frames': run_context.source_vision_frames,
 			'source_audio_frame': source_audio_frame,
 			'source_voice_frame': source_voice_frame,
 			'target_vision_frame': target_vision_frame[:, :, :3],
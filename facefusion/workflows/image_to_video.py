@@ -1,22 +1,37 @@
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import multiprocessing
+import os
+import subprocess
+import sys
 from functools import partial
+from time import sleep, time
+from typing import Dict, Iterator, List, Optional
 
 import numpy
 from tqdm import tqdm
 
 from facefusion import ffmpeg
 from facefusion import logger, process_manager, state_manager, translator, video_manager
-from facefusion.audio import create_empty_audio_frame, get_audio_frame, get_voice_frame
+from facefusion.cache_manager import create_extract_cache_key, create_output_cache_key, evict_cache, get_cache_path, get_output_cache_frame_path, init_output_cache, restore_extract_cache, store_extract_cache
 from facefusion.common_helper import get_first
 from facefusion.content_analyser import analyse_video
-from facefusion.filesystem import filter_audio_paths, is_video
+from facefusion.face_store import report_face_store
+from facefusion.filesystem import create_directory, filter_audio_paths, is_file, is_video, link_file, move_file, remove_file
+from facefusion.frame_manifest import init_frame_manifest, read_frame_manifest, write_frame_manifest
+from facefusion.frame_scheduler import schedule_frames
+from facefusion.frame_writer import write_frames
+from facefusion.inference_manager import report_inference_replicas
+from facefusion.model_preloader import conditional_start_preload_models, stop_preload_models
 from facefusion.processors.core import get_processors_modules
-from facefusion.temp_helper import clear_temp_directory, create_temp_directory, move_temp_file, resolve_temp_frame_paths
+from facefusion.run_context import create_run_context, create_tracked_face_context, get_source_audio_frame, get_source_voice_frame
+from facefusion.temp_helper import clear_temp_directory, create_temp_directory, get_temp_file_path, get_temp_frames_pattern, get_temp_pending_frame_path, get_temp_segment_file_path, get_temp_segment_path, move_temp_file, resolve_temp_frame_paths
 from facefusion.time_helper import calculate_end_time
-from facefusion.types import ErrorCode
-from facefusion.vision import conditional_merge_vision_mask, detect_video_resolution, extract_vision_mask, pack_resolution, read_static_image, read_static_images, read_static_video_frame, restrict_trim_frame, restrict_video_fps, restrict_video_resolution, scale_resolution, write_image
+from facefusion.types import ErrorCode, Fps, FrameManifest, FramePacket, RawPixelFormat, Resolution, RunContext, State, VisionFrame
+from facefusion.vision import conditional_merge_vision_mask, detect_video_resolution, extract_vision_mask, merge_vision_mask, pack_resolution, predict_video_frame_total, read_static_video_frame, read_temp_frame, restrict_trim_frame, restrict_video_fps, restrict_video_resolution, scale_resolution, split_trim_frame, write_temp_frame
+from facefusion.worker_pool import conditional_create_worker_pool, resolve_process_frame_packet
 from facefusion.workflows.core import is_process_stopping
 
+FRAME_CHECKPOINT_INTERVAL : float = 1.0
+
 
 def process(start_time : float) -> ErrorCode:
 	tasks =\
@@ -24,10 +39,28 @@ def process(start_time : float) -> ErrorCode:
 		setup,
 		extract_frames,
 		process_video,
-		merge_frames,
 		restore_audio,
 		partial(finalize_video, start_time)
 	]
+
+	if state_manager.get_item('temp_frame_mode') == 'memory':
+		tasks =\
+		[
+			setup,
+			stream_video,
+			restore_audio,
+			partial(finalize_video, start_time)
+		]
+
+	if state_manager.get_item('video_segment_count') and state_manager.get_item('video_segment_count') > 1:
+		tasks =\
+		[
+			setup,
+			process_segments,
+			concat_segments,
+			restore_audio,
+			partial(finalize_video, start_time)
+		]
 	process_manager.start()
 
 	for task in tasks:
@@ -49,10 +82,12 @@ def setup() -> ErrorCode:
 		if analyse_video(state_manager.get_item('target_path'), trim_frame_start, trim_frame_end):
 			return 3
 
-	logger.debug(translator.get('clearing_temp'), __name__)
-	clear_temp_directory(state_manager.get_item('target_path'))
-	logger.debug(translator.get('creating_temp'), __name__)
-	create_temp_directory(state_manager.get_item('target_path'))
+	if not read_frame_manifest(state_manager.get_item('target_path')):
+		logger.debug(translator.get('clearing_temp'), __name__)
+		clear_temp_directory(state_manager.get_item('target_path'))
+		logger.debug(translator.get('creating_temp'), __name__)
+		create_temp_directory(state_manager.get_item('target_path'))
+		init_frame_manifest(state_manager.get_item('target_path'))
 	return 0
 
 
@@ -61,9 +96,28 @@ def extract_frames() -> ErrorCode:
 	output_video_resolution = scale_resolution(detect_video_resolution(state_manager.get_item('target_path')), state_manager.get_item('output_video_scale'))
 	temp_video_resolution = restrict_video_resolution(state_manager.get_item('target_path'), output_video_resolution)
 	temp_video_fps = restrict_video_fps(state_manager.get_item('target_path'), state_manager.get_item('output_video_fps'))
+	frame_manifest = read_frame_manifest(state_manager.get_item('target_path'))
+
+	if frame_manifest and frame_manifest.get('extract_frame_total') and frame_manifest.get('extract_frame_total') == len(resolve_temp_frame_paths(state_manager.get_item('target_path'))):
+		logger.debug(translator.get('extracting_frames_skipped'), __name__)
+		return 0
+
+	extract_cache_key = None
+
+	if state_manager.get_item('frame_cache_limit'):
+		extract_cache_key = create_extract_cache_key(state_manager.get_item('target_path'), temp_video_resolution, temp_video_fps, trim_frame_start, trim_frame_end)
+
+	if extract_cache_key and restore_extract_cache(state_manager.get_item('target_path'), extract_cache_key):
+		logger.info(translator.get('extracting_frames_cached'), __name__)
+		update_extract_frame_total(frame_manifest)
+		return 0
+
 	logger.info(translator.get('extracting_frames').format(resolution=pack_resolution(temp_video_resolution), fps=temp_video_fps), __name__)
 
-	if ffmpeg.extract_frames(state_manager.get_item('target_path'), temp_video_resolution, temp_video_fps, trim_frame_start, trim_frame_end):
+	if extract_temp_frames(temp_video_resolution, temp_video_fps, trim_frame_start, trim_frame_end):
+		if extract_cache_key and store_extract_cache(state_manager.get_item('target_path'), extract_cache_key):
+			evict_cache(state_manager.get_item('frame_cache_limit'))
+		update_extract_frame_total(frame_manifest)
 		logger.debug(translator.get('extracting_frames_succeeded'), __name__)
 	else:
 		if is_process_stopping():
@@ -73,52 +127,227 @@ def extract_frames() -> ErrorCode:
 	return 0
 
 
+def update_extract_frame_total(frame_manifest : Optional[FrameManifest]) -> None:
+	if frame_manifest:
+		frame_manifest['extract_frame_total'] = len(resolve_temp_frame_paths(state_manager.get_item('target_path')))
+		frame_manifest['process_frame_total'] = 0
+		write_frame_manifest(state_manager.get_item('target_path'), frame_manifest)
+
+
+def extract_temp_frames(temp_video_resolution : Resolution, temp_video_fps : Fps, trim_frame_start : int, trim_frame_end : int) -> bool:
+	if state_manager.get_item('temp_frame_format') == 'npy':
+		extract_frame_total = predict_video_frame_total(state_manager.get_item('target_path'), temp_video_fps, trim_frame_start, trim_frame_end)
+		raw_pixel_format = ffmpeg.resolve_raw_pixel_format(state_manager.get_item('target_path'))
+		raw_channel_total = 4 if raw_pixel_format == 'bgra' else 3
+		extract_process = ffmpeg.open_extract_frames(state_manager.get_item('target_path'), temp_video_resolution, temp_video_fps, trim_frame_start, trim_frame_end, raw_pixel_format)
+
+		with tqdm(total = extract_frame_total, desc = translator.get('extracting'), unit = 'frame', ascii = ' =', disable = state_manager.get_item('log_level') in [ 'warn', 'error' ]) as progress:
+			for _ in write_frames(create_raw_frame_packets(extract_process, temp_video_resolution, raw_channel_total, 1), write_extract_frame, state_manager.get_item('execution_thread_count')):
+				if is_process_stopping():
+					extract_process.terminate()
+					break
+				progress.update()
+
+		extract_process.wait()
+		return extract_process.returncode == 0 and not is_process_stopping()
+	return ffmpeg.extract_frames(state_manager.get_item('target_path'), temp_video_resolution, temp_video_fps, trim_frame_start, trim_frame_end)
+
+
 def process_video() -> ErrorCode:
 	temp_frame_paths = resolve_temp_frame_paths(state_manager.get_item('target_path'))
 
 	if temp_frame_paths:
-		with tqdm(total = len(temp_frame_paths), desc = translator.get('processing'), unit = 'frame', ascii = ' =', disable = state_manager.get_item('log_level') in [ 'warn', 'error' ]) as progress:
+		output_video_resolution = scale_resolution(detect_video_resolution(state_manager.get_item('target_path')), state_manager.get_item('output_video_scale'))
+		raw_pixel_format = ffmpeg.resolve_raw_pixel_format(state_manager.get_item('target_path'))
+		frame_manifest = read_frame_manifest(state_manager.get_item('target_path'))
+		process_frame_total = restore_temp_frames(temp_frame_paths, frame_manifest)
+		run_context = prepare_run_context()
+		worker_pool = conditional_create_worker_pool(run_context, state_manager.get_item('execution_thread_count'))
+		output_cache_key = None
+		merge_process = None
+
+		if state_manager.get_item('frame_cache_limit'):
+			output_cache_key = create_output_cache_key(state_manager.get_item('target_path'))
+			init_output_cache(output_cache_key)
+
+		create_directory(os.path.dirname(get_temp_pending_frame_path(get_first(temp_frame_paths))))
+		logger.info(translator.get('merging_video').format(resolution = pack_resolution(output_video_resolution), fps = state_manager.get_item('output_video_fps')), __name__)
+
+		pending_frame_paths : List[str] = []
+		checkpoint_time = time()
+
+		with tqdm(total = len(temp_frame_paths), initial = process_frame_total, desc = translator.get('processing'), unit = 'frame', ascii = ' =', disable = state_manager.get_item('log_level') in [ 'warn', 'error' ]) as progress:
 			progress.set_postfix(execution_providers = state_manager.get_item('execution_providers'))
 
-			with ThreadPoolExecutor(max_workers = state_manager.get_item('execution_thread_count')) as executor:
-				futures = []
+			for temp_frame_path in temp_frame_paths[:process_frame_total]:
+				if is_process_stopping():
+					break
+				merge_process = feed_merge_process(merge_process, read_temp_frame(temp_frame_path), raw_pixel_format)
+
+				if merge_process.returncode is not None:
+					break
+
+			for frame_packet in write_frames(schedule_frames(create_temp_frame_packets(temp_frame_paths[process_frame_total:], resolve_frame_offset() + process_frame_total), resolve_process_frame_packet(worker_pool, run_context, partial(process_temp_frame, output_cache_key)), state_manager.get_item('execution_thread_count')), write_pending_frame, state_manager.get_item('execution_thread_count')):
+				if is_process_stopping() or merge_process and merge_process.returncode is not None:
+					break
+				pending_frame_paths.append(frame_packet.get('frame_path'))
 
-				for frame_number, temp_frame_path in enumerate(temp_frame_paths):
-					future = executor.submit(process_temp_frame, temp_frame_path, frame_number)
-					futures.append(future)
+				if time() - checkpoint_time > FRAME_CHECKPOINT_INTERVAL:
+					commit_temp_frames(pending_frame_paths, frame_manifest)
+					pending_frame_paths.clear()
+					checkpoint_time = time()
+				merge_process = feed_merge_process(merge_process, frame_packet.get('vision_frame'), raw_pixel_format)
+				progress.update()
 
-				for future in as_completed(futures):
-					if is_process_stopping():
-						for __future__ in futures:
-							__future__.cancel()
+		commit_temp_frames(pending_frame_paths, frame_manifest)
 
-					if not future.cancelled():
-						future.result()
-						progress.update()
+		if worker_pool:
+			worker_pool.shutdown(cancel_futures = True)
+
+		stop_preload_models()
+		report_inference_replicas()
+		report_face_store()
 
 		for processor_module in get_processors_modules(state_manager.get_item('processors')):
 			processor_module.post_process()
 
+		if output_cache_key:
+			evict_cache(state_manager.get_item('frame_cache_limit'))
+
 		if is_process_stopping():
+			if merge_process:
+				merge_process.terminate()
 			return 4
+
+		if close_merge_process(merge_process):
+			logger.debug(translator.get('merging_video_succeeded'), __name__)
+		else:
+			logger.error(translator.get('merging_video_failed'), __name__)
+			return 1
 	else:
 		logger.error(translator.get('temp_frames_not_found'), __name__)
 		return 1
 	return 0
 
 
-def merge_frames() -> ErrorCode:
+def stream_video() -> ErrorCode:
 	trim_frame_start, trim_frame_end = restrict_trim_frame(state_manager.get_item('target_path'), state_manager.get_item('trim_frame_start'), state_manager.get_item('trim_frame_end'))
 	output_video_resolution = scale_resolution(detect_video_resolution(state_manager.get_item('target_path')), state_manager.get_item('output_video_scale'))
+	temp_video_resolution = restrict_video_resolution(state_manager.get_item('target_path'), output_video_resolution)
 	temp_video_fps = restrict_video_fps(state_manager.get_item('target_path'), state_manager.get_item('output_video_fps'))
+	stream_frame_total = predict_video_frame_total(state_manager.get_item('target_path'), temp_video_fps, trim_frame_start, trim_frame_end)
+	raw_pixel_format = ffmpeg.resolve_raw_pixel_format(state_manager.get_item('target_path'))
+	raw_channel_total = 4 if raw_pixel_format == 'bgra' else 3
+	logger.info(translator.get('streaming_frames').format(resolution = pack_resolution(temp_video_resolution), fps = temp_video_fps), __name__)
+
+	run_context = prepare_run_context()
+	worker_pool = conditional_create_worker_pool(run_context, state_manager.get_item('execution_thread_count'))
+	extract_process = ffmpeg.open_extract_frames(state_manager.get_item('target_path'), temp_video_resolution, temp_video_fps, trim_frame_start, trim_frame_end, raw_pixel_format)
+	merge_process = None
+	frame_total = 0
 
-	logger.info(translator.get('merging_video').format(resolution = pack_resolution(output_video_resolution), fps = state_manager.get_item('output_video_fps')), __name__)
-	if ffmpeg.merge_video(state_manager.get_item('target_path'), temp_video_fps, output_video_resolution, state_manager.get_item('output_video_fps'), trim_frame_start, trim_frame_end):
-		logger.debug(translator.get('merging_video_succeeded'), __name__)
+	with tqdm(total = stream_frame_total, desc = translator.get('processing'), unit = 'frame', ascii = ' =', disable = state_manager.get_item('log_level') in [ 'warn', 'error' ]) as progress:
+		progress.set_postfix(execution_providers = state_manager.get_item('execution_providers'))
+
+		for frame_packet in schedule_frames(create_raw_frame_packets(extract_process, temp_video_resolution, raw_channel_total, resolve_frame_offset()), resolve_process_frame_packet(worker_pool, run_context, process_raw_frame), state_manager.get_item('execution_thread_count')):
+			if is_process_stopping():
+				break
+			merge_process = feed_merge_process(merge_process, frame_packet.get('vision_frame'), raw_pixel_format)
+			frame_total += 1
+			progress.update()
+
+			if merge_process.returncode is not None:
+				break
+
+	if worker_pool:
+		worker_pool.shutdown(cancel_futures = True)
+
+	stop_preload_models()
+	report_inference_replicas()
+	report_face_store()
+
+	for processor_module in get_processors_modules(state_manager.get_item('processors')):
+		processor_module.post_process()
+
+	if is_process_stopping():
+		extract_process.terminate()
+		if merge_process:
+			merge_process.terminate()
+		return 4
+
+	if merge_process and merge_process.returncode is not None:
+		extract_process.kill()
+
+	extract_process.wait()
+	merge_process_closed = close_merge_process(merge_process)
+
+	if frame_total == 0:
+		logger.error(translator.get('temp_frames_not_found'), __name__)
+		return 1
+	if extract_process.returncode == 0 and merge_process_closed:
+		logger.debug(translator.get('streaming_frames_succeeded'), __name__)
 	else:
+		logger.error(translator.get('streaming_frames_failed'), __name__)
+		return 1
+	return 0
+
+
+def process_segments() -> ErrorCode:
+	trim_frame_start, trim_frame_end = restrict_trim_frame(state_manager.get_item('target_path'), state_manager.get_item('trim_frame_start'), state_manager.get_item('trim_frame_end'))
+	temp_video_fps = restrict_video_fps(state_manager.get_item('target_path'), state_manager.get_item('output_video_fps'))
+	trim_frame_ranges = split_trim_frame(trim_frame_start, trim_frame_end, state_manager.get_item('video_segment_count'))
+	segment_processes : Dict[int, multiprocessing.process.BaseProcess] = {}
+	logger.info(translator.get('processing_segments').format(segment_total = len(trim_frame_ranges)), __name__)
+
+	for segment_index, (segment_frame_start, segment_frame_end) in enumerate(trim_frame_ranges):
+		if not is_video(get_temp_segment_file_path(state_manager.get_item('target_path'), segment_index)):
+			segment_frame_offset = predict_video_frame_total(state_manager.get_item('target_path'), temp_video_fps, trim_frame_start, segment_frame_start)
+			segment_process : multiprocessing.process.BaseProcess = multiprocessing.get_context('spawn').Process(target = process_segment, args = (state_manager.get_state().copy(), segment_index, segment_frame_start, segment_frame_end, segment_frame_offset))
+			segment_process.start()
+			segment_processes[segment_index] = segment_process
+
+	while any(segment_process.is_alive() for segment_process in segment_processes.values()):
 		if is_process_stopping():
+			for segment_process in segment_processes.values():
+				segment_process.terminate()
+				segment_process.join()
 			return 4
-		logger.error(translator.get('merging_video_failed'), __name__)
+		sleep(0.5)
+
+	for segment_index, segment_process in segment_processes.items():
+		if segment_process.exitcode != 0:
+			logger.error(translator.get('processing_segment_failed').format(segment_index = segment_index), __name__)
+			return 1
+	return 0
+
+
+def process_segment(state : State, segment_index : int, trim_frame_start : int, trim_frame_end : int, frame_offset : int) -> None:
+	for key, value in state.items():
+		state_manager.init_item(key, value) #type:ignore[arg-type]
+
+	state_manager.init_item('cache_path', get_cache_path())
+	state_manager.init_item('output_path', get_temp_segment_file_path(state_manager.get_item('target_path'), segment_index))
+	state_manager.init_item('temp_path', get_temp_segment_path(state_manager.get_item('target_path'), segment_index))
+	state_manager.init_item('trim_frame_start', trim_frame_start)
+	state_manager.init_item('trim_frame_end', trim_frame_end)
+	state_manager.init_item('video_segment_count', 1)
+	state_manager.init_item('video_segment_offset', frame_offset)
+	state_manager.init_item('output_audio_volume', 0)
+	state_manager.init_item('skip_nsfw_check', True)
+	logger.init(state_manager.get_item('log_level'))
+	conditional_start_preload_models()
+	sys.exit(process(time()))
+
+
+def concat_segments() -> ErrorCode:
+	trim_frame_start, trim_frame_end = restrict_trim_frame(state_manager.get_item('target_path'), state_manager.get_item('trim_frame_start'), state_manager.get_item('trim_frame_end'))
+	trim_frame_ranges = split_trim_frame(trim_frame_start, trim_frame_end, state_manager.get_item('video_segment_count'))
+	temp_segment_file_paths = [ get_temp_segment_file_path(state_manager.get_item('target_path'), segment_index) for segment_index in range(len(trim_frame_ranges)) ]
+
+	if ffmpeg.concat_video(get_temp_file_path(state_manager.get_item('target_path')), temp_segment_file_paths):
+		logger.debug(translator.get('concatenating_segments_succeeded'), __name__)
+	else:
+		logger.error(translator.get('concatenating_segments_failed'), __name__)
 		return 1
 	return 0
 
@@ -154,28 +383,138 @@ def restore_audio() -> ErrorCode:
 	return 0
 
 
-def process_temp_frame(temp_frame_path : str, frame_number : int) -> bool:
+def resolve_frame_offset() -> int:
+	if state_manager.get_item('video_segment_offset'):
+		return state_manager.get_item('video_segment_offset')
+	return 0
+
+
+def create_temp_frame_packets(temp_frame_paths : List[str], frame_offset : int) -> Iterator[FramePacket]:
+	for frame_number, temp_frame_path in enumerate(temp_frame_paths, frame_offset):
+		yield\
+		{
+			'frame_number': frame_number,
+			'frame_path': temp_frame_path,
+			'cache_frame_path': None,
+			'vision_frame': None
+		}
+
+
+def create_raw_frame_packets(extract_process : subprocess.Popen[bytes], temp_video_resolution : Resolution, raw_channel_total : int, frame_offset : int) -> Iterator[FramePacket]:
+	temp_video_width, temp_video_height = temp_video_resolution
+	raw_frame_size = temp_video_width * temp_video_height * raw_channel_total
+	frame_number = frame_offset
+
+	while len(frame_buffer := extract_process.stdout.read(raw_frame_size)) == raw_frame_size:
+		yield\
+		{
+			'frame_number': frame_number,
+			'frame_path': None,
+			'cache_frame_path': None,
+			'vision_frame': numpy.frombuffer(frame_buffer, dtype = numpy.uint8).reshape(temp_video_height, temp_video_width, raw_channel_total)
+		}
+		frame_number += 1
+
+
+def prepare_run_context() -> RunContext:
 	reference_vision_frame = read_static_video_frame(state_manager.get_item('target_path'), state_manager.get_item('reference_frame_number'))
-	source_vision_frames = read_static_images(state_manager.get_item('source_paths'))
-	source_audio_path = get_first(filter_audio_paths(state_manager.get_item('source_paths')))
 	temp_video_fps = restrict_video_fps(state_manager.get_item('target_path'), state_manager.get_item('output_video_fps'))
-	target_vision_frame = read_static_image(temp_frame_path, 'rgba')
-	temp_vision_frame = target_vision_frame.copy()
-	temp_vision_mask = extract_vision_mask(temp_vision_frame)
+	return create_run_context(reference_vision_frame, temp_video_fps)
+
+
+def restore_temp_frames(temp_frame_paths : List[str], frame_manifest : Optional[FrameManifest]) -> int:
+	if frame_manifest:
+		process_frame_total = min(frame_manifest.get('process_frame_total'), len(temp_frame_paths))
+
+		for temp_frame_path in temp_frame_paths[:process_frame_total]:
+			temp_pending_frame_path = get_temp_pending_frame_path(temp_frame_path)
+
+			if is_file(temp_pending_frame_path):
+				move_file(temp_pending_frame_path, temp_frame_path)
+
+		if process_frame_total:
+			logger.info(translator.get('resuming_frames').format(frame_total = process_frame_total), __name__)
+		return process_frame_total
+	return 0
+
+
+def commit_temp_frames(temp_frame_paths : List[str], frame_manifest : Optional[FrameManifest]) -> None:
+	if frame_manifest and temp_frame_paths:
+		frame_manifest['process_frame_total'] += len(temp_frame_paths)
+		write_frame_manifest(state_manager.get_item('target_path'), frame_manifest)
+
+	for temp_frame_path in temp_frame_paths:
+		move_file(get_temp_pending_frame_path(temp_frame_path), temp_frame_path)
 
-	source_audio_frame = get_audio_frame(source_audio_path, temp_video_fps, frame_number)
-	source_voice_frame = get_voice_frame(source_audio_path, temp_video_fps, frame_number)
 
-	if not numpy.any(source_audio_frame):
-		source_audio_frame = create_empty_audio_frame()
-	if not numpy.any(source_voice_frame):
-		source_voice_frame = create_empty_audio_frame()
+def process_temp_frame(output_cache_key : Optional[str], run_context : RunContext, frame_packet : FramePacket) -> FramePacket:
+	output_cache_frame_path = None
+
+	if output_cache_key:
+		output_cache_frame_path = get_output_cache_frame_path(output_cache_key, frame_packet.get('frame_path'), frame_packet.get('frame_number'))
+
+		if is_file(output_cache_frame_path):
+			return\
+			{
+				'frame_number': frame_packet.get('frame_number'),
+				'frame_path': frame_packet.get('frame_path'),
+				'cache_frame_path': output_cache_frame_path,
+				'vision_frame': read_temp_frame(output_cache_frame_path)
+			}
+
+	target_vision_frame = read_temp_frame(frame_packet.get('frame_path'))
+	temp_vision_frame = process_vision_frame(run_context, target_vision_frame, frame_packet.get('frame_number'))
+	return\
+	{
+		'frame_number': frame_packet.get('frame_number'),
+		'frame_path': frame_packet.get('frame_path'),
+		'cache_frame_path': output_cache_frame_path,
+		'vision_frame': temp_vision_frame
+	}
+
+
+def write_pending_frame(frame_packet : FramePacket) -> FramePacket:
+	temp_pending_frame_path = get_temp_pending_frame_path(frame_packet.get('frame_path'))
+	output_cache_frame_path = frame_packet.get('cache_frame_path')
+
+	if output_cache_frame_path and link_file(output_cache_frame_path, temp_pending_frame_path):
+		return frame_packet
+
+	remove_file(temp_pending_frame_path)
+
+	if write_temp_frame(temp_pending_frame_path, frame_packet.get('vision_frame')) and output_cache_frame_path:
+		link_file(temp_pending_frame_path, output_cache_frame_path)
+	return frame_packet
+
+
+def write_extract_frame(frame_packet : FramePacket) -> FramePacket:
+	write_temp_frame(get_temp_frames_pattern(state_manager.get_item('target_path'), '{:08d}'.format(frame_packet.get('frame_number'))), frame_packet.get('vision_frame'))
+	return frame_packet
+
+
+def process_raw_frame(run_context : RunContext, frame_packet : FramePacket) -> FramePacket:
+	temp_vision_frame = process_vision_frame(run_context, frame_packet.get('vision_frame'), frame_packet.get('frame_number'))
+	return\
+	{
+		'frame_number': frame_packet.get('frame_number'),
+		'frame_path': None,
+		'cache_frame_path': None,
+		'vision_frame': temp_vision_frame
+	}
+
+
+def process_vision_frame(run_context : RunContext, target_vision_frame : VisionFrame, frame_number : int) -> VisionFrame:
+	temp_vision_frame = target_vision_frame.copy()
+	temp_vision_mask = extract_vision_mask(temp_vision_frame)
+	face_context = create_tracked_face_context(run_context, target_vision_frame, frame_number)
+	source_audio_frame = get_source_audio_frame(run_context, frame_number)
+	source_voice_frame = get_source_voice_frame(run_context, frame_number)
 
 	for processor_module in get_processors_modules(state_manager.get_item('processors')):
 		temp_vision_frame, temp_vision_mask = processor_module.process_frame(
 		{
-			'reference_vision_frame': reference_vision_frame,
-			'source_vision_frames': source_vision_frames,
+			'face_context': face_context,
+			'source_vision_frames': run_context.source_vision_frames,
 			'source_audio_frame': source_audio_frame,
 			'source_voice_frame': source_voice_frame,
 			'target_vision_frame': target_vision_frame[:, :, :3],
@@ -183,8 +522,41 @@ def process_temp_frame(temp_frame_path : str, frame_number : int) -> bool:
 			'temp_vision_mask': temp_vision_mask
 		})
 
-	temp_vision_frame = conditional_merge_vision_mask(temp_vision_frame, temp_vision_mask)
-	return write_image(temp_frame_path, temp_vision_frame)
+	return conditional_merge_vision_mask(temp_vision_frame, temp_vision_mask)
+
+
+def feed_merge_process(merge_process : Optional[subprocess.Popen[bytes]], vision_frame : VisionFrame, raw_pixel_format : RawPixelFormat) -> subprocess.Popen[bytes]:
+	raw_channel_total = 4 if raw_pixel_format == 'bgra' else 3
+	temp_vision_frame = prepare_raw_frame(vision_frame, raw_channel_total)
+
+	if not merge_process:
+		output_video_resolution = scale_resolution(detect_video_resolution(state_manager.get_item('target_path')), state_manager.get_item('output_video_scale'))
+		temp_video_fps = restrict_video_fps(state_manager.get_item('target_path'), state_manager.get_item('output_video_fps'))
+		merge_process = ffmpeg.open_merge_video(state_manager.get_item('target_path'), temp_video_fps, (temp_vision_frame.shape[1], temp_vision_frame.shape[0]), output_video_resolution, state_manager.get_item('output_video_fps'), raw_pixel_format)
+
+	try:
+		merge_process.stdin.write(temp_vision_frame.tobytes())
+	except OSError:
+		merge_process.terminate()
+		merge_process.wait()
+	return merge_process
+
+
+def close_merge_process(merge_process : Optional[subprocess.Popen[bytes]]) -> bool:
+	if merge_process:
+		try:
+			merge_process.stdin.close()
+		except OSError:
+			merge_process.terminate()
+		merge_process.wait()
+		return merge_process.returncode == 0
+	return False
+
+
+def prepare_raw_frame(vision_frame : VisionFrame, raw_channel_total : int) -> VisionFrame:
+	if raw_channel_total == 4:
+		return merge_vision_mask(vision_frame, extract_vision_mask(vision_frame))
+	return vision_frame[:, :, :3]
 
 
 def finalize_video(start_time : float) -> ErrorCode:
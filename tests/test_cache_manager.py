@@ -0,0 +1,120 @@
+import os
+import tempfile
+
+import pytest
+
+from facefusion import state_manager
+from facefusion.cache_manager import create_extract_cache_key, create_output_cache_key, create_static_file_hash, evict_cache, get_cache_entry_path, get_cache_path, get_output_cache_frame_path, init_output_cache, resolve_cache_entry_paths, restore_extract_cache, store_extract_cache
+from facefusion.filesystem import remove_directory
+from facefusion.jobs import job_store
+from facefusion.temp_helper import clear_temp_directory, create_temp_directory, get_temp_frames_pattern, resolve_temp_frame_paths
+from .helper import get_test_output_file, prepare_test_output_directory
+
+
+@pytest.fixture(scope = 'module', autouse = True)
+def before_all() -> None:
+	prepare_test_output_directory()
+	state_manager.init_item('temp_path', tempfile.mkdtemp())
+	state_manager.init_item('temp_frame_format', 'png')
+	state_manager.init_item('keep_temp', False)
+	state_manager.init_item('processors', [ 'face_enhancer' ])
+	state_manager.init_item('source_paths', [])
+	state_manager.init_item('face_enhancer_blend', 80)
+	state_manager.init_item('trim_frame_start', 0)
+	job_store.register_step_keys([ 'face_enhancer_blend', 'trim_frame_start' ])
+
+	with open(get_test_output_file('target-cache.mp4'), 'wb') as target_file:
+		target_file.write(b'target')
+
+
+@pytest.fixture(scope = 'function', autouse = True)
+def before_each() -> None:
+	remove_directory(get_cache_path())
+	clear_temp_directory(get_test_output_file('target-cache.mp4'))
+	create_temp_directory(get_test_output_file('target-cache.mp4'))
+
+
+def create_temp_frames(frame_total : int) -> None:
+	for frame_number in range(1, frame_total + 1):
+		with open(get_temp_frames_pattern(get_test_output_file('target-cache.mp4'), '{:08d}'.format(frame_number)), 'wb') as temp_frame_file:
+			temp_frame_file.write(os.urandom(1024))
+
+
+def test_create_static_file_hash() -> None:
+	with open(get_test_output_file('target-cache-large.mp4'), 'wb') as target_file:
+		target_file.write(bytes(16 * 1024 * 1024))
+
+	target_hash = create_static_file_hash(get_test_output_file('target-cache-large.mp4'), 0, 0)
+
+	with open(get_test_output_file('target-cache-large.mp4'), 'r+b') as target_file:
+		target_file.seek(8 * 1024 * 1024)
+		target_file.write(b'target')
+
+	assert create_static_file_hash(get_test_output_file('target-cache-large.mp4'), 0, 0) == target_hash
+	assert create_static_file_hash(get_test_output_file('target-cache-large.mp4'), 0, 1) != target_hash
+	assert create_static_file_hash(get_test_output_file('target-cache.mp4'), 0, 0) != target_hash
+	assert create_static_file_hash('invalid', 0, 0) is None
+
+
+def test_create_extract_cache_key() -> None:
+	extract_cache_key = create_extract_cache_key(get_test_output_file('target-cache.mp4'), (426, 226), 25.0, 0, 10)
+
+	assert extract_cache_key == create_extract_cache_key(get_test_output_file('target-cache.mp4'), (426, 226), 25.0, 0, 10)
+	assert extract_cache_key != create_extract_cache_key(get_test_output_file('target-cache.mp4'), (426, 226), 25.0, 0, 20)
+	assert extract_cache_key != create_extract_cache_key(get_test_output_file('target-cache.mp4'), (852, 452), 25.0, 0, 10)
+	assert create_extract_cache_key('invalid', (426, 226), 25.0, 0, 10) is None
+
+
+def test_create_output_cache_key() -> None:
+	output_cache_key = create_output_cache_key(get_test_output_file('target-cache.mp4'))
+
+	state_manager.init_item('trim_frame_start', 10)
+
+	assert create_output_cache_key(get_test_output_file('target-cache.mp4')) == output_cache_key
+
+	state_manager.init_item('face_enhancer_blend', 60)
+
+	assert create_output_cache_key(get_test_output_file('target-cache.mp4')) != output_cache_key
+
+	state_manager.init_item('face_enhancer_blend', 80)
+	state_manager.init_item('processors', [ 'face_enhancer', 'frame_enhancer' ])
+
+	assert create_output_cache_key(get_test_output_file('target-cache.mp4')) != output_cache_key
+
+	state_manager.init_item('processors', [ 'face_enhancer' ])
+
+
+def test_get_output_cache_frame_path() -> None:
+	create_temp_frames(2)
+	first_temp_frame_path, second_temp_frame_path = resolve_temp_frame_paths(get_test_output_file('target-cache.mp4'))
+
+	assert init_output_cache('target') is True
+	assert get_output_cache_frame_path('target', first_temp_frame_path, 0) == get_output_cache_frame_path('target', first_temp_frame_path, 1)
+	assert get_output_cache_frame_path('target', first_temp_frame_path, 0) != get_output_cache_frame_path('target', second_temp_frame_path, 0)
+	assert get_output_cache_frame_path('target', first_temp_frame_path, 0).startswith(get_cache_entry_path('outputs', 'target'))
+	assert get_output_cache_frame_path('target', 'invalid', 0) is None
+
+
+def test_restore_extract_cache() -> None:
+	assert restore_extract_cache(get_test_output_file('target-cache.mp4'), 'invalid') is False
+
+	create_temp_frames(10)
+
+	assert store_extract_cache(get_test_output_file('target-cache.mp4'), 'target') is True
+
+	clear_temp_directory(get_test_output_file('target-cache.mp4'))
+	create_temp_directory(get_test_output_file('target-cache.mp4'))
+
+	assert restore_extract_cache(get_test_output_file('target-cache.mp4'), 'target') is True
+	assert len(resolve_temp_frame_paths(get_test_output_file('target-cache.mp4'))) == 10
+
+
+def test_evict_cache() -> None:
+	create_temp_frames(10)
+
+	assert store_extract_cache(get_test_output_file('target-cache.mp4'), 'first') is True
+	assert store_extract_cache(get_test_output_file('target-cache.mp4'), 'second') is True
+	assert evict_cache(1) == 0
+	assert evict_cache(0) == 2
+	assert resolve_cache_entry_paths() == []
+	assert not os.path.exists(get_cache_entry_path('frames', 'first'))
@@ -0,0 +1,85 @@
+import numpy
+import pytest
+
+from facefusion import face_store
+from facefusion.face_store import calculate_faces_size, clear_static_faces, create_vision_hash, get_face_store, get_static_faces, report_face_store, set_static_faces
+from facefusion.types import Face
+
+
+@pytest.fixture(scope = 'function', autouse = True)
+def before_each() -> None:
+	clear_static_faces()
+
+
+def create_face() -> Face:
+	return Face(
+		bounding_box = numpy.zeros(4, dtype = numpy.float32),
+		score_set = {},
+		landmark_set =
+		{
+			'5': numpy.zeros((5, 2), dtype = numpy.float32)
+		},
+		angle = 0,
+		embedding = numpy.zeros(512, dtype = numpy.float32),
+		embedding_norm = None,
+		gender = None,
+		age = None,
+		race = None
+	)
+
+
+def test_create_vision_hash() -> None:
+	vision_frame = numpy.zeros((2160, 3840, 3), dtype = numpy.uint8)
+
+	assert create_vision_hash(vision_frame) == create_vision_hash(vision_frame.copy())
+	assert create_vision_hash(vision_frame) != create_vision_hash(numpy.zeros((3840, 2160, 3), dtype = numpy.uint8))
+	assert create_vision_hash(vision_frame) != create_vision_hash(numpy.full((2160, 3840, 3), 255, dtype = numpy.uint8))
+	assert create_vision_hash(vision_frame) != create_vision_hash(numpy.zeros((2160, 3840, 3), dtype = numpy.float32))
+
+	changed_vision_frame = vision_frame.copy()
+	changed_vision_frame[1, 1, 1] = 1
+
+	assert create_vision_hash(vision_frame) != create_vision_hash(changed_vision_frame)
+
+
+def test_calculate_faces_size() -> None:
+	assert calculate_faces_size([]) == 0
+	assert calculate_faces_size([ create_face() ]) == 16 + 40 + 2048
+
+
+def test_get_static_faces() -> None:
+	vision_frame = numpy.zeros((24, 32, 3), dtype = numpy.uint8)
+
+	assert get_static_faces(vision_frame) is None
+
+	set_static_faces(vision_frame, [ create_face() ])
+
+	assert len(get_static_faces(vision_frame)) == 1
+	assert get_face_store().get('hit_total') == 1
+	assert get_face_store().get('miss_total') == 1
+
+
+def test_set_static_faces_evicts(monkeypatch : pytest.MonkeyPatch) -> None:
+	monkeypatch.setattr(face_store, 'FACE_STORE_LIMIT', calculate_faces_size([ create_face() ]) * 2)
+
+	for index in range(4):
+		set_static_faces(numpy.full((24, 32, 3), index, dtype = numpy.uint8), [ create_face() ])
+
+	assert len(get_face_store().get('static_faces')) == 2
+	assert get_face_store().get('evict_total') == 2
+	assert get_static_faces(numpy.full((24, 32, 3), 0, dtype = numpy.uint8)) is None
+	assert get_static_faces(numpy.full((24, 32, 3), 3, dtype = numpy.uint8)) is not None
+
+
+def test_report_face_store(monkeypatch : pytest.MonkeyPatch) -> None:
+	debug_messages = []
+	monkeypatch.setattr(face_store.logger, 'debug', lambda message, module_name: debug_messages.append(message))
+
+	report_face_store()
+
+	assert debug_messages == []
+
+	get_static_faces(numpy.zeros((24, 32, 3), dtype = numpy.uint8))
+	report_face_store()
+
+	assert debug_messages == [ 'face store hit 0 times, missed 1 times and evicted 0 times' ]
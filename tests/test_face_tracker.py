@@ -0,0 +1,115 @@
+from typing import List
+
+import numpy
+import pytest
+
+from facefusion import state_manager
+from facefusion.face_helper import calculate_bounding_box_iou
+from facefusion.face_tracker import associate_track_ids, clear_stale_face_identities, create_face_tracker_store, detect_identity_drift, detect_scene_change, find_face_track_set, resolve_face_identity, store_face_track_set
+from facefusion.types import BoundingBox, Face, FaceIdentity, FaceTrackSet
+
+
+@pytest.fixture(scope = 'module', autouse = True)
+def before_all() -> None:
+	state_manager.init_item('face_detector_interval', 5)
+
+
+def create_face(bounding_box : BoundingBox) -> Face:
+	return Face(
+		bounding_box = bounding_box,
+		score_set = None,
+		landmark_set = None,
+		angle = 0,
+		embedding = None,
+		embedding_norm = None,
+		gender = None,
+		age = None,
+		race = None
+	)
+
+
+def create_face_track_set(key_frame_number : int, faces : List[Face], track_ids : List[int]) -> FaceTrackSet:
+	return\
+	{
+		'key_frame_number': key_frame_number,
+		'thumbnail_frame': numpy.zeros((64, 64, 3), dtype = numpy.uint8),
+		'faces': faces,
+		'track_ids': track_ids
+	}
+
+
+def test_calculate_bounding_box_iou() -> None:
+	assert calculate_bounding_box_iou(numpy.array([ 0, 0, 10, 10 ]), numpy.array([ 0, 0, 10, 10 ])) == 1.0
+	assert calculate_bounding_box_iou(numpy.array([ 0, 0, 10, 10 ]), numpy.array([ 5, 0, 15, 10 ])) == pytest.approx(1 / 3)
+	assert calculate_bounding_box_iou(numpy.array([ 0, 0, 10, 10 ]), numpy.array([ 20, 20, 30, 30 ])) == 0.0
+
+
+def test_find_face_track_set() -> None:
+	face_tracker_store = create_face_tracker_store()
+
+	assert find_face_track_set(face_tracker_store, 0) is None
+
+	store_face_track_set(face_tracker_store, 0, create_face_track_set(0, [], []))
+	store_face_track_set(face_tracker_store, 2, create_face_track_set(0, [], []))
+
+	assert find_face_track_set(face_tracker_store, 2) is face_tracker_store.get('face_track_sets').get(0)
+	assert find_face_track_set(face_tracker_store, 3) is face_tracker_store.get('face_track_sets').get(2)
+
+	store_face_track_set(face_tracker_store, 10, create_face_track_set(10, [], []))
+
+	assert list(face_tracker_store.get('face_track_sets').keys()) == [ 10 ]
+
+
+def test_associate_track_ids() -> None:
+	face_tracker_store = create_face_tracker_store()
+	first_face = create_face(numpy.array([ 0, 0, 100, 100 ]))
+	second_face = create_face(numpy.array([ 200, 0, 300, 100 ]))
+
+	assert associate_track_ids(face_tracker_store, [ first_face, second_face ], None) == [ 1, 2 ]
+
+	face_track_set = create_face_track_set(0, [ first_face, second_face ], [ 1, 2 ])
+	moved_first_face = create_face(numpy.array([ 10, 0, 110, 100 ]))
+	third_face = create_face(numpy.array([ 400, 0, 500, 100 ]))
+
+	assert associate_track_ids(face_tracker_store, [ third_face, moved_first_face ], face_track_set) == [ 3, 1 ]
+
+
+def test_resolve_face_identity() -> None:
+	face_tracker_store = create_face_tracker_store()
+	identity_face = create_face(numpy.array([ 0, 0, 100, 100 ]))._replace(embedding = numpy.ones(512), gender = 'female', age = range(20, 30), race = 'white')
+	face_tracker_store['face_identities'][1] =\
+	{
+		'frame_number': 0,
+		'face': identity_face
+	}
+	face = resolve_face_identity(face_tracker_store, numpy.zeros((240, 320, 3), dtype = numpy.uint8), 5, create_face(numpy.array([ 5, 5, 105, 105 ])), 1, [ 'embedding', 'classification' ])
+
+	assert numpy.array_equal(face.embedding, identity_face.embedding)
+	assert face.gender == 'female'
+	assert face.bounding_box.tolist() == [ 5, 5, 105, 105 ]
+
+	clear_stale_face_identities(face_tracker_store, [ 2 ])
+
+	assert face_tracker_store.get('face_identities') == {}
+
+
+def test_detect_identity_drift() -> None:
+	face_identity : FaceIdentity =\
+	{
+		'frame_number': 0,
+		'face': create_face(numpy.array([ 0, 0, 100, 100 ]))
+	}
+
+	assert detect_identity_drift(face_identity, 5, create_face(numpy.array([ 10, 0, 110, 100 ]))) is False
+	assert detect_identity_drift(face_identity, 25, create_face(numpy.array([ 10, 0, 110, 100 ]))) is True
+	assert detect_identity_drift(face_identity, 5, create_face(numpy.array([ 0, 0, 200, 200 ]))) is True
+	assert detect_identity_drift(face_identity, 5, create_face(numpy.array([ 0, 0, 100, 100 ]))._replace(angle = 90)) is True
+
+
+def test_detect_scene_change() -> None:
+	dark_frame = numpy.full((64, 64, 3), 20, dtype = numpy.uint8)
+	bright_frame = numpy.zeros((64, 64, 3), dtype = numpy.uint8)
+	bright_frame[:, :, 1] = 255
+
+	assert detect_scene_change(dark_frame, dark_frame) is False
+	assert detect_scene_change(dark_frame, bright_frame) is True
@@ -1,16 +1,18 @@
 import os
 import subprocess
 import tempfile
+from typing import List, Tuple
 
 import pytest
 
 import facefusion.ffmpeg
 from facefusion import process_manager, state_manager
 from facefusion.download import conditional_download
-from facefusion.ffmpeg import concat_video, extract_frames, merge_video, read_audio_buffer, replace_audio, restore_audio
+from facefusion.ffmpeg import concat_video, extract_frames, open_extract_frames, open_merge_video, read_audio_buffer, replace_audio, restore_audio
 from facefusion.filesystem import copy_file
 from facefusion.temp_helper import clear_temp_directory, create_temp_directory, get_temp_file_path, resolve_temp_frame_paths
-from facefusion.types import EncoderSet
+from facefusion.types import EncoderSet, RawPixelFormat
+from facefusion.vision import count_video_frame_total
 from .helper import get_test_example_file, get_test_examples_directory, get_test_output_file, prepare_test_output_directory
 
 
@@ -90,7 +92,24 @@ def test_extract_frames() -> None:
 		clear_temp_directory(target_path)
 
 
-def test_merge_video() -> None:
+def test_open_extract_frames() -> None:
+	test_set : List[Tuple[str, int, int, RawPixelFormat, int]] =\
+	[
+		(get_test_example_file('target-240p-25fps.mp4'), 0, 10, 'bgr24', 12),
+		(get_test_example_file('target-240p-30fps.mp4'), 0, 10, 'bgr24', 10),
+		(get_test_example_file('target-240p-30fps.mp4'), 0, 10, 'bgra', 10)
+	]
+
+	for target_path, trim_frame_start, trim_frame_end, raw_pixel_format, frame_total in test_set:
+		raw_channel_total = 4 if raw_pixel_format == 'bgra' else 3
+		extract_process = open_extract_frames(target_path, (452, 240), 30.0, trim_frame_start, trim_frame_end, raw_pixel_format)
+		frame_buffer, _ = extract_process.communicate()
+
+		assert extract_process.returncode == 0
+		assert len(frame_buffer) == 452 * 240 * raw_channel_total * frame_total
+
+
+def test_open_merge_video() -> None:
 	target_paths =\
 	[
 		get_test_example_file('target-240p-16khz.avi'),
@@ -107,13 +126,27 @@ def test_merge_video() -> None:
 		for output_video_encoder in output_video_encoders:
 			state_manager.init_item('output_video_encoder', output_video_encoder)
 			create_temp_directory(target_path)
-			extract_frames(target_path, (452, 240), 25.0, 0, 1)
+			extract_process = open_extract_frames(target_path, (452, 240), 25.0, 0, 10, 'bgr24')
+			frame_buffer, _ = extract_process.communicate()
+			merge_process = open_merge_video(target_path, 25.0, (452, 240), (452, 240), 25.0, 'bgr24')
+			merge_process.communicate(frame_buffer)
 
-			assert merge_video(target_path, 25.0, (452, 240), 25.0, 0, 1) is True
+			assert merge_process.returncode == 0
 
 		clear_temp_directory(target_path)
 
 	state_manager.init_item('output_video_encoder', 'libx264')
+	target_path = get_test_example_file('target-240p-16khz.mp4')
+	create_temp_directory(target_path)
+	extract_process = open_extract_frames(target_path, (452, 240), 25.0, 0, 10, 'bgr24')
+	frame_buffer, _ = extract_process.communicate()
+	merge_process = open_merge_video(target_path, 25.0, (452, 240), (452, 240), 25.0, 'bgr24')
+	merge_process.communicate(frame_buffer)
+
+	assert merge_process.returncode == 0
+	assert count_video_frame_total(get_temp_file_path(target_path)) == 10
+
+	clear_temp_directory(target_path)
 
 
 def test_concat_video() -> None:
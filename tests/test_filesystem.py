@@ -3,8 +3,8 @@ import os.path
 import pytest
 
 from facefusion.download import conditional_download
-from facefusion.filesystem import create_directory, filter_audio_paths, filter_image_paths, get_file_extension, get_file_format, get_file_size, has_audio, has_image, has_video, in_directory, is_audio, is_directory, is_file, is_image, is_video, remove_directory, resolve_file_paths, same_file_extension
-from .helper import get_test_example_file, get_test_examples_directory, get_test_outputs_directory
+from facefusion.filesystem import create_directory, filter_audio_paths, filter_image_paths, get_file_extension, get_file_format, get_file_size, has_audio, has_image, has_video, in_directory, is_audio, is_directory, is_file, is_image, is_video, link_file, remove_directory, resolve_file_paths, same_file_extension
+from .helper import get_test_example_file, get_test_examples_directory, get_test_output_file, get_test_outputs_directory
 
 
 @pytest.fixture(scope = 'module', autouse = True)
@@ -133,3 +133,23 @@ def test_in_directory() -> None:
 	assert in_directory(get_test_example_file('source.jpg')) is True
 	assert in_directory('source.jpg') is False
 	assert in_directory('invalid') is False
+
+
+def test_link_file() -> None:
+	create_directory(get_test_outputs_directory())
+
+	for file_name, file_content in [ ('link-first.txt', b'first'), ('link-second.txt', b'second') ]:
+		with open(get_test_output_file(file_name), 'wb') as file:
+			file.write(file_content)
+
+	assert link_file(get_test_output_file('link-first.txt'), get_test_output_file('link.txt')) is True
+	assert link_file(get_test_output_file('link-first.txt'), get_test_output_file('link.txt')) is True
+	assert link_file(get_test_output_file('link-second.txt'), get_test_output_file('link.txt')) is True
+
+	with open(get_test_output_file('link-first.txt'), 'rb') as file:
+		assert file.read() == b'first'
+
+	with open(get_test_output_file('link.txt'), 'rb') as file:
+		assert file.read() == b'second'
+
+	assert link_file('invalid', get_test_output_file('link.txt')) is False
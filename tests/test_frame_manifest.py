@@ -0,0 +1,85 @@
+import os
+import signal
+import tempfile
+
+import pytest
+
+from facefusion import state_manager
+from facefusion.exit_helper import graceful_exit
+from facefusion.frame_manifest import create_frame_manifest_signature, init_frame_manifest, read_frame_manifest, write_frame_manifest
+from facefusion.jobs import job_store
+from facefusion.temp_helper import clear_temp_directory, create_temp_directory, get_temp_directory_path
+from .helper import get_test_output_file, prepare_test_output_directory
+
+
+@pytest.fixture(scope = 'module', autouse = True)
+def before_all() -> None:
+	prepare_test_output_directory()
+	state_manager.init_item('temp_path', tempfile.gettempdir())
+	state_manager.init_item('keep_temp', False)
+	state_manager.init_item('trim_frame_start', 0)
+	state_manager.init_item('source_paths', [ get_test_output_file('source-manifest.jpg') ])
+	job_store.register_step_keys([ 'trim_frame_start' ])
+
+	with open(get_test_output_file('target-manifest.mp4'), 'wb') as target_file:
+		target_file.write(b'target')
+	with open(get_test_output_file('source-manifest.jpg'), 'wb') as source_file:
+		source_file.write(b'source-a')
+
+
+@pytest.fixture(scope = 'function', autouse = True)
+def before_each() -> None:
+	state_manager.init_item('trim_frame_start', 0)
+	clear_temp_directory(get_test_output_file('target-manifest.mp4'))
+	create_temp_directory(get_test_output_file('target-manifest.mp4'))
+
+
+def test_create_frame_manifest_signature() -> None:
+	frame_manifest_signature = create_frame_manifest_signature(get_test_output_file('target-manifest.mp4'))
+
+	assert frame_manifest_signature == create_frame_manifest_signature(get_test_output_file('target-manifest.mp4'))
+
+	state_manager.init_item('trim_frame_start', 10)
+
+	assert frame_manifest_signature != create_frame_manifest_signature(get_test_output_file('target-manifest.mp4'))
+
+	state_manager.init_item('trim_frame_start', 0)
+
+	with open(get_test_output_file('source-manifest.jpg'), 'wb') as source_file:
+		source_file.write(b'source-b')
+
+	assert frame_manifest_signature != create_frame_manifest_signature(get_test_output_file('target-manifest.mp4'))
+
+
+def test_read_frame_manifest() -> None:
+	assert read_frame_manifest(get_test_output_file('target-manifest.mp4')) is None
+	assert init_frame_manifest(get_test_output_file('target-manifest.mp4')) is True
+
+	frame_manifest = read_frame_manifest(get_test_output_file('target-manifest.mp4'))
+	frame_manifest['process_frame_total'] = 10
+
+	assert write_frame_manifest(get_test_output_file('target-manifest.mp4'), frame_manifest) is True
+	assert read_frame_manifest(get_test_output_file('target-manifest.mp4')).get('process_frame_total') == 10
+
+	state_manager.init_item('trim_frame_start', 10)
+
+	assert read_frame_manifest(get_test_output_file('target-manifest.mp4')) is None
+
+
+def test_graceful_exit_keeps_frame_manifest() -> None:
+	state_manager.init_item('target_path', get_test_output_file('target-manifest.mp4'))
+
+	with pytest.raises(SystemExit):
+		graceful_exit(0)
+
+	assert os.path.isdir(get_temp_directory_path(get_test_output_file('target-manifest.mp4'))) is False
+
+	create_temp_directory(get_test_output_file('target-manifest.mp4'))
+	init_frame_manifest(get_test_output_file('target-manifest.mp4'))
+
+	with pytest.raises(SystemExit):
+		graceful_exit(0)
+
+	assert read_frame_manifest(get_test_output_file('target-manifest.mp4'))
+
+	signal.signal(signal.SIGINT, signal.default_int_handler)
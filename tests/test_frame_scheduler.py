@@ -0,0 +1,79 @@
+import random
+import time
+from typing import Iterator, List
+
+from facefusion.frame_scheduler import calculate_frame_queue_size, create_frame_queue_depths, schedule_frames
+from facefusion.types import FramePacket
+
+FRAME_NUMBERS : List[int] = []
+
+
+def create_frame_packets(frame_total : int) -> Iterator[FramePacket]:
+	for frame_number in range(frame_total):
+		FRAME_NUMBERS.append(frame_number)
+		yield\
+		{
+			'frame_number': frame_number,
+			'frame_path': None,
+			'cache_frame_path': None,
+			'vision_frame': None
+		}
+
+
+def process_frame_packet(frame_packet : FramePacket) -> FramePacket:
+	time.sleep(random.uniform(0, 0.005))
+	return frame_packet
+
+
+def test_calculate_frame_queue_size() -> None:
+	assert calculate_frame_queue_size(0) == 2
+	assert calculate_frame_queue_size(1) == 2
+	assert calculate_frame_queue_size(8) == 16
+
+
+def test_schedule_frames() -> None:
+	frame_queue_depths = create_frame_queue_depths()
+	frame_numbers = [ frame_packet.get('frame_number') for frame_packet in schedule_frames(create_frame_packets(100), process_frame_packet, 4, frame_queue_depths) ]
+
+	assert frame_numbers == list(range(100))
+	assert frame_queue_depths ==\
+	{
+		'decode': 0,
+		'process': 0,
+		'encode': 0
+	}
+
+
+def test_schedule_frames_with_backpressure() -> None:
+	FRAME_NUMBERS.clear()
+	frame_queue_depths = create_frame_queue_depths()
+
+	for frame_packet in schedule_frames(create_frame_packets(1000), process_frame_packet, 2, frame_queue_depths):
+		assert frame_queue_depths.get('decode') <= calculate_frame_queue_size(2)
+		assert frame_queue_depths.get('process') + frame_queue_depths.get('encode') <= calculate_frame_queue_size(2)
+
+		if frame_packet.get('frame_number') == 10:
+			break
+
+	time.sleep(0.5)
+
+	assert len(FRAME_NUMBERS) < 100
+
+
+def test_schedule_frames_with_own_depths() -> None:
+	frame_queue_depths = create_frame_queue_depths()
+	frame_packets = schedule_frames(create_frame_packets(1000), process_frame_packet, 2, frame_queue_depths)
+
+	for _ in range(10):
+		next(frame_packets)
+	time.sleep(0.1)
+	next(frame_packets)
+	previous_frame_queue_depths = frame_queue_depths.copy()
+
+	for _ in schedule_frames(create_frame_packets(10), process_frame_packet, 2):
+		pass
+
+	assert previous_frame_queue_depths.get('decode') > 0
+	assert frame_queue_depths == previous_frame_queue_depths
+
+	frame_packets.close()
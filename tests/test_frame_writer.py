@@ -0,0 +1,36 @@
+import random
+import time
+from typing import Iterator, List
+
+from facefusion.frame_writer import write_frames
+from facefusion.types import FramePacket
+
+WRITTEN_FRAME_NUMBERS : List[int] = []
+
+
+def create_frame_packets(frame_total : int) -> Iterator[FramePacket]:
+	for frame_number in range(frame_total):
+		yield\
+		{
+			'frame_number': frame_number,
+			'frame_path': None,
+			'cache_frame_path': None,
+			'vision_frame': None
+		}
+
+
+def write_frame_packet(frame_packet : FramePacket) -> FramePacket:
+	time.sleep(random.uniform(0, 0.005))
+	WRITTEN_FRAME_NUMBERS.append(frame_packet.get('frame_number'))
+	return frame_packet
+
+
+def test_write_frames() -> None:
+	frame_numbers = []
+
+	for frame_packet in write_frames(create_frame_packets(100), write_frame_packet, 4):
+		assert frame_packet.get('frame_number') in WRITTEN_FRAME_NUMBERS
+		frame_numbers.append(frame_packet.get('frame_number'))
+
+	assert frame_numbers == list(range(100))
+	assert sorted(WRITTEN_FRAME_NUMBERS) == list(range(100))
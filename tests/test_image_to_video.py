@@ -0,0 +1,63 @@
+import subprocess
+import tempfile
+from time import time
+
+import pytest
+
+from facefusion import state_manager
+from facefusion.temp_helper import clear_temp_directory
+from facefusion.workflows import image_to_video
+from .helper import get_test_output_file, prepare_test_output_directory
+
+
+@pytest.fixture(scope = 'module', autouse = True)
+def before_all() -> None:
+	prepare_test_output_directory()
+	subprocess.run([ 'ffmpeg', '-f', 'lavfi', '-i', 'testsrc=size=64x48:rate=25:duration=1', '-pix_fmt', 'yuv420p', get_test_output_file('target-testsrc.mp4') ])
+	state_manager.init_item('temp_path', tempfile.gettempdir())
+	state_manager.init_item('target_path', get_test_output_file('target-testsrc.mp4'))
+	state_manager.init_item('output_path', get_test_output_file('output-testsrc.mp4'))
+	state_manager.init_item('source_paths', [])
+	state_manager.init_item('processors', [])
+	state_manager.init_item('temp_frame_format', 'png')
+	state_manager.init_item('keep_temp', False)
+	state_manager.init_item('skip_nsfw_check', True)
+	state_manager.init_item('output_video_scale', 1.0)
+	state_manager.init_item('output_video_fps', 25.0)
+	state_manager.init_item('output_video_quality', 80)
+	state_manager.init_item('output_video_preset', 'ultrafast')
+	state_manager.init_item('output_audio_encoder', 'aac')
+	state_manager.init_item('output_audio_quality', 80)
+	state_manager.init_item('output_audio_volume', 100)
+	state_manager.init_item('execution_thread_count', 4)
+	state_manager.init_item('execution_providers', [ 'cpu' ])
+	state_manager.init_item('reference_frame_number', 0)
+	state_manager.init_item('video_memory_strategy', 'strict')
+	state_manager.init_item('log_level', 'error')
+
+
+@pytest.fixture(autouse = True)
+def before_each() -> None:
+	clear_temp_directory(state_manager.get_item('target_path'))
+
+
+def test_process_with_invalid_encoder() -> None:
+	state_manager.init_item('temp_frame_mode', 'disk')
+	state_manager.init_item('output_video_encoder', 'libx264')
+
+	assert image_to_video.process(time()) == 0
+
+	state_manager.init_item('output_video_encoder', 'invalid')
+
+	assert image_to_video.process(time()) == 1
+
+
+def test_stream_with_invalid_encoder() -> None:
+	state_manager.init_item('temp_frame_mode', 'memory')
+	state_manager.init_item('output_video_encoder', 'libx264')
+
+	assert image_to_video.process(time()) == 0
+
+	state_manager.init_item('output_video_encoder', 'invalid')
+
+	assert image_to_video.process(time()) == 1
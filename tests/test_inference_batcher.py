@@ -0,0 +1,116 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple, Union
+from unittest.mock import patch
+
+import numpy
+import onnx
+import pytest
+from onnxruntime import InferenceSession
+
+import facefusion.inference_batcher
+from facefusion import state_manager
+from facefusion.inference_batcher import create_batch_signature, create_inference_batch, has_dynamic_batch, run_batched_inference
+from facefusion.inference_manager import clear_inference_pool, get_inference_pool
+from facefusion.processors.modules.frame_colorizer import core as frame_colorizer
+from facefusion.types import DownloadSet
+from .helper import get_test_output_file, prepare_test_output_directory
+
+
+@pytest.fixture(scope = 'module', autouse = True)
+def before_all() -> None:
+	state_manager.init_item('execution_batch_size', 4)
+	state_manager.init_item('execution_batch_wait', 50)
+	state_manager.init_item('execution_device_ids', [ 0 ])
+	state_manager.init_item('execution_providers', [ 'cpu' ])
+	state_manager.init_item('execution_optimization_level', 'disable')
+	state_manager.init_item('execution_replica_count', 1)
+	prepare_test_output_directory()
+
+	model_dimensions : List[Tuple[str, Union[int, str]]] =\
+	[
+		('batch-dynamic.onnx', 'batch'),
+		('batch-static.onnx', 1)
+	]
+
+	for model_name, batch_dimension in model_dimensions:
+		model_graph = onnx.helper.make_graph([ onnx.helper.make_node('Neg', [ 'input' ], [ 'output' ]) ], 'model',
+		[
+			onnx.helper.make_tensor_value_info('input', onnx.TensorProto.FLOAT, [ batch_dimension, 4 ])
+		],
+		[
+			onnx.helper.make_tensor_value_info('output', onnx.TensorProto.FLOAT, [ batch_dimension, 4 ])
+		])
+		onnx.save(onnx.helper.make_model(model_graph, ir_version = 10, opset_imports = [ onnx.helper.make_opsetid('', 17) ]), get_test_output_file(model_name))
+
+
+def test_has_dynamic_batch() -> None:
+	assert has_dynamic_batch(InferenceSession(get_test_output_file('batch-dynamic.onnx'), providers = [ 'CPUExecutionProvider' ])) is True
+	assert has_dynamic_batch(InferenceSession(get_test_output_file('batch-static.onnx'), providers = [ 'CPUExecutionProvider' ])) is False
+	assert create_inference_batch(InferenceSession(get_test_output_file('batch-static.onnx'), providers = [ 'CPUExecutionProvider' ])) is None
+
+
+def test_create_batch_signature() -> None:
+	assert create_batch_signature(None, { 'input': numpy.zeros((1, 4), dtype = numpy.float32) }) == create_batch_signature(None, { 'input': numpy.ones((2, 4), dtype = numpy.float32) })
+	assert create_batch_signature(None, { 'input': numpy.zeros((1, 4), dtype = numpy.float32) }) != create_batch_signature(None, { 'input': numpy.zeros((1, 8), dtype = numpy.float32) })
+
+
+def test_run_batched_inference() -> None:
+	inference_session = InferenceSession(get_test_output_file('batch-dynamic.onnx'), providers = [ 'CPUExecutionProvider' ])
+	inference_batch = create_inference_batch(inference_session)
+	batch_sizes = []
+
+	def session_run(output_names, input_feed, run_options): #type:ignore[no-untyped-def]
+		batch_sizes.append(len(input_feed.get('input')))
+		return inference_session.run(output_names, input_feed, run_options)
+
+	input_tensors = [ numpy.full((1, 4), index, dtype = numpy.float32) for index in range(4) ]
+
+	with ThreadPoolExecutor(max_workers = 4) as executor:
+		output_feeds = list(executor.map(lambda input_tensor: run_batched_inference(inference_batch, session_run, None, { 'input': input_tensor }), input_tensors))
+
+	assert batch_sizes == [ 4 ]
+
+	for input_tensor, output_feed in zip(input_tensors, output_feeds):
+		assert numpy.array_equal(output_feed[0], -input_tensor)
+
+
+def test_run_batched_inference_alone() -> None:
+	inference_session = InferenceSession(get_test_output_file('batch-dynamic.onnx'), providers = [ 'CPUExecutionProvider' ])
+	inference_batch = create_inference_batch(inference_session)
+	input_tensor = numpy.ones((2, 4), dtype = numpy.float32)
+
+	assert numpy.array_equal(run_batched_inference(inference_batch, inference_session.run, None, { 'input': input_tensor })[0], -input_tensor)
+
+
+def test_run_batched_inference_through_processor() -> None:
+	model_source_set : DownloadSet =\
+	{
+		'frame_colorizer':
+		{
+			'url': 'https://example.com/batch-dynamic.onnx',
+			'path': get_test_output_file('batch-dynamic.onnx')
+		}
+	}
+	batch_sizes = []
+	forward_batch_requests = facefusion.inference_batcher.forward_batch_requests
+
+	def track_batch_requests(batch_requests, session_run, output_names): #type:ignore[no-untyped-def]
+		batch_sizes.append(len(batch_requests))
+		return forward_batch_requests(batch_requests, session_run, output_names)
+
+	with patch('facefusion.inference_manager.detect_app_context', return_value = 'cli'):
+		inference_pool = get_inference_pool('tests.test_inference_batcher', [ 'frame_colorizer' ], model_source_set)
+
+	input_tensors = [ numpy.full((1, 4), index, dtype = numpy.float32) for index in range(4) ]
+
+	with patch('facefusion.processors.modules.frame_colorizer.core.get_inference_pool', return_value = inference_pool), patch('facefusion.inference_batcher.forward_batch_requests', side_effect = track_batch_requests):
+		with ThreadPoolExecutor(max_workers = 4) as executor:
+			output_tensors = list(executor.map(frame_colorizer.forward, input_tensors))
+
+	with patch('facefusion.inference_manager.detect_app_context', return_value = 'cli'):
+		clear_inference_pool('tests.test_inference_batcher', [ 'frame_colorizer' ])
+
+	assert max(batch_sizes) > 1
+
+	for input_tensor, output_tensor in zip(input_tensors, output_tensors):
+		assert numpy.array_equal(output_tensor, -input_tensor[0])
@@ -0,0 +1,68 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple, Union
+
+import numpy
+import onnx
+import pytest
+from onnxruntime import InferenceSession
+
+from facefusion.inference_binder import create_inference_binding, has_static_shape, run_bound_inference
+from .helper import get_test_output_file, prepare_test_output_directory
+
+
+@pytest.fixture(scope = 'module', autouse = True)
+def before_all() -> None:
+	prepare_test_output_directory()
+
+	model_dimensions : List[Tuple[str, Union[int, str]]] =\
+	[
+		('binding-dynamic.onnx', 'batch'),
+		('binding-static.onnx', 1)
+	]
+
+	for model_name, batch_dimension in model_dimensions:
+		model_graph = onnx.helper.make_graph([ onnx.helper.make_node('Neg', [ 'input' ], [ 'output' ]) ], 'model',
+		[
+			onnx.helper.make_tensor_value_info('input', onnx.TensorProto.FLOAT, [ batch_dimension, 4 ])
+		],
+		[
+			onnx.helper.make_tensor_value_info('output', onnx.TensorProto.FLOAT, [ batch_dimension, 4 ])
+		])
+		onnx.save(onnx.helper.make_model(model_graph, ir_version = 10, opset_imports = [ onnx.helper.make_opsetid('', 17) ]), get_test_output_file(model_name))
+
+
+def test_has_static_shape() -> None:
+	assert has_static_shape(InferenceSession(get_test_output_file('binding-static.onnx'), providers = [ 'CPUExecutionProvider' ])) is True
+	assert has_static_shape(InferenceSession(get_test_output_file('binding-dynamic.onnx'), providers = [ 'CPUExecutionProvider' ])) is False
+	assert create_inference_binding(InferenceSession(get_test_output_file('binding-dynamic.onnx'), providers = [ 'CPUExecutionProvider' ])) is None
+
+
+def test_run_bound_inference() -> None:
+	inference_session = InferenceSession(get_test_output_file('binding-static.onnx'), providers = [ 'CPUExecutionProvider' ])
+	inference_binding = create_inference_binding(inference_session)
+	input_tensors = [ numpy.full((1, 4), index, dtype = numpy.float32) for index in range(8) ]
+	output_feeds = [ run_bound_inference(inference_binding, inference_session.run, None, { 'input': input_tensor }) for input_tensor in input_tensors ]
+
+	for input_tensor, output_feed in zip(input_tensors, output_feeds):
+		assert numpy.array_equal(output_feed[0], -input_tensor)
+
+	with ThreadPoolExecutor(max_workers = 4) as executor:
+		output_feeds = list(executor.map(lambda input_tensor: run_bound_inference(inference_binding, inference_session.run, [ 'output' ], { 'input': input_tensor }), input_tensors))
+
+	for input_tensor, output_feed in zip(input_tensors, output_feeds):
+		assert numpy.array_equal(output_feed[0], -input_tensor)
+
+
+def test_run_bound_inference_fallback() -> None:
+	inference_session = InferenceSession(get_test_output_file('binding-static.onnx'), providers = [ 'CPUExecutionProvider' ])
+	inference_binding = create_inference_binding(inference_session)
+	session_runs = []
+
+	def session_run(output_names, input_feed, run_options): #type:ignore[no-untyped-def]
+		session_runs.append(input_feed)
+		return [ input_feed.get('input') ]
+
+	run_bound_inference(inference_binding, session_run, None, { 'input': numpy.zeros((1, 4), dtype = numpy.float32) })
+	run_bound_inference(inference_binding, session_run, None, { 'input': numpy.zeros((2, 4), dtype = numpy.float32) })
+
+	assert len(session_runs) == 1
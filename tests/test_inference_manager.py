@@ -1,10 +1,16 @@
 from unittest.mock import patch
 
+import numpy
+import onnx
+import onnxruntime
 import pytest
 from onnxruntime import InferenceSession
 
 from facefusion import content_analyser, state_manager
-from facefusion.inference_manager import INFERENCE_POOL_SET, get_inference_pool
+from facefusion.filesystem import is_file, remove_file
+from facefusion.inference_manager import INFERENCE_CONTEXT_LOCKS, INFERENCE_POOL_SET, INFERENCE_REPLICA_SET, clear_inference_pool, create_inference_session, get_inference_pool, get_optimized_model_path
+from facefusion.types import DownloadSet
+from .helper import get_test_output_file, prepare_test_output_directory
 
 
 @pytest.fixture(scope = 'module', autouse = True)
@@ -12,7 +18,22 @@ def before_all() -> None:
 	state_manager.init_item('execution_device_ids', [ 0 ])
 	state_manager.init_item('execution_providers', [ 'cpu' ])
 	state_manager.init_item('download_providers', [ 'github' ])
+	state_manager.init_item('execution_optimization_level', 'all')
+	state_manager.init_item('execution_intra_op_thread_count', 1)
+	state_manager.init_item('execution_replica_count', 1)
 	content_analyser.pre_check()
+	prepare_test_output_directory()
+	model_graph = onnx.helper.make_graph([ onnx.helper.make_node('MatMul', [ 'input', 'weight' ], [ 'output' ]) ], 'model',
+	[
+		onnx.helper.make_tensor_value_info('input', onnx.TensorProto.FLOAT, [ 1, 4 ])
+	],
+	[
+		onnx.helper.make_tensor_value_info('output', onnx.TensorProto.FLOAT, [ 1, 4 ])
+	],
+	[
+		onnx.numpy_helper.from_array(numpy.eye(4, dtype = numpy.float32), 'weight')
+	])
+	onnx.save(onnx.helper.make_model(model_graph, ir_version = 10, opset_imports = [ onnx.helper.make_opsetid('', 17) ]), get_test_output_file('inference.onnx'))
 
 
 def test_get_inference_pool() -> None:
@@ -30,3 +51,61 @@ def test_get_inference_pool() -> None:
 		assert isinstance(INFERENCE_POOL_SET.get('cli').get('facefusion.content_analyser.nsfw_1.nsfw_2.nsfw_3.0.cpu').get('nsfw_1'), InferenceSession)
 
 	assert INFERENCE_POOL_SET.get('cli').get('facefusion.content_analyser.nsfw_1.nsfw_2.nsfw_3.0.cpu').get('nsfw_1') == INFERENCE_POOL_SET.get('ui').get('facefusion.content_analyser.nsfw_1.nsfw_2.nsfw_3.0.cpu').get('nsfw_1')
+
+
+def test_get_inference_pool_replicas() -> None:
+	model_source_set : DownloadSet =\
+	{
+		'inference':
+		{
+			'url': 'https://example.com/inference.onnx',
+			'path': get_test_output_file('inference.onnx')
+		}
+	}
+	state_manager.init_item('execution_replica_count', 2)
+
+	with patch('facefusion.inference_manager.detect_app_context', return_value = 'cli'):
+		inference_pool = get_inference_pool('facefusion.content_analyser', [ 'inference' ], model_source_set)
+		inference_pool.get('inference').run(None,
+		{
+			'input': numpy.ones((1, 4), dtype = numpy.float32)
+		})
+
+		assert get_inference_pool('facefusion.content_analyser', [ 'inference' ], model_source_set).get('inference') != inference_pool.get('inference')
+
+	assert INFERENCE_REPLICA_SET.get('facefusion.content_analyser.inference.0.cpu').get('run_total') == 1
+	assert INFERENCE_REPLICA_SET.get('facefusion.content_analyser.inference.0.cpu.replica1').get('run_total') == 0
+
+	with patch('facefusion.inference_manager.detect_app_context', return_value = 'cli'):
+		clear_inference_pool('facefusion.content_analyser', [ 'inference' ])
+
+	assert 'facefusion.content_analyser.inference.0.cpu' not in INFERENCE_REPLICA_SET
+	assert 'facefusion.content_analyser.inference.0.cpu.replica1' not in INFERENCE_REPLICA_SET
+	assert 'facefusion.content_analyser.inference.0.cpu' not in INFERENCE_CONTEXT_LOCKS
+	assert inference_pool.get('inference').run(None, { 'input': numpy.ones((1, 4), dtype = numpy.float32) })[0].shape == (1, 4)
+
+	state_manager.init_item('execution_replica_count', 1)
+
+
+def test_create_inference_session() -> None:
+	optimized_model_path = get_optimized_model_path(get_test_output_file('inference.onnx'), [ 'cpu' ])
+	remove_file(optimized_model_path)
+
+	assert isinstance(create_inference_session(get_test_output_file('inference.onnx'), 0, [ 'cpu' ]), InferenceSession)
+	assert is_file(optimized_model_path)
+	assert isinstance(create_inference_session(get_test_output_file('inference.onnx'), 0, [ 'cpu' ]), InferenceSession)
+
+
+def test_get_optimized_model_path() -> None:
+	assert get_optimized_model_path(get_test_output_file('inference.onnx'), [ 'cpu' ]).endswith('.cpu.' + onnxruntime.__version__ + '.extended.onnx')
+	assert get_optimized_model_path(get_test_output_file('inference.onnx'), [ 'tensorrt', 'cpu' ]) is None
+
+	state_manager.init_item('execution_optimization_level', 'basic')
+
+	assert get_optimized_model_path(get_test_output_file('inference.onnx'), [ 'cpu' ]).endswith('.cpu.' + onnxruntime.__version__ + '.basic.onnx')
+
+	state_manager.init_item('execution_optimization_level', 'disable')
+
+	assert get_optimized_model_path(get_test_output_file('inference.onnx'), [ 'cpu' ]) is None
+
+	state_manager.init_item('execution_optimization_level', 'all')
@@ -0,0 +1,58 @@
+import os
+
+import numpy
+import onnx
+import pytest
+
+from facefusion.hash_helper import create_file_hash
+from facefusion.model_helper import get_model_initializer_path, get_static_model_initializer
+from .helper import get_test_output_file, prepare_test_output_directory
+
+
+@pytest.fixture(scope = 'module', autouse = True)
+def before_all() -> None:
+	prepare_test_output_directory()
+	model_initializer = numpy.arange(16, dtype = numpy.float32).reshape(4, 4)
+	model_graph = onnx.helper.make_graph([ onnx.helper.make_node('Identity', [ 'input' ], [ 'output' ]) ], 'model',
+	[
+		onnx.helper.make_tensor_value_info('input', onnx.TensorProto.FLOAT, [ 4, 4 ])
+	],
+	[
+		onnx.helper.make_tensor_value_info('output', onnx.TensorProto.FLOAT, [ 4, 4 ])
+	],
+	[
+		onnx.numpy_helper.from_array(model_initializer, 'initializer')
+	])
+	onnx.save(onnx.helper.make_model(model_graph), get_test_output_file('model.onnx'))
+
+
+def test_get_model_initializer_path() -> None:
+	assert get_model_initializer_path(get_test_output_file('model.onnx')) == get_test_output_file('model.' + create_file_hash(get_test_output_file('model.onnx')) + '.npy')
+	assert get_model_initializer_path(get_test_output_file('invalid.onnx')) is None
+
+
+def test_get_static_model_initializer() -> None:
+	model_initializer_path = get_model_initializer_path(get_test_output_file('model.onnx'))
+	model_initializer = get_static_model_initializer(get_test_output_file('model.onnx'))
+
+	assert numpy.array_equal(model_initializer, numpy.arange(16, dtype = numpy.float32).reshape(4, 4))
+	assert os.path.isfile(model_initializer_path)
+
+	get_static_model_initializer.cache_clear()
+
+	assert isinstance(get_static_model_initializer(get_test_output_file('model.onnx')), numpy.memmap)
+	assert numpy.array_equal(get_static_model_initializer(get_test_output_file('model.onnx')), model_initializer)
+
+
+def test_get_static_model_initializer_with_broken_sidecar() -> None:
+	model_initializer_path = get_model_initializer_path(get_test_output_file('model.onnx'))
+
+	with open(model_initializer_path, 'wb') as model_initializer_file:
+		model_initializer_file.write(b'\x93NUMPY')
+	get_static_model_initializer.cache_clear()
+
+	assert numpy.array_equal(get_static_model_initializer(get_test_output_file('model.onnx')), numpy.arange(16, dtype = numpy.float32).reshape(4, 4))
+
+	get_static_model_initializer.cache_clear()
+
+	assert isinstance(get_static_model_initializer(get_test_output_file('model.onnx')), numpy.memmap)
@@ -0,0 +1,63 @@
+import numpy
+import onnx
+import pytest
+from onnxruntime import InferenceSession
+
+from facefusion import state_manager
+from facefusion.model_preloader import PRELOAD_THREADS, collect_preload_modules, conditional_start_preload_models, create_input_tensor, start_preload_models, stop_preload_models, warm_up_inference_session
+from .helper import get_test_output_file, prepare_test_output_directory
+
+
+@pytest.fixture(scope = 'module', autouse = True)
+def before_all() -> None:
+	state_manager.init_item('processors', [])
+	prepare_test_output_directory()
+	model_graph = onnx.helper.make_graph([ onnx.helper.make_node('Relu', [ 'input' ], [ 'output' ]) ], 'model',
+	[
+		onnx.helper.make_tensor_value_info('input', onnx.TensorProto.FLOAT, [ 'batch', 3, 8, 8 ])
+	],
+	[
+		onnx.helper.make_tensor_value_info('output', onnx.TensorProto.FLOAT, [ 'batch', 3, 8, 8 ])
+	])
+	onnx.save(onnx.helper.make_model(model_graph, ir_version = 10, opset_imports = [ onnx.helper.make_opsetid('', 17) ]), get_test_output_file('preload.onnx'))
+
+
+def test_collect_preload_modules() -> None:
+	assert collect_preload_modules() == []
+
+
+def test_conditional_start_preload_models() -> None:
+	state_manager.init_item('execution_pool_type', 'thread')
+	state_manager.init_item('video_segment_count', 2)
+	conditional_start_preload_models()
+
+	assert PRELOAD_THREADS == []
+
+	state_manager.init_item('video_segment_count', 1)
+	conditional_start_preload_models()
+
+	assert len(PRELOAD_THREADS) == 1
+
+	stop_preload_models()
+
+
+def test_stop_preload_models() -> None:
+	preload_thread = start_preload_models()
+	stop_preload_models()
+
+	assert preload_thread.is_alive() is False
+	assert PRELOAD_THREADS == []
+
+
+def test_create_input_tensor() -> None:
+	inference_session = InferenceSession(get_test_output_file('preload.onnx'), providers = [ 'CPUExecutionProvider' ])
+	input_tensor = create_input_tensor(inference_session.get_inputs()[0])
+
+	assert input_tensor.shape == (1, 3, 8, 8)
+	assert input_tensor.dtype == numpy.float32
+
+
+def test_warm_up_inference_session() -> None:
+	inference_session = InferenceSession(get_test_output_file('preload.onnx'), providers = [ 'CPUExecutionProvider' ])
+
+	assert warm_up_inference_session(inference_session) is True
@@ -0,0 +1,121 @@
+from typing import List
+
+import numpy
+import onnx
+import pytest
+
+from facefusion import face_classifier, face_detector, face_landmarker, face_recognizer, state_manager
+from facefusion.download import conditional_download
+from facefusion.filesystem import is_file
+from facefusion.inference_manager import get_batch_model_path, get_quantize_model_path, resolve_model_path
+from facefusion.json import read_json
+from facefusion.model_preparer import QUANTIZE_ACCURACY_LIMIT, create_validation_crops, prepare_model, quantize_model, rewrite_batch_dimension
+from .helper import get_test_example_file, get_test_examples_directory, get_test_output_file, prepare_test_output_directory
+
+
+def create_model(model_nodes : List[onnx.NodeProto], model_initializers : List[onnx.TensorProto], model_shape : List[int]) -> onnx.ModelProto:
+	model_graph = onnx.helper.make_graph(model_nodes, 'model',
+	[
+		onnx.helper.make_tensor_value_info('input', onnx.TensorProto.FLOAT, model_shape)
+	],
+	[
+		onnx.helper.make_tensor_value_info('output', onnx.TensorProto.FLOAT, model_shape)
+	], model_initializers)
+	return onnx.helper.make_model(model_graph, ir_version = 10, opset_imports = [ onnx.helper.make_opsetid('', 17) ])
+
+
+@pytest.fixture(scope = 'module', autouse = True)
+def before_all() -> None:
+	conditional_download(get_test_examples_directory(),
+	[
+		'https://github.com/facefusion/facefusion-assets/releases/download/examples-3.0.0/source.jpg'
+	])
+	state_manager.init_item('execution_device_ids', [ 0 ])
+	state_manager.init_item('execution_providers', [ 'cpu' ])
+	state_manager.init_item('download_providers', [ 'github' ])
+	state_manager.init_item('face_detector_angles', [ 0 ])
+	state_manager.init_item('face_detector_model', 'many')
+	state_manager.init_item('face_detector_score', 0.5)
+	state_manager.init_item('face_landmarker_model', 'many')
+	state_manager.init_item('face_landmarker_score', 0.5)
+	face_classifier.pre_check()
+	face_detector.pre_check()
+	face_landmarker.pre_check()
+	face_recognizer.pre_check()
+	prepare_test_output_directory()
+	onnx.save(create_model([ onnx.helper.make_node('MatMul', [ 'input', 'weight' ], [ 'output' ]) ],
+	[
+		onnx.numpy_helper.from_array(numpy.random.rand(4, 4).astype(numpy.float32), 'weight')
+	], [ 1, 4 ]), get_test_output_file('prepare-dynamic.onnx'))
+	onnx.save(create_model([ onnx.helper.make_node('Reshape', [ 'input', 'shape' ], [ 'output' ]) ],
+	[
+		onnx.numpy_helper.from_array(numpy.array([ 1, 4 ], dtype = numpy.int64), 'shape')
+	], [ 1, 4 ]), get_test_output_file('prepare-static.onnx'))
+	onnx.save(create_model([ onnx.helper.make_node('Conv', [ 'input', 'weight' ], [ 'output' ], pads = [ 1, 1, 1, 1 ]) ],
+	[
+		onnx.numpy_helper.from_array(numpy.random.rand(3, 3, 3, 3).astype(numpy.float32), 'weight')
+	], [ 1, 3, 64, 64 ]), get_test_output_file('quantize-conv.onnx'))
+	onnx.save(create_model([ onnx.helper.make_node('MatMul', [ 'input', 'weight' ], [ 'output' ]) ],
+	[
+		onnx.numpy_helper.from_array(numpy.array([ [ 100, 1, 1, 1 ], [ -100, 1, 1, 1 ], [ 0, 1, 1, 1 ], [ 0, 1, 1, 1 ] ]).astype(numpy.float32), 'weight')
+	], [ 1, 4 ]), get_test_output_file('quantize-lossy.onnx'))
+
+
+def test_rewrite_batch_dimension() -> None:
+	model = onnx.load(get_test_output_file('prepare-dynamic.onnx'))
+
+	assert rewrite_batch_dimension(model.graph) is True
+	assert model.graph.input[0].type.tensor_type.shape.dim[0].dim_param == 'batch'
+	assert model.graph.output[0].type.tensor_type.shape.dim[0].dim_param == 'batch'
+
+
+def test_prepare_model() -> None:
+	assert prepare_model(get_test_output_file('prepare-dynamic.onnx')) is True
+	assert read_json(get_test_output_file('prepare-dynamic.batch.json')).get('dynamic_batch') is True
+	assert resolve_model_path(get_test_output_file('prepare-dynamic.onnx'), [ 'cpu' ]) == get_batch_model_path(get_test_output_file('prepare-dynamic.onnx'))
+
+	with open(get_test_output_file('prepare-static.batch.hash'), 'w') as hash_file:
+		hash_file.write('stale')
+
+	assert prepare_model(get_test_output_file('prepare-static.onnx')) is False
+	assert read_json(get_test_output_file('prepare-static.batch.json')).get('dynamic_batch') is False
+	assert is_file(get_batch_model_path(get_test_output_file('prepare-static.onnx'))) is False
+	assert is_file(get_test_output_file('prepare-static.batch.hash')) is False
+	assert resolve_model_path(get_test_output_file('prepare-static.onnx'), [ 'cpu' ]) == get_test_output_file('prepare-static.onnx')
+
+
+def test_create_validation_crops() -> None:
+	validation_crops = create_validation_crops([ get_test_example_file('source.jpg') ])
+
+	assert len(validation_crops) == 1
+	assert validation_crops[0].get('crop_vision_frame').shape == (512, 512, 3)
+	assert validation_crops[0].get('face_embedding').shape == (512,)
+
+	assert create_validation_crops([ get_test_output_file('prepare-static.onnx') ]) == []
+
+
+def test_quantize_model() -> None:
+	validation_crops = create_validation_crops([ get_test_example_file('source.jpg') ])
+	accuracy_delta = quantize_model(get_test_output_file('quantize-conv.onnx'), validation_crops)
+
+	assert 0 <= accuracy_delta <= QUANTIZE_ACCURACY_LIMIT
+	assert read_json(get_test_output_file('quantize-conv.int8.json')).get('quantized') is True
+
+	state_manager.init_item('execution_int8', False)
+
+	assert resolve_model_path(get_test_output_file('quantize-conv.onnx'), [ 'cpu' ]) == get_test_output_file('quantize-conv.onnx')
+
+	state_manager.init_item('execution_int8', True)
+
+	assert resolve_model_path(get_test_output_file('quantize-conv.onnx'), [ 'cpu' ]) == get_quantize_model_path(get_test_output_file('quantize-conv.onnx'))
+	assert resolve_model_path(get_test_output_file('quantize-conv.onnx'), [ 'cuda', 'cpu' ]) == get_test_output_file('quantize-conv.onnx')
+
+	accuracy_delta = quantize_model(get_test_output_file('quantize-lossy.onnx'), validation_crops)
+
+	assert accuracy_delta > QUANTIZE_ACCURACY_LIMIT
+	assert read_json(get_test_output_file('quantize-lossy.int8.json')).get('quantized') is False
+	assert is_file(get_quantize_model_path(get_test_output_file('quantize-lossy.onnx'))) is False
+	assert resolve_model_path(get_test_output_file('quantize-lossy.onnx'), [ 'cpu' ]) == get_test_output_file('quantize-lossy.onnx')
+
+	assert quantize_model(get_test_output_file('quantize-conv.onnx'), []) is None
+	assert read_json(get_test_output_file('quantize-conv.int8.json')).get('quantized') is False
@@ -0,0 +1,69 @@
+from typing import List
+
+import numpy
+import pytest
+
+from facefusion import state_manager
+from facefusion.audio import create_empty_audio_frame
+from facefusion.face_selector import resolve_face_attributes
+from facefusion.run_context import create_face_context, create_run_context, get_source_audio_frame, get_source_voice_frame, select_audio_frame
+from facefusion.types import AudioFrame
+
+
+@pytest.fixture(scope = 'module', autouse = True)
+def before_all() -> None:
+	state_manager.init_item('processors', [])
+	state_manager.init_item('source_paths', [])
+	state_manager.init_item('face_selector_mode', 'many')
+
+
+def test_create_run_context() -> None:
+	run_context = create_run_context(None, 25.0)
+
+	assert run_context.source_vision_frames == []
+	assert run_context.source_face is None
+	assert run_context.source_audio_frames is None
+	assert run_context.reference_faces == []
+	assert run_context.face_attributes == []
+	assert run_context.face_tracker_store.get('track_total') == 0
+	assert run_context.face_tracker_store is not create_run_context(None, 25.0).face_tracker_store
+	assert run_context.temp_video_fps == 25.0
+	assert numpy.array_equal(get_source_audio_frame(run_context, 0), create_empty_audio_frame())
+	assert numpy.array_equal(get_source_voice_frame(run_context, 0), create_empty_audio_frame())
+
+
+def test_create_face_context() -> None:
+	run_context = create_run_context(None, 25.0)
+	face_context = create_face_context(run_context, numpy.zeros((240, 320, 3), dtype = numpy.uint8))
+
+	assert face_context.source_face is None
+	assert face_context.target_faces == []
+
+
+def test_resolve_face_attributes() -> None:
+	assert resolve_face_attributes([ 'target_faces' ]) == []
+	assert resolve_face_attributes([ 'target_faces', 'target_embedding' ]) == [ 'embedding' ]
+
+	state_manager.init_item('face_selector_gender', 'female')
+
+	assert resolve_face_attributes([ 'target_faces' ]) == [ 'classification' ]
+
+	state_manager.init_item('face_selector_mode', 'reference')
+
+	assert resolve_face_attributes([ 'target_faces' ]) == [ 'embedding' ]
+
+	state_manager.init_item('face_selector_mode', 'many')
+	state_manager.init_item('face_selector_gender', None)
+
+
+def test_select_audio_frame() -> None:
+	audio_frames : List[AudioFrame] =\
+	[
+		numpy.ones((80, 16)),
+		numpy.zeros((80, 16))
+	]
+
+	assert numpy.array_equal(select_audio_frame(audio_frames, 0), audio_frames[0])
+	assert numpy.array_equal(select_audio_frame(audio_frames, 1), create_empty_audio_frame())
+	assert numpy.array_equal(select_audio_frame(audio_frames, 2), create_empty_audio_frame())
+	assert numpy.array_equal(select_audio_frame(None, 0), create_empty_audio_frame())
@@ -0,0 +1,19 @@
+from facefusion import state_manager
+from facefusion.thread_helper import NULL_CONTEXT, THREAD_SEMAPHORE, conditional_inference_semaphore
+
+
+def test_conditional_inference_semaphore() -> None:
+	state_manager.init_item('execution_providers', [ 'cpu' ])
+	state_manager.init_item('execution_batch_size', 1)
+	state_manager.init_item('execution_replica_count', 1)
+
+	assert conditional_inference_semaphore() is THREAD_SEMAPHORE
+
+	state_manager.init_item('execution_replica_count', 2)
+
+	assert conditional_inference_semaphore() is NULL_CONTEXT
+
+	state_manager.init_item('execution_batch_size', 4)
+	state_manager.init_item('execution_replica_count', 1)
+
+	assert conditional_inference_semaphore() is NULL_CONTEXT
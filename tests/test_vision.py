@@ -1,9 +1,10 @@
 import subprocess
 
+import numpy
 import pytest
 
 from facefusion.download import conditional_download
-from facefusion.vision import calculate_histogram_difference, count_trim_frame_total, count_video_frame_total, detect_image_resolution, detect_video_duration, detect_video_fps, detect_video_resolution, match_frame_color, normalize_resolution, pack_resolution, predict_video_frame_total, read_image, read_video_frame, restrict_image_resolution, restrict_trim_frame, restrict_video_fps, restrict_video_resolution, scale_resolution, unpack_resolution, write_image
+from facefusion.vision import calculate_histogram_difference, count_trim_frame_total, count_video_frame_total, detect_image_resolution, detect_video_duration, detect_video_fps, detect_video_resolution, match_frame_color, normalize_resolution, pack_resolution, predict_video_frame_total, read_image, read_temp_frame, read_video_frame, restrict_image_resolution, restrict_trim_frame, restrict_video_fps, restrict_video_resolution, scale_resolution, split_trim_frame, unpack_resolution, write_image, write_temp_frame
 from .helper import get_test_example_file, get_test_examples_directory, get_test_output_file, prepare_test_output_directory
 
 
@@ -46,6 +47,16 @@ def test_write_image() -> None:
 	assert write_image(get_test_output_file('目标-240p.webp'), vision_frame) is True
 
 
+def test_write_temp_frame() -> None:
+	vision_frame = read_image(get_test_example_file('target-240p.jpg'))
+
+	assert write_temp_frame(get_test_output_file('target-240p.npy'), vision_frame) is True
+	assert write_temp_frame(get_test_output_file('target-240p.png'), vision_frame) is True
+	assert numpy.array_equal(read_temp_frame(get_test_output_file('target-240p.npy')), vision_frame)
+	assert numpy.array_equal(read_temp_frame(get_test_output_file('target-240p.png')), vision_frame)
+	assert read_temp_frame('invalid.npy') is None
+
+
 def test_detect_image_resolution() -> None:
 	assert detect_image_resolution(get_test_example_file('target-240p.jpg')) == (426, 226)
 	assert detect_image_resolution(get_test_example_file('target-240p-90deg.jpg')) == (226, 426)
@@ -117,6 +128,13 @@ def test_restrict_trim_frame() -> None:
 	assert restrict_trim_frame(get_test_example_file('target-240p.mp4'), None, None) == (0, 270)
 
 
+def test_split_trim_frame() -> None:
+	assert split_trim_frame(0, 270, 1) == [ (0, 270) ]
+	assert split_trim_frame(0, 270, 4) == [ (0, 67), (67, 135), (135, 202), (202, 270) ]
+	assert split_trim_frame(70, 73, 4) == [ (70, 71), (71, 72), (72, 73) ]
+	assert split_trim_frame(0, 0, 2) == []
+
+
 def test_detect_video_resolution() -> None:
 	assert detect_video_resolution(get_test_example_file('target-240p.mp4')) == (426, 226)
 	assert detect_video_resolution(get_test_example_file('target-240p-90deg.mp4')) == (226, 426)
@@ -0,0 +1,69 @@
+import numpy
+import pytest
+
+from facefusion import state_manager
+from facefusion.run_context import create_run_context
+from facefusion.types import FramePacket, RunContext
+from facefusion.worker_pool import create_shared_memory, create_worker_pool, describe_shared_frame, dispatch_frame_packet, read_shared_frame
+
+
+@pytest.fixture(scope = 'module', autouse = True)
+def before_all() -> None:
+	state_manager.init_item('processors', [])
+	state_manager.init_item('source_paths', [])
+	state_manager.init_item('log_level', 'info')
+
+
+def process_frame_packet(run_context : RunContext, frame_packet : FramePacket) -> FramePacket:
+	vision_frame = frame_packet.get('vision_frame')
+
+	if vision_frame is None:
+		vision_frame = numpy.zeros((16, 16, 3), dtype = numpy.uint8)
+	else:
+		vision_frame = numpy.repeat(255 - vision_frame, 2, axis = 0)
+	return\
+	{
+		'frame_number': frame_packet.get('frame_number'),
+		'frame_path': str(run_context.temp_video_fps),
+		'cache_frame_path': str(frame_packet.get('frame_number')),
+		'vision_frame': vision_frame
+	}
+
+
+def test_read_shared_frame() -> None:
+	vision_frame = numpy.random.randint(0, 255, (24, 32, 3), dtype = numpy.uint8)
+	shared_memory = create_shared_memory(vision_frame)
+	shared_frame = describe_shared_frame(shared_memory, vision_frame)
+	shared_memory.close()
+
+	assert numpy.array_equal(read_shared_frame(shared_frame, True), vision_frame)
+
+
+def test_dispatch_frame_packet() -> None:
+	vision_frame = numpy.random.randint(0, 255, (24, 32, 4), dtype = numpy.uint8)
+	worker_pool = create_worker_pool(create_run_context(None, 25.0), 2)
+
+	try:
+		output_frame_packet = dispatch_frame_packet(worker_pool, process_frame_packet,
+		{
+			'frame_number': 1,
+			'frame_path': None,
+			'cache_frame_path': None,
+			'vision_frame': vision_frame
+		})
+		path_frame_packet = dispatch_frame_packet(worker_pool, process_frame_packet,
+		{
+			'frame_number': 2,
+			'frame_path': None,
+			'cache_frame_path': None,
+			'vision_frame': None
+		})
+	finally:
+		worker_pool.shutdown()
+
+	assert output_frame_packet.get('frame_number') == 1
+	assert numpy.array_equal(output_frame_packet.get('vision_frame'), numpy.repeat(255 - vision_frame, 2, axis = 0))
+	assert path_frame_packet.get('frame_number') == 2
+	assert path_frame_packet.get('frame_path') == '25.0'
+	assert path_frame_packet.get('cache_frame_path') == '2'
+	assert path_frame_packet.get('vision_frame').shape == (16, 16, 3)